@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class AuthenticationConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'authentication'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from . import signals  # noqa: F401  사용자 캐시 무효화 시그널 등록
+        from .metrics import install_query_recorder
+
+        # 요청 계측용 쿼리 기록기를 모든 DB 연결에 등록
+        connection_created.connect(install_query_recorder, dispatch_uid='authentication.metrics')
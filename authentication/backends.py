@@ -1,9 +1,48 @@
+from django.conf import settings
+from django.core.cache import cache
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework.exceptions import AuthenticationFailed
+from .metrics import timed
+
+# JWTUserMiddleware 와 DRF 인증이 같은 요청에서 검증 결과를 공유하기 위해 HttpRequest 에 저장하는 속성
+REQUEST_AUTH_ATTR = '_cookie_jwt_auth'
+
+
+def get_user_cache_key(user_id):
+    return f'auth:jwt-user:{user_id}'
+
 
 class CookieJWTAuthentication(JWTAuthentication):
+    """
+    쿠키의 access_token 을 검증하는 인증 클래스.
+    - 한 요청에서 토큰 검증(HMAC)과 사용자 조회는 한 번만 수행되고, 결과(또는 인증 실패)는 요청 객체에 저장되어
+      미들웨어와 DRF 가 함께 사용합니다.
+    - JWT_USER_CACHE_TIMEOUT(초)이 설정되면 사용자 행을 캐시하며, BusinessMember 가 저장/삭제되면 무효화됩니다
+      (authentication/signals.py). 무효화가 모든 워커에 전달되도록 기본 캐시가 로컬 메모리인데 워커가 여러 개이면
+      설정에서 0 으로 고정됩니다.
+    """
+
     def authenticate(self, request):
+        # DRF Request 는 내부 HttpRequest 에 결과를 저장하여 미들웨어에서 검증한 결과를 재사용
+        http_request = getattr(request, '_request', request)
+        cached = getattr(http_request, REQUEST_AUTH_ATTR, None)
+        if cached is None:
+            # 요청 계측에서 미들웨어(jwt)와 DRF(auth) 의 인증 시간을 구분
+            with timed('auth' if http_request is not request else 'jwt'):
+                try:
+                    cached = (self.authenticate_cookie(request), None)
+                except AuthenticationFailed as e:
+                    cached = (None, e)
+            setattr(http_request, REQUEST_AUTH_ATTR, cached)
+
+        result, error = cached
+        if error is not None:
+            raise error
+        return result
+
+    def authenticate_cookie(self, request):
         access_token = request.COOKIES.get("access_token")
 
         if not access_token:
@@ -28,4 +67,18 @@ class CookieJWTAuthentication(JWTAuthentication):
         if user is None or not user.is_active:
             raise AuthenticationFailed("User is inactive.")
 
-        return (user, validated_token)
\ No newline at end of file
+        return (user, validated_token)
+
+    def get_user(self, validated_token):
+        timeout = getattr(settings, 'JWT_USER_CACHE_TIMEOUT', 0)
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if not timeout or user_id is None:
+            return super().get_user(validated_token)
+
+        # 캐시에는 조회 시점에 활성 상태 등의 검사를 통과한 사용자만 저장됨
+        key = get_user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(validated_token)
+            cache.set(key, user, timeout)
+        return user
@@ -0,0 +1,42 @@
+import sys
+from django.core.management.base import BaseCommand, CommandError
+from authentication.models import Business
+from authentication.provisioning import MemberProvisioner, ProvisionError, detect_format, read_rows
+
+
+class Command(BaseCommand):
+    help = (
+        "JSON/CSV 파일의 구성원(username, password, role)을 비즈니스에 일괄 등록합니다. "
+        "비밀번호는 여러 프로세스에서 해시하며, 잘못된 행과 이미 사용 중인 username 은 건너뛰고 보고합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('business_id', type=int, help='대상 비즈니스 id')
+        parser.add_argument('path', help='입력 파일 (- 이면 표준 입력)')
+        parser.add_argument('--format', choices=['json', 'csv'], help='입력 형식 (기본: 확장자로 판단)')
+        parser.add_argument('--workers', type=int, help='비밀번호 해시 프로세스 수 (기본: MEMBER_PROVISION_WORKERS)')
+        parser.add_argument('--batch-size', type=int, default=1000, help='bulk_create 한 번에 INSERT 할 행 수')
+
+    def handle(self, *args, **options):
+        try:
+            business = Business.objects.get(pk=options['business_id'])
+        except Business.DoesNotExist:
+            raise CommandError(f'비즈니스 {options["business_id"]} 가 없습니다.')
+
+        path = options['path']
+        try:
+            format = options['format'] or detect_format(path)
+            if path == '-':
+                rows = read_rows(sys.stdin, format)
+            else:
+                with open(path, newline='', encoding='utf-8-sig') as stream:
+                    rows = read_rows(stream, format)
+        except ProvisionError as e:
+            raise CommandError(str(e))
+
+        report = MemberProvisioner(business, workers=options['workers'], batch_size=options['batch_size']).run(rows)
+        for error in report.errors:
+            self.stderr.write(f'{error["line"]}행: {error["errors"]}')
+        self.stdout.write(self.style.SUCCESS(
+            f'구성원 {report.created}명 등록, {report.skipped}행 건너뜀 ({report.seconds:.1f}초)'
+        ))
@@ -0,0 +1,38 @@
+import time
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from authentication.tokens import purge_expired_tokens
+
+
+class Command(BaseCommand):
+    help = (
+        "만료된 발급/블랙리스트 토큰을 배치 단위로 삭제합니다. "
+        "entrypoint.sh 가 TOKEN_PURGE_INTERVAL 초마다 실행하며, 중단되면 다음 실행에서 이어서 처리합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='한 트랜잭션에서 삭제할 발급 토큰 수')
+        parser.add_argument('--max-batches', type=int, default=0, help='실행당 최대 배치 수 (0 이면 제한 없음)')
+        parser.add_argument('--sleep', type=float, default=0.0, help='배치 사이 대기 시간(초). 운영 중 부하를 줄일 때 사용')
+        parser.add_argument('--dry-run', action='store_true', help='삭제하지 않고 대상 토큰 수만 출력')
+
+    def handle(self, *args, **options):
+        # 실행 중 새로 만료되는 토큰은 다음 실행에서 처리
+        now = timezone.now()
+        if options['dry_run']:
+            expired = OutstandingToken.objects.filter(expires_at__lte=now).count()
+            self.stdout.write(f'만료된 발급 토큰 {expired}개')
+            return
+
+        purged = batches = 0
+        max_batches = options['max_batches']
+        while not max_batches or batches < max_batches:
+            deleted = purge_expired_tokens(options['batch_size'], now=now)
+            if not deleted:
+                break
+            batches += 1
+            purged += deleted
+            if options['sleep']:
+                time.sleep(options['sleep'])
+        self.stdout.write(self.style.SUCCESS(f'만료된 발급 토큰 {purged}개 삭제'))
@@ -0,0 +1,294 @@
+# authentication/metrics.py
+
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from rest_framework.renderers import JSONRenderer
+
+# ============================
+# 요청 계측 (RequestMetricsMiddleware 에서 사용)
+# - 요청마다 RequestTimings 를 ContextVar 에 두고, 단계별 시간과 쿼리 수/시간을 기록합니다.
+#   ContextVar 는 sync_to_async 로 실행되는 스레드에도 전달되므로 ASGI 에서도 같은 객체에 기록됩니다.
+# - 집계 결과는 프로세스별 MetricsRegistry 에 쌓이며, METRICS_DIR 이 설정되면 워커마다 파일로 내보내
+#   /metrics 조회 시 모든 gunicorn 워커의 값을 합산합니다.
+# ============================
+
+# 요청 처리 시간 히스토그램 구간(초)
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_current_timings = ContextVar('request_timings', default=None)
+
+# DB 연결 풀 지표: (이름, 종류, 설명, psycopg_pool get_stats() 키, 단위 변환)
+POOL_METRICS = (
+    ('board_db_pool_max_connections', 'gauge', 'Maximum pool size (max_size).', 'pool_max', 1),
+    ('board_db_pool_connections', 'gauge', 'Connections currently open in the pool.', 'pool_size', 1),
+    ('board_db_pool_available_connections', 'gauge', 'Idle connections ready to be handed out.', 'pool_available', 1),
+    ('board_db_pool_waiting_requests', 'gauge', 'Requests currently waiting for a connection.', 'requests_waiting', 1),
+    ('board_db_pool_requests_total', 'counter', 'Connections requested from the pool.', 'requests_num', 1),
+    ('board_db_pool_queued_requests_total', 'counter', 'Requests that had to wait for a connection.', 'requests_queued', 1),
+    ('board_db_pool_wait_seconds_total', 'counter', 'Time spent waiting for a connection.', 'requests_wait_ms', 0.001),
+    ('board_db_pool_timeouts_total', 'counter', 'Requests that timed out or failed waiting for a connection.',
+     'requests_errors', 1),
+    ('board_db_pool_connects_total', 'counter', 'Connections opened by the pool.', 'connections_num', 1),
+    ('board_db_pool_lost_connections_total', 'counter', 'Connections found broken by the health check.',
+     'connections_lost', 1),
+)
+
+
+class RequestTimings:
+    """
+    한 요청의 단계별 시간(초). 각 단계 시간에는 그 안에서 실행된 쿼리 시간이 포함되지 않으며,
+    쿼리 시간은 db 단계로 따로 집계됩니다 (쿼리셋은 직렬화 중에 평가되므로 조회 비용은 db 로 나타남).
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.phases = defaultdict(float)
+        self.queries = 0
+
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+    def server_timing(self, total):
+        """Server-Timing 헤더 값. app 은 전체에서 측정된 단계를 뺀 나머지(직렬화, 권한 확인, 페이지네이션 등)"""
+        phases = dict(self.phases)
+        phases['app'] = max(total - sum(phases.values()), 0.0)
+        entries = [f'{name};dur={seconds * 1000:.2f}' for name, seconds in phases.items() if name != 'db']
+        entries.append(f'db;dur={phases.get("db", 0.0) * 1000:.2f};desc="{self.queries} queries"')
+        entries.append(f'total;dur={total * 1000:.2f}')
+        return ', '.join(entries)
+
+
+def start_request():
+    """현재 컨텍스트에 새 RequestTimings 를 설정하고 (timings, 복원용 토큰) 을 반환"""
+    timings = RequestTimings()
+    return timings, _current_timings.set(timings)
+
+
+def end_request(token):
+    _current_timings.reset(token)
+
+
+@contextmanager
+def timed(phase):
+    """현재 요청의 phase 단계 시간을 기록 (계측 중이 아니면 아무 것도 하지 않음)"""
+    timings = _current_timings.get()
+    if timings is None:
+        yield
+        return
+    db_before = timings.phases['db']
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start - (timings.phases['db'] - db_before)
+        timings.phases[phase] += max(elapsed, 0.0)
+
+
+def record_query(execute, sql, params, many, context):
+    """모든 DB 연결에 등록되는 execute_wrapper. 계측 중인 요청의 쿼리 수와 시간을 기록"""
+    timings = _current_timings.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.queries += 1
+        timings.phases['db'] += time.perf_counter() - start
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    """connection_created 시그널 수신기"""
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+class TimedJSONRenderer(JSONRenderer):
+    """렌더링 시간을 render 단계로 기록하는 JSONRenderer"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with timed('render'):
+            return super().render(data, accepted_media_type, renderer_context)
+
+
+def view_name(request):
+    """
+    집계에 사용할 뷰 이름. ViewSet 은 'PostViewSet.list', 'CommentViewSet.my_comments' 처럼 액션까지 포함하며,
+    URL 이 매칭되지 않은 요청은 'unresolved' 로 묶습니다.
+    """
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return 'unresolved'
+    func = match.func
+    cls = getattr(func, 'cls', None) or getattr(func, 'view_class', None)
+    if cls is None:
+        return func.__name__
+    actions = getattr(func, 'actions', None)
+    if actions:
+        return f'{cls.__name__}.{actions.get(request.method.lower(), request.method.lower())}'
+    return f'{cls.__name__}.{request.method.lower()}'
+
+
+def pool_stats():
+    """이 프로세스에서 열린 DB 연결 풀의 통계 {별칭: {get_stats() 키: 값}} (풀을 사용하지 않으면 빈 dict)"""
+    from django.db import connections
+
+    keys = {key for *_, key, _ in POOL_METRICS}
+    stats = {}
+    for alias in connections:
+        pool = getattr(connections[alias], 'pool', None)
+        if pool is not None and not pool.closed:
+            values = pool.get_stats()  # 0 인 누적 값은 포함되지 않음
+            stats[alias] = {key: values.get(key, 0) for key in keys}
+    return stats
+
+
+class MetricsRegistry:
+    """프로세스별 요청 지표 집계. snapshot() 은 JSON 으로 저장하고 다른 워커의 값과 합칠 수 있는 형태입니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._last_flush = 0.0
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = defaultdict(int)      # (view, method, status) -> 요청 수
+            self.durations = {}                   # view -> [구간별 개수..., 합계, 개수]
+            self.phases = defaultdict(float)      # (view, phase) -> 누적 시간(초)
+            self.queries = defaultdict(int)       # view -> 누적 쿼리 수
+
+    def observe(self, view, method, status, timings, total):
+        with self._lock:
+            self.requests[(view, method, str(status))] += 1
+            histogram = self.durations.setdefault(view, [0] * len(DURATION_BUCKETS) + [0.0, 0])
+            for index, bound in enumerate(DURATION_BUCKETS):
+                if total <= bound:
+                    histogram[index] += 1
+            histogram[-2] += total
+            histogram[-1] += 1
+            for phase, seconds in timings.phases.items():
+                self.phases[(view, phase)] += seconds
+            self.queries[view] += timings.queries
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'requests': [[*key, count] for key, count in self.requests.items()],
+                'durations': {view: list(values) for view, values in self.durations.items()},
+                'phases': [[*key, seconds] for key, seconds in self.phases.items()],
+                'queries': dict(self.queries),
+                'pools': pool_stats(),
+            }
+
+    def flush(self, directory, interval=0.0):
+        """
+        directory/metrics-<pid>.json 으로 내보냄. interval 초 안에 다시 호출되거나,
+        같은 워커의 다른 스레드(gthread, ASGI)가 내보내는 중이면 건너뜀
+        """
+        if not self._flush_lock.acquire(blocking=False):
+            return
+        try:
+            now = time.monotonic()
+            if now - self._last_flush < interval:
+                return
+            self._last_flush = now
+            path = Path(directory) / f'metrics-{os.getpid()}.json'
+            temporary = path.with_suffix('.tmp')
+            temporary.write_text(json.dumps(self.snapshot()))
+            os.replace(temporary, path)  # 읽는 쪽이 쓰다 만 파일을 보지 않도록 교체
+        finally:
+            self._flush_lock.release()
+
+
+registry = MetricsRegistry()
+
+
+def collect(directory=None):
+    """현재 프로세스와 (directory 가 있으면) 다른 워커들이 내보낸 스냅샷을 합산"""
+    snapshots = [registry.snapshot()]
+    if directory:
+        own = f'metrics-{os.getpid()}.json'
+        for path in sorted(Path(directory).glob('metrics-*.json')):
+            if path.name == own:
+                continue
+            try:
+                snapshots.append(json.loads(path.read_text()))
+            except (OSError, ValueError):
+                continue
+
+    merged = {
+        'requests': defaultdict(int), 'durations': {}, 'phases': defaultdict(float), 'queries': defaultdict(int),
+        'pools': defaultdict(lambda: defaultdict(int)),
+    }
+    for snapshot in snapshots:
+        for *key, count in snapshot['requests']:
+            merged['requests'][tuple(key)] += count
+        for view, values in snapshot['durations'].items():
+            current = merged['durations'].setdefault(view, [0] * len(values))
+            merged['durations'][view] = [a + b for a, b in zip(current, values)]
+        for *key, seconds in snapshot['phases']:
+            merged['phases'][tuple(key)] += seconds
+        for view, count in snapshot['queries'].items():
+            merged['queries'][view] += count
+        # 워커마다 풀이 따로 있으므로 워커 전체의 합 (이전 버전이 내보낸 파일에는 없음)
+        for alias, values in snapshot.get('pools', {}).items():
+            for key, value in values.items():
+                merged['pools'][alias][key] += value
+    return merged
+
+
+def _labels(**labels):
+    def escape(value):
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return '{' + ','.join(f'{name}="{escape(value)}"' for name, value in labels.items()) + '}'
+
+
+def render_prometheus(metrics):
+    """collect() 결과를 Prometheus 텍스트 형식으로 변환"""
+    lines = [
+        '# HELP board_http_requests_total Total HTTP requests by view, method and status.',
+        '# TYPE board_http_requests_total counter',
+    ]
+    for (view, method, status), count in sorted(metrics['requests'].items()):
+        lines.append(f'board_http_requests_total{_labels(view=view, method=method, status=status)} {count}')
+
+    lines += [
+        '# HELP board_http_request_duration_seconds Request duration until the response is returned.',
+        '# TYPE board_http_request_duration_seconds histogram',
+    ]
+    for view, values in sorted(metrics['durations'].items()):
+        for bound, count in zip(DURATION_BUCKETS, values):
+            lines.append(f'board_http_request_duration_seconds_bucket{_labels(view=view, le=bound)} {count}')
+        lines.append(f'board_http_request_duration_seconds_bucket{_labels(view=view, le="+Inf")} {values[-1]}')
+        lines.append(f'board_http_request_duration_seconds_sum{_labels(view=view)} {values[-2]}')
+        lines.append(f'board_http_request_duration_seconds_count{_labels(view=view)} {values[-1]}')
+
+    lines += [
+        '# HELP board_http_request_phase_seconds_total Time spent per request phase (jwt, auth, db, render).',
+        '# TYPE board_http_request_phase_seconds_total counter',
+    ]
+    for (view, phase), seconds in sorted(metrics['phases'].items()):
+        lines.append(f'board_http_request_phase_seconds_total{_labels(view=view, phase=phase)} {seconds}')
+
+    lines += [
+        '# HELP board_db_queries_total SQL queries executed while handling requests.',
+        '# TYPE board_db_queries_total counter',
+    ]
+    for view, count in sorted(metrics['queries'].items()):
+        lines.append(f'board_db_queries_total{_labels(view=view)} {count}')
+
+    pools = metrics.get('pools', {})
+    if pools:
+        for name, kind, description, key, scale in POOL_METRICS:
+            lines += [f'# HELP {name} {description}', f'# TYPE {name} {kind}']
+            for alias, values in sorted(pools.items()):
+                lines.append(f'{name}{_labels(database=alias)} {values.get(key, 0) * scale}')
+    return '\n'.join(lines) + '\n'
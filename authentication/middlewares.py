@@ -1,24 +1,88 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from . import metrics
 from .backends import CookieJWTAuthentication
+from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
 
+class RequestMetricsMiddleware:
+    """
+    요청별 쿼리 수, DB 시간, 단계별 시간(jwt, auth, db, render, app)을 기록하는 미들웨어.
+    - 결과는 Server-Timing 헤더(SERVER_TIMING)로 응답에 포함되고, 뷰/액션별로 집계되어 /metrics 에서 조회됩니다.
+    - JWTUserMiddleware 의 인증 시간까지 포함하도록 그보다 앞에 둡니다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timings, token = metrics.start_request()
+        try:
+            response = self.get_response(request)
+        finally:
+            metrics.end_request(token)
+        return self.finish(request, response, timings)
+
+    async def __acall__(self, request):
+        timings, token = metrics.start_request()
+        try:
+            response = await self.get_response(request)
+        finally:
+            metrics.end_request(token)
+        return self.finish(request, response, timings)
+
+    def finish(self, request, response, timings):
+        # 스트리밍 응답(SSE)은 응답 객체가 반환될 때까지만 측정
+        total = timings.elapsed()
+        metrics.registry.observe(metrics.view_name(request), request.method, response.status_code, timings, total)
+        if settings.METRICS_DIR:
+            metrics.registry.flush(settings.METRICS_DIR, interval=settings.METRICS_FLUSH_INTERVAL)
+        if settings.SERVER_TIMING:
+            response['Server-Timing'] = timings.server_timing(total)
+        return response
+
 class JWTUserMiddleware:
+    """
+    쿠키의 access_token 으로 request.user 를 설정하는 미들웨어.
+    검증 결과는 요청 객체에 저장되므로 이후 DRF 의 CookieJWTAuthentication 은 토큰을 다시 검증하지 않습니다.
+    ASGI 에서는 비동기로 동작하여 비동기 뷰 앞에서 동기 전환을 추가하지 않습니다 (사용자 조회만 스레드에서 실행).
+    """
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
         self.jwt_authenticator = CookieJWTAuthentication()
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        self.set_user(request)
+        response = self.get_response(request)
+        return response
+
+    async def __acall__(self, request):
+        await sync_to_async(self.set_user)(request)
+        return await self.get_response(request)
+
+    def set_user(self, request):
         try:
-            user, validated_token = self.jwt_authenticator.authenticate(request)
-            if user:
-                request.user = user
-                request._cached_user = user  # Django가 사용하는 _cached_user 설정
-                request.token = validated_token
-            else:
-                request.user = AnonymousUser()
-                request._cached_user = AnonymousUser()
-        except Exception as e:
+            result = self.jwt_authenticator.authenticate(request)
+        except Exception:
+            result = None
+
+        if result:
+            user, validated_token = result
+            request.user = user
+            request._cached_user = user  # Django가 사용하는 _cached_user 설정
+            request.token = validated_token
+        else:
             request.user = AnonymousUser()
             request._cached_user = AnonymousUser()
-
-        response = self.get_response(request)
-        return response
@@ -0,0 +1,186 @@
+# authentication/provisioning.py
+
+import csv
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError, transaction
+from .models import BusinessMember
+from .serializers import ProvisionMemberSerializer
+
+# ============================
+# 구성원 일괄 등록 (provision_members 명령, 관리자 일괄 등록 API)
+# - 회원가입(RegisterSerializer)은 한 명마다 username 중복 조회, INSERT, 비밀번호 해시 후 다시 UPDATE 를 수행하지만,
+#   일괄 등록은 전체 username 의 중복을 한 번에 조회하고 해시한 비밀번호로 bulk_create 합니다.
+# - 비밀번호 해시(PBKDF2)는 CPU 를 대부분 사용하므로 프로세스 풀에서 나누어 계산합니다 (MEMBER_PROVISION_WORKERS).
+# - 잘못된 행, 중복 username 은 건너뛰고 줄 번호와 함께 보고하며, 나머지 행은 등록합니다.
+# - bulk_create 는 post_save 시그널을 보내지 않지만, 새 구성원은 캐시된 사용자 정보가 없으므로 무효화할 필요가 없습니다.
+# ============================
+
+# 해시할 비밀번호가 이보다 적으면 프로세스를 띄우는 비용이 더 크므로 현재 프로세스에서 계산
+PARALLEL_THRESHOLD = 8
+# 보고서에 담을 최대 오류 수 (건너뛴 행 수는 모두 집계)
+MAX_REPORTED_ERRORS = 100
+
+
+class ProvisionError(Exception):
+    """일괄 등록을 시작할 수 없는 오류 (입력 형식 등)"""
+
+
+def detect_format(name):
+    """파일 이름의 확장자로 입력 형식을 판단"""
+    lowered = (name or '').lower()
+    if lowered.endswith('.json'):
+        return 'json'
+    if lowered.endswith('.csv'):
+        return 'csv'
+    raise ProvisionError(f'입력 형식을 알 수 없습니다: {name} (json 또는 csv 를 지정하세요)')
+
+
+def read_rows(stream, format):
+    """
+    텍스트 스트림에서 (줄 번호, 행) 목록을 반환. JSON 은 객체 배열이며 줄 번호 대신 1부터 시작하는 순번을 사용합니다.
+    읽을 수 없는 행은 dict 대신 오류 메시지(str)입니다.
+    """
+    if format == 'json':
+        try:
+            rows = json.load(stream)
+        except ValueError as e:
+            raise ProvisionError(f'JSON 을 읽을 수 없습니다: {e}')
+        return enumerate_rows(rows)
+    if format == 'csv':
+        reader = csv.DictReader(stream)
+        return [
+            (reader.line_num, {key: value for key, value in row.items() if key and value not in (None, '')})
+            for row in reader
+        ]
+    raise ProvisionError(f'지원하지 않는 입력 형식입니다: {format}')
+
+
+def enumerate_rows(rows):
+    """JSON 배열(API 요청 본문 등)을 (순번, 행) 목록으로 변환"""
+    if not isinstance(rows, list):
+        raise ProvisionError('구성원 객체의 배열이어야 합니다.')
+    return [(number, row if isinstance(row, dict) else 'JSON 객체가 아닙니다.') for number, row in enumerate(rows, 1)]
+
+
+def hash_passwords(passwords, workers=None):
+    """
+    비밀번호 목록을 같은 순서의 해시 목록으로 변환. workers 개 프로세스에서 나누어 계산합니다.
+    요청을 처리하는 워커는 DB 연결 풀 등의 스레드를 가지고 있으므로 fork 대신 forkserver(없으면 spawn)로 시작하고,
+    새 프로세스에서 make_password 가 설정을 읽을 수 있도록 django.setup 으로 초기화합니다.
+    """
+    workers = workers or settings.MEMBER_PROVISION_WORKERS or os.cpu_count() or 1
+    workers = min(workers, len(passwords))
+    if workers <= 1 or len(passwords) < PARALLEL_THRESHOLD:
+        return [make_password(password) for password in passwords]
+
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context(method), initializer=django.setup) as executor:
+        return list(executor.map(make_password, passwords, chunksize=max(len(passwords) // (workers * 4), 1)))
+
+
+class ProvisionReport:
+    """일괄 등록 결과"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.created = 0
+        self.skipped = 0
+        self.errors = []
+
+    @property
+    def seconds(self):
+        return time.perf_counter() - self.start
+
+    def add_error(self, line, detail):
+        self.skipped += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'line': line, 'errors': detail})
+
+    def as_dict(self):
+        return {
+            'created': self.created,
+            'skipped': self.skipped,
+            'errors': self.errors,
+            'seconds': round(self.seconds, 3),
+        }
+
+
+class MemberProvisioner:
+    """
+    business 의 구성원으로 행(username, password, role)을 등록.
+    - workers: 비밀번호 해시 프로세스 수 (기본: MEMBER_PROVISION_WORKERS, 0 이면 CPU 수)
+    - batch_size: bulk_create 한 번에 INSERT 할 행 수
+    """
+
+    def __init__(self, business, workers=None, batch_size=1000):
+        self.business = business
+        self.workers = workers
+        self.batch_size = batch_size
+        self.report = ProvisionReport()
+
+    def run(self, rows):
+        """(줄 번호, 행) 목록을 검증/등록하고 ProvisionReport 를 반환"""
+        valid = self.validate(rows)
+        passwords = hash_passwords([data['password'] for line, data in valid], self.workers)
+        members = [
+            (line, BusinessMember(username=data['username'], password=password, role=data['role'], business=self.business))
+            for (line, data), password in zip(valid, passwords)
+        ]
+        self.write(members)
+        return self.report
+
+    def validate(self, rows):
+        """검증된 (줄 번호, 데이터) 목록. 잘못된 행과 입력 안에서 또는 이미 등록된 username 은 보고서에 기록"""
+        valid, seen = [], set()
+        for line, row in rows:
+            if isinstance(row, str):
+                self.report.add_error(line, {'non_field_errors': [row]})
+                continue
+            serializer = ProvisionMemberSerializer(data=row)
+            if not serializer.is_valid():
+                self.report.add_error(line, serializer.errors)
+                continue
+            username = serializer.validated_data['username']
+            if username in seen:
+                self.report.add_error(line, {'username': [f'입력에서 중복된 username 입니다: {username}']})
+                continue
+            seen.add(username)
+            valid.append((line, serializer.validated_data))
+
+        # 이미 등록된 username 은 한 번의 조회로 확인
+        taken = self.existing(seen)
+        for line, data in valid:
+            if data['username'] in taken:
+                self.report.add_error(line, {'username': [f'이미 사용 중인 username 입니다: {data["username"]}']})
+        return [(line, data) for line, data in valid if data['username'] not in taken]
+
+    @staticmethod
+    def existing(usernames):
+        if not usernames:
+            return set()
+        return set(BusinessMember.objects.filter(username__in=usernames).values_list('username', flat=True))
+
+    def write(self, members):
+        """구성원을 bulk_create. 중복 확인 뒤 다른 요청이 같은 username 을 등록했다면 해당 행만 건너뛰고 다시 시도"""
+        if not members:
+            return
+        try:
+            with transaction.atomic():
+                BusinessMember.objects.bulk_create([member for line, member in members], batch_size=self.batch_size)
+        except IntegrityError:
+            taken = self.existing({member.username for line, member in members})
+            if not taken:
+                raise
+            for line, member in members:
+                if member.username in taken:
+                    self.report.add_error(line, {'username': [f'이미 사용 중인 username 입니다: {member.username}']})
+            self.write([(line, member) for line, member in members if member.username not in taken])
+            return
+        self.report.created += len(members)
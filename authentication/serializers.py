@@ -2,6 +2,7 @@
 
 from rest_framework import serializers
 from django.contrib.auth.password_validation import validate_password
+from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework.validators import UniqueValidator
 from .models import Business, BusinessMember
 
@@ -51,4 +52,24 @@ class RegisterSerializer(serializers.ModelSerializer):
         )
         user.set_password(validated_data['password'])
         user.save()
-        return user
\ No newline at end of file
+        return user
+
+class ProvisionMemberSerializer(serializers.Serializer):
+    """
+    구성원 일괄 등록(provision_members) 행. username 중복은 일괄 등록에서 한 번에 확인하므로 UniqueValidator 를 두지 않습니다.
+    """
+    username = serializers.CharField(max_length=150, validators=[BusinessMember.username_validator])
+    password = serializers.CharField(trim_whitespace=False)
+    role = serializers.ChoiceField(choices=BusinessMember.ROLE_CHOICES, default=BusinessMember.BUSINESS_MEMBER)
+
+    def validate(self, attrs):
+        try:
+            validate_password(attrs['password'], BusinessMember(username=attrs['username']))
+        except DjangoValidationError as e:
+            raise serializers.ValidationError({'password': list(e.messages)})
+        return attrs
+
+class ProvisionUploadSerializer(serializers.Serializer):
+    """관리자 일괄 등록 API 의 파일 요청. format 을 생략하면 파일 확장자(.json/.csv)로 판단"""
+    file = serializers.FileField()
+    format = serializers.ChoiceField(choices=['json', 'csv'], required=False)
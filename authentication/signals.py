@@ -0,0 +1,16 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .backends import get_user_cache_key
+from .models import BusinessMember
+
+
+@receiver(post_save, sender=BusinessMember)
+@receiver(post_delete, sender=BusinessMember)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """
+    역할, 소속 비즈니스, 활성 여부 등이 바뀔 수 있으므로 사용자가 저장/삭제되면 JWT 인증용 사용자 캐시를 비웁니다.
+    (QuerySet.update() 는 시그널을 보내지 않으므로 해당 경로에서는 JWT_USER_CACHE_TIMEOUT 이 지나야 반영됩니다.)
+    """
+    cache.delete(get_user_cache_key(instance.pk))
@@ -0,0 +1,183 @@
+# authentication/tokens.py
+
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken, UntypedToken
+
+# ============================
+# refresh 토큰 블랙리스트 조회 캐시 (토큰 갱신, 로그아웃에서 사용)
+# - 토큰(jti)의 블랙리스트 여부를 공유 캐시(CACHES['tokens'])에 저장하여, 같은 토큰을 다시 확인할 때
+#   token_blacklist 테이블을 조회하지 않습니다 (여러 탭의 동시 갱신, 회전된 토큰의 재사용 등).
+#   기본 캐시는 워커(프로세스)별 로컬 메모리일 수 있어, 로그아웃한 토큰을 다른 워커가 계속 받아들일 수 있으므로 사용하지 않습니다.
+# - 블랙리스트에 추가되면 커밋 후 공유 캐시에 기록하며, '블랙리스트 아님' 결과는 add 로만 기록하므로
+#   다른 워커가 먼저 기록한 '블랙리스트됨' 을 덮어쓰지 않습니다.
+# - 워커 메모리에는 바뀌지 않는 '블랙리스트됨' 결과만 JWT_BLACKLIST_LOCAL_TIMEOUT 초 동안 유지합니다.
+#   '블랙리스트 아님' 은 다른 워커의 로그아웃으로 바뀔 수 있으므로 공유 캐시에만 둡니다.
+# - 만료된 토큰은 purge_expired_tokens(관리 명령 purge_tokens)로 배치 삭제하여 테이블이 계속 커지지 않게 합니다.
+# - 여러 탭이 같은 refresh 토큰으로 동시에 갱신하면 rotate_refresh_token 이 한 번만 회전하고 나머지에는 같은 토큰 쌍을 돌려줍니다.
+#   잠금과 결과는 워커 간에 공유되어야 하므로 기본 캐시(프로세스별 로컬 메모리일 수 있음)가 아닌 CACHES['tokens'] 에 저장합니다.
+# ============================
+
+BLACKLISTED, NOT_BLACKLISTED = 1, 0
+
+
+def get_blacklist_cache_key(jti):
+    return f'auth:jwt-blacklist:{jti}'
+
+
+class LocalBlacklistCache:
+    """워커(프로세스) 메모리의 블랙리스트 조회 결과. 가장 최근 결과 size 개를 각자의 만료 시각까지 유지"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # jti -> (결과, 만료 시각(monotonic))
+
+    def get(self, jti):
+        with self._lock:
+            entry = self._entries.get(jti)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self._entries[jti]
+                return None
+            return entry[0]
+
+    def set(self, jti, value, timeout, size):
+        if timeout <= 0 or size <= 0:
+            return
+        with self._lock:
+            self._entries[jti] = (value, time.monotonic() + timeout)
+            self._entries.move_to_end(jti)
+            while len(self._entries) > size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+local_cache = LocalBlacklistCache()
+
+
+def _remaining(exp):
+    """토큰 만료까지 남은 시간(초). 캐시 시간이 토큰 수명을 넘지 않도록 사용"""
+    return max(int(exp - time.time()), 0)
+
+
+def _remember_locally(jti, exp):
+    timeout = min(settings.JWT_BLACKLIST_LOCAL_TIMEOUT, _remaining(exp))
+    local_cache.set(jti, BLACKLISTED, timeout, settings.JWT_BLACKLIST_LOCAL_SIZE)
+
+
+def is_blacklisted(jti, exp):
+    """워커 메모리, 공유 캐시, DB 순서로 jti 의 블랙리스트 여부를 확인"""
+    if local_cache.get(jti) == BLACKLISTED:
+        return True
+    shared = caches['tokens']
+    key = get_blacklist_cache_key(jti)
+    value = shared.get(key)
+    if value is None:
+        value = BLACKLISTED if BlacklistedToken.objects.filter(token__jti=jti).exists() else NOT_BLACKLISTED
+        if value == BLACKLISTED:
+            shared.set(key, value, _remaining(exp))
+        else:
+            shared.add(key, value, min(settings.JWT_BLACKLIST_CACHE_TIMEOUT, _remaining(exp)))
+    if value == BLACKLISTED:
+        _remember_locally(jti, exp)
+    return value == BLACKLISTED
+
+
+def remember_blacklisted(jti, exp):
+    """블랙리스트 추가가 커밋된 뒤 호출하여, 이전에 캐시된 '블랙리스트 아님' 결과를 덮어씀"""
+    caches['tokens'].set(get_blacklist_cache_key(jti), BLACKLISTED, _remaining(exp))
+    _remember_locally(jti, exp)
+
+
+class CachedRefreshToken(RefreshToken):
+    """블랙리스트 확인 결과를 캐시하는 RefreshToken"""
+
+    def check_blacklist(self):
+        if is_blacklisted(self.payload[api_settings.JTI_CLAIM], self.payload['exp']):
+            raise TokenError(_('Token is blacklisted'))
+
+    def blacklist(self):
+        result = super().blacklist()
+        # 토큰 회전 시 blacklist() 이후 jti 가 바뀌므로 현재 값을 기록
+        jti, exp = self.payload[api_settings.JTI_CLAIM], self.payload['exp']
+        transaction.on_commit(lambda: remember_blacklisted(jti, exp))
+        return result
+
+
+class CachedTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = CachedRefreshToken
+
+
+def get_rotation_cache_key(jti):
+    return f'auth:jwt-rotation:{jti}'
+
+
+def _rotate(raw_token):
+    serializer = CachedTokenRefreshSerializer(data={'refresh': raw_token})
+    serializer.is_valid(raise_exception=True)
+    return serializer.validated_data
+
+
+def rotate_refresh_token(raw_token):
+    """
+    refresh 토큰을 검증/회전하여 새 토큰 쌍({'access', 'refresh'})을 반환.
+    회전된 토큰이 JWT_REFRESH_GRACE_SECONDS 안에 다시 오면(여러 탭의 동시 갱신) 블랙리스트 오류 대신 처음 발급한 쌍을 반환하며,
+    동시에 도착한 요청은 캐시 잠금을 얻은 요청 하나만 회전하고 나머지는 그 결과를 기다립니다.
+    """
+    grace = settings.JWT_REFRESH_GRACE_SECONDS
+    if not grace:
+        return _rotate(raw_token)
+
+    shared = caches['tokens']
+    # 서명/만료만 확인하여 jti 를 얻음 (블랙리스트 확인은 회전할 때)
+    key = get_rotation_cache_key(UntypedToken(raw_token)[api_settings.JTI_CLAIM])
+    lock_key = f'{key}:lock'
+    lock_timeout = settings.JWT_REFRESH_LOCK_TIMEOUT
+    deadline = time.monotonic() + lock_timeout
+    locked = shared.add(lock_key, 1, lock_timeout)
+    while not locked:
+        result = shared.get(key)
+        if result is not None:
+            return result
+        if time.monotonic() >= deadline:
+            break  # 잠금을 얻은 요청이 끝나지 않으면 직접 처리 (이미 회전되었다면 블랙리스트 오류)
+        time.sleep(0.05)
+        locked = shared.add(lock_key, 1, lock_timeout)
+
+    try:
+        result = shared.get(key)
+        if result is None:
+            result = _rotate(raw_token)
+            shared.set(key, result, grace)
+        return result
+    finally:
+        if locked:
+            shared.delete(lock_key)
+
+
+def purge_expired_tokens(batch_size=1000, now=None):
+    """
+    만료된 발급 토큰(OutstandingToken)과 그 블랙리스트 행을 batch_size 개 삭제하고 삭제한 발급 토큰 수를 반환.
+    만료된 토큰은 서명 검증 단계에서 거부되므로 블랙리스트에 남겨둘 필요가 없습니다.
+    """
+    now = now or timezone.now()
+    with transaction.atomic():
+        ids = list(OutstandingToken.objects.filter(expires_at__lte=now).values_list('pk', flat=True)[:batch_size])
+        if ids:
+            BlacklistedToken.objects.filter(token_id__in=ids).delete()
+            OutstandingToken.objects.filter(pk__in=ids).delete()
+    return len(ids)
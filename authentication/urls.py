@@ -8,6 +8,7 @@ router.register('business', BusinessViewSet)
 urlpatterns = [
     path('', include(router.urls)),
     path('register/', RegisterView.as_view(), name='auth_register'),
+    path('members/bulk/', BulkMemberView.as_view(), name='member_bulk'),
     path('login/', CustomTokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('logout/', LogoutView.as_view(), name='logout'),
     path('refresh/', CustomTokenRefreshView.as_view(), name='token_refresh'),
@@ -1,16 +1,22 @@
+import hmac
+import io
+from django.conf import settings
+from django.http import Http404, HttpResponse
 from django.views.generic import TemplateView
-from django.contrib.auth import authenticate
 from django.shortcuts import redirect
 from rest_framework import generics, viewsets, permissions, filters, status
 from rest_framework.response import Response
-from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.exceptions import AuthenticationFailed, ValidationError
+from rest_framework.parsers import JSONParser, MultiPartParser
+from rest_framework.views import APIView
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView, TokenBlacklistView
-from rest_framework_simplejwt.serializers import TokenRefreshSerializer
-from rest_framework_simplejwt.tokens import RefreshToken
-from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from django_filters.rest_framework import DjangoFilterBackend
-from .serializers import RegisterSerializer, BusinessSerializer
+from .serializers import RegisterSerializer, BusinessSerializer, ProvisionUploadSerializer
 from .models import Business, BusinessMember
+from .metrics import collect, render_prometheus
+from .provisioning import MemberProvisioner, ProvisionError, detect_format, enumerate_rows, read_rows
+from .tokens import CachedRefreshToken, rotate_refresh_token
 from authentication.permissions import IsBusinessAdmin
 
 
@@ -28,40 +34,37 @@ class LoginTemplateView(TemplateView):
 
 # JWT를 쿠키에 넣는 커스텀 로그인 뷰
 class CustomTokenObtainPairView(TokenObtainPairView):
-    def post(self, request, *args, **kwargs):
-        username = request.data.get('username')
-        password = request.data.get('password')
-
-        user = authenticate(request, username=username, password=password)
-        if user is None:
-            raise AuthenticationFailed('Invalid username or password.')
-
-        # 기본 JWT 발급 로직 실행
-        response = super().post(request, *args, **kwargs)
-        data = response.data
+    """
+    TokenObtainPairSerializer 의 인증 결과로 바로 토큰을 발급하여, 로그인 한 번에 사용자 조회와 비밀번호 해시 검증은 한 번만 수행됩니다.
+    저장된 해시가 현재 PASSWORD_HASHERS 설정(알고리즘, 반복 횟수)보다 오래되었으면 검증에 성공할 때 새 해시로 저장됩니다
+    (AbstractBaseUser.check_password).
+    """
 
-        # 발급된 JWT를 응답 본문에서 제거하고, 쿠키로 내려주기
-        access_token = data.pop('access', None)
-        refresh_token = data.pop('refresh', None)
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        try:
+            serializer.is_valid(raise_exception=True)
+        except TokenError as e:
+            raise InvalidToken(e.args[0])
 
-        # 로그인 성공 메시지만 응답 본문에 담음
-        response = Response({'message': 'Login successful'}, status=response.status_code)
-        if access_token:
-            response.set_cookie(
-                'access_token',
-                access_token,
-                httponly=True,   # JavaScript에서 접근 불가 (보안 강화)
-                secure=True,     # HTTPS에서만 전송 (개발 환경에서는 False 가능)
-                samesite='Lax'   # CSRF 방지
-            )
-        if refresh_token:
-            response.set_cookie(
-                'refresh_token',
-                refresh_token,
-                httponly=True,
-                secure=True,
-                samesite='Lax'
-            )
+        # 발급된 JWT는 응답 본문 대신 쿠키로 내려주고, 로그인 성공 메시지만 응답 본문에 담음
+        access_token = serializer.validated_data['access']
+        refresh_token = serializer.validated_data['refresh']
+        response = Response({'message': 'Login successful'}, status=status.HTTP_200_OK)
+        response.set_cookie(
+            'access_token',
+            access_token,
+            httponly=True,   # JavaScript에서 접근 불가 (보안 강화)
+            secure=True,     # HTTPS에서만 전송 (개발 환경에서는 False 가능)
+            samesite='Lax'   # CSRF 방지
+        )
+        response.set_cookie(
+            'refresh_token',
+            refresh_token,
+            httponly=True,
+            secure=True,
+            samesite='Lax'
+        )
         return response
 
 
@@ -71,16 +74,14 @@ class CustomTokenRefreshView(TokenRefreshView):
         if not refresh_token:
             return Response({"detail": "No refresh token provided in cookie."}, status=400)
 
-        # refresh_token을 data에 직접 넣어서 Serializer 호출
-        serializer = TokenRefreshSerializer(data={'refresh': refresh_token})
+        # 여러 탭이 같은 토큰으로 동시에 갱신해도 한 번만 회전하고 같은 토큰 쌍을 받음 (블랙리스트 확인 결과는 캐시됨)
         try:
-            serializer.is_valid(raise_exception=True)
+            response_data = rotate_refresh_token(refresh_token)
         except TokenError as e:
             # 토큰이 만료되었거나 잘못된 경우
             raise AuthenticationFailed(e.args[0])
 
         # 유효한 경우 새 access token 반환
-        response_data = serializer.validated_data
         access_token = response_data.get('access')
 
         if not access_token:
@@ -94,6 +95,15 @@ class CustomTokenRefreshView(TokenRefreshView):
             secure=True,
             samesite='Lax'
         )
+        # ROTATE_REFRESH_TOKENS: 기존 refresh 토큰은 블랙리스트되었으므로 회전된 토큰으로 교체
+        if 'refresh' in response_data:
+            response.set_cookie(
+                'refresh_token',
+                response_data['refresh'],
+                httponly=True,
+                secure=True,
+                samesite='Lax'
+            )
         return response
 
 class LogoutView(TokenBlacklistView):
@@ -109,7 +119,7 @@ class LogoutView(TokenBlacklistView):
             return Response({"detail": "No refresh_token or access_token found in cookies."}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            token = RefreshToken(refresh_token)
+            token = CachedRefreshToken(refresh_token)
             token.blacklist()
         except TokenError:
             pass
@@ -131,6 +141,46 @@ class RegisterView(generics.CreateAPIView):
     permission_classes = (permissions.AllowAny,)
     serializer_class = RegisterSerializer
 
+# 구성원 일괄 등록을 위한 뷰
+class BulkMemberView(APIView):
+    """
+    소속 비즈니스에 구성원을 일괄 등록하는 관리자 전용 API 엔드포인트.
+    JSON 본문(username, password, role 객체의 배열) 또는 multipart 의 file(JSON/CSV)을 받아,
+    잘못된 행과 중복 username 은 건너뛰고 등록 결과와 행별 오류를 반환합니다.
+    한 요청은 MEMBER_PROVISION_MAX_ROWS 명까지이며, 더 많은 구성원은 provision_members 명령을 사용합니다.
+    URL: /api/auth/members/bulk/
+    """
+    permission_classes = (IsBusinessAdmin,)
+    parser_classes = (JSONParser, MultiPartParser)
+
+    def post(self, request, *args, **kwargs):
+        try:
+            rows = self.get_rows(request)
+        except ProvisionError as e:
+            raise ValidationError({'non_field_errors': [str(e)]})
+        if len(rows) > settings.MEMBER_PROVISION_MAX_ROWS:
+            raise ValidationError({'non_field_errors': [
+                f'한 요청으로 최대 {settings.MEMBER_PROVISION_MAX_ROWS}명까지 등록할 수 있습니다.'
+            ]})
+        report = MemberProvisioner(request.user.business).run(rows)
+        return Response(report.as_dict(), status=status.HTTP_201_CREATED if report.created else status.HTTP_200_OK)
+
+    @staticmethod
+    def get_rows(request):
+        if 'file' not in request.FILES:
+            return enumerate_rows(request.data)
+        serializer = ProvisionUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.validated_data['file']
+        format = serializer.validated_data.get('format') or detect_format(upload.name)
+        stream = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+        try:
+            return read_rows(stream, format)
+        except UnicodeDecodeError:
+            raise ProvisionError('UTF-8 로 인코딩된 파일이어야 합니다.')
+        finally:
+            stream.detach()
+
 # 비즈니스 관리용 뷰셋
 class BusinessViewSet(viewsets.ModelViewSet):
     """
@@ -157,3 +207,18 @@ class BusinessViewSet(viewsets.ModelViewSet):
         if getattr(self, "action", None) == "list":
             return [permissions.AllowAny()]
         return [IsBusinessAdmin()]
+
+
+def metrics_view(request):
+    """
+    모든 gunicorn 워커의 요청 지표를 Prometheus 텍스트 형식으로 반환.
+    METRICS_TOKEN 이 설정된 경우에만 동작하며 Authorization: Bearer <METRICS_TOKEN> 헤더가 필요합니다.
+    URL: /metrics/
+    """
+    token = settings.METRICS_TOKEN
+    if not token:
+        raise Http404
+    if not hmac.compare_digest(request.headers.get('Authorization', '').encode(), f'Bearer {token}'.encode()):
+        return HttpResponse(status=401)
+    body = render_prometheus(collect(settings.METRICS_DIR))
+    return HttpResponse(body, content_type='text/plain; version=0.0.4; charset=utf-8')
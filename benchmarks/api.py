@@ -0,0 +1,135 @@
+"""
+게시판 API 부하/지연 벤치마크.
+
+    python -m benchmarks.api --tenant-posts 100000 10000 --modes inprocess http --concurrency 1 8 32 --output api.json
+
+비즈니스(테넌트)마다 지정한 수의 게시글과 댓글을 생성한 뒤, 엔드포인트별로 동시 클라이언트 수를 바꿔 가며
+처리량과 p50/p95/p99 지연을 측정합니다.
+- inprocess: Django 테스트 Client 로 미들웨어부터 뷰까지 같은 프로세스에서 호출 (네트워크/서버 제외)
+- http: gunicorn 서버(--server 프로필)를 띄워 keep-alive HTTP 클라이언트로 호출
+응답 캐시는 기본으로 끄고(--cache 로 사용) 각 테넌트의 첫 번째 작성자로 요청합니다.
+"""
+import argparse
+import json
+from contextlib import ExitStack
+
+from benchmarks.utils import (
+    SERVER_PROFILES, benchmark_database, django_client, environment, http_client, run_load, seed_board, serve,
+    setup_django, write_report,
+)
+
+PASSWORD = 'bench-password-1!'
+
+# 이름: (HTTP 메서드, 경로, 요청 본문). {post} 는 테넌트의 공개 게시글 id, {username} 은 요청 사용자
+ENDPOINTS = {
+    'posts': ('GET', '/api/board/posts/', None),
+    'posts_cursor': ('GET', '/api/board/posts/?pagination=cursor', None),
+    'search': ('GET', '/api/board/posts/?search=roadmap', None),
+    'my_posts': ('GET', '/api/board/posts/my_posts/', None),
+    'comments': ('GET', '/api/board/comments/?post={post}', None),
+    'login': ('POST', '/api/auth/login/', {'username': '{username}', 'password': PASSWORD}),
+}
+
+
+def seed_tenants(sizes, comments_per_post, authors):
+    """테넌트별로 게시판 데이터를 생성하고, 로그인할 수 있도록 첫 번째 작성자에 비밀번호를 설정"""
+    from boards.models import Post
+
+    tenants = []
+    for index, posts in enumerate(sizes):
+        business, members = seed_board(
+            posts, comments_per_post, authors=authors, business_name=f'tenant-{index}-{posts}', seed=index,
+        )
+        member = members[0]
+        member.set_password(PASSWORD)
+        member.save(update_fields=['password'])
+        post_id = Post.objects.filter(business=business, is_public=True).values_list('pk', flat=True).first()
+        tenants.append((business.name, member, post_id))
+    return tenants
+
+
+def make_client(mode, base_url, method, path, body, cookies):
+    """측정 방식에 맞는 요청 함수 팩토리 (run_load 의 client)"""
+    if mode == 'inprocess':
+        return lambda: django_client(path, cookies, method.lower(), body)
+    headers = {'Cookie': '; '.join(f'{name}={value}' for name, value in cookies.items())}
+    if body is not None:
+        headers['Content-Type'] = 'application/json'
+        body = json.dumps(body)
+    return lambda: http_client(base_url + path, headers, method, body)
+
+
+def run(args):
+    from django.conf import settings
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    report = {
+        'benchmark': 'api',
+        'environment': None,
+        'tenant_posts': args.tenant_posts,
+        'comments_per_post': args.comments_per_post,
+        'requests': args.requests,
+        'login_requests': args.login_requests,
+        'cache': args.cache,
+        'server': args.server,
+        'workers': args.workers,
+        'threads': args.threads,
+        'results': {},
+    }
+    if not args.cache:
+        settings.BOARD_CACHE_TIMEOUT = 0
+
+    with benchmark_database(keepdb=args.keepdb) as database, ExitStack() as stack:
+        report['environment'] = environment()
+        tenants = seed_tenants(args.tenant_posts, args.comments_per_post, args.authors)
+
+        base_url = None
+        if 'http' in args.modes:
+            env = {} if args.cache else {'BOARD_CACHE_TIMEOUT': '0'}
+            base_url = stack.enter_context(serve(args.server, database, workers=args.workers, env=env, threads=args.threads))
+
+        for mode in args.modes:
+            for name, member, post_id in tenants:
+                cookies = {'access_token': str(AccessToken.for_user(member))}
+                results = report['results'].setdefault(mode, {})[name] = {}
+                for endpoint in args.endpoints:
+                    method, path, body = ENDPOINTS[endpoint]
+                    path = path.format(post=post_id)
+                    if body is not None:
+                        body = {key: value.format(username=member.username) for key, value in body.items()}
+                    client = make_client(mode, base_url, method, path, body, cookies)
+                    total = args.login_requests if endpoint == 'login' else args.requests
+
+                    run_load(client, 1, 3)  # 워밍업
+                    results[endpoint] = {
+                        str(concurrency): run_load(client, concurrency, total)
+                        for concurrency in args.concurrency
+                    }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tenant-posts', type=int, nargs='+', default=[10000, 1000],
+                        help='테넌트별 게시글 수 (값 하나당 테넌트 하나)')
+    parser.add_argument('--comments-per-post', type=int, default=3)
+    parser.add_argument('--authors', type=int, default=20, help='테넌트별 작성자 수')
+    parser.add_argument('--modes', nargs='+', choices=['inprocess', 'http'], default=['inprocess', 'http'])
+    parser.add_argument('--server', choices=list(SERVER_PROFILES), default='asgi', help='http 측정 시 서버 프로필')
+    parser.add_argument('--workers', type=int, default=4, help='http 측정 시 gunicorn 워커 수')
+    parser.add_argument('--threads', type=int, help='gthread 프로필의 워커당 스레드 수 (= 연결 풀 크기)')
+    parser.add_argument('--endpoints', nargs='+', choices=list(ENDPOINTS), default=list(ENDPOINTS))
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--requests', type=int, default=500, help='엔드포인트/동시성 단계별 요청 수')
+    parser.add_argument('--login-requests', type=int, default=20, help='로그인은 비밀번호 해시 비용이 커서 별도 지정')
+    parser.add_argument('--cache', action='store_true', help='응답 캐시(BOARD_CACHE_TIMEOUT)를 끄지 않음')
+    parser.add_argument('--keepdb', action='store_true', help='테스트 DB를 삭제하지 않고 재사용')
+    parser.add_argument('--output', help='결과 JSON 파일 경로 (기본: stdout)')
+    args = parser.parse_args()
+
+    setup_django()
+    write_report(run(args), args.output)
+
+
+if __name__ == '__main__':
+    main()
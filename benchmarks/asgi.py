@@ -0,0 +1,80 @@
+"""
+동기 WSGI 와 ASGI(동기 DRF 뷰 / 비동기 읽기 뷰) 구성의 동시 요청 처리량과 꼬리 지연 비교.
+
+    python -m benchmarks.asgi --posts 20000 --concurrency 1 8 32 64 --requests 2000 --output asgi.json
+
+벤치마크 DB 를 바라보는 gunicorn 서버를 프로필마다 띄운 뒤 같은 머신의 스레드 클라이언트로 요청합니다.
+응답 캐시는 끄고(BOARD_CACHE_TIMEOUT=0) DB 조회 경로를 측정합니다.
+- wsgi/sync: 기존 구성 (동기 워커 + DRF 뷰셋)
+- asgi/sync: uvicorn 워커 + DRF 뷰셋
+- asgi/async: uvicorn 워커 + /api/board/async/ 비동기 뷰
+"""
+import argparse
+
+from benchmarks.utils import benchmark_database, http_load, seed_board, serve, setup_django, write_report
+
+# (서버 프로필, 뷰 종류) 별 측정 엔드포인트. {post} 는 댓글이 있는 게시글 id
+CASES = {
+    ('wsgi', 'sync'): {
+        'post_list': '/api/board/posts/?pagination=cursor',
+        'post_detail': '/api/board/posts/{post}/',
+        'comment_list': '/api/board/comments/?post={post}&pagination=cursor',
+    },
+    ('asgi', 'sync'): {
+        'post_list': '/api/board/posts/?pagination=cursor',
+        'post_detail': '/api/board/posts/{post}/',
+        'comment_list': '/api/board/comments/?post={post}&pagination=cursor',
+    },
+    ('asgi', 'async'): {
+        'post_list': '/api/board/async/posts/',
+        'post_detail': '/api/board/async/posts/{post}/',
+        'comment_list': '/api/board/async/comments/?post={post}',
+    },
+}
+
+
+def run(posts, comments_per_post, concurrency_levels, requests, workers, keepdb):
+    from rest_framework_simplejwt.tokens import AccessToken
+    from boards.models import Post
+
+    report = {
+        'benchmark': 'asgi', 'posts': posts, 'comments_per_post': comments_per_post,
+        'requests': requests, 'workers': workers, 'results': {},
+    }
+
+    with benchmark_database(keepdb=keepdb) as database:
+        _, members = seed_board(posts, comments_per_post)
+        headers = {'Cookie': f'access_token={AccessToken.for_user(members[0])}'}
+        post_id = Post.objects.filter(is_public=True).values_list('pk', flat=True).first()
+
+        for (profile, kind), endpoints in CASES.items():
+            results = report['results'][f'{profile}/{kind}'] = {}
+            with serve(profile, database, workers=workers, env={'BOARD_CACHE_TIMEOUT': '0'}) as base_url:
+                for name, path in endpoints.items():
+                    url = base_url + path.format(post=post_id)
+                    http_load(url, workers, workers * 5, headers)  # 워커별 초기화(연결, import) 워밍업
+                    results[name] = {
+                        str(concurrency): http_load(url, concurrency, requests, headers)
+                        for concurrency in concurrency_levels
+                    }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--posts', type=int, default=20000)
+    parser.add_argument('--comments-per-post', type=int, default=5)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32, 64])
+    parser.add_argument('--requests', type=int, default=2000, help='동시성 단계별 요청 수')
+    parser.add_argument('--workers', type=int, default=4, help='gunicorn 워커 수 (entrypoint.sh 기본값과 같음)')
+    parser.add_argument('--keepdb', action='store_true', help='테스트 DB를 삭제하지 않고 재사용')
+    parser.add_argument('--output', help='결과 JSON 파일 경로 (기본: stdout)')
+    args = parser.parse_args()
+
+    setup_django()
+    write_report(run(args.posts, args.comments_per_post, args.concurrency, args.requests, args.workers, args.keepdb),
+                 args.output)
+
+
+if __name__ == '__main__':
+    main()
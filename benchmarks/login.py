@@ -0,0 +1,146 @@
+"""
+로그인 처리량 벤치마크.
+
+    python -m benchmarks.login --users 200 --concurrency 1 4 8 --requests 200 --output login.json
+
+로그인 비용은 대부분 비밀번호 해시 검증(PBKDF2)이므로, 해시 한 번의 시간(hash)과 함께 로그인 요청의
+처리량/지연을 측정하고 로그인 한 번에 수행된 해시 검증 횟수(hashes_per_login)를 기록합니다.
+- inprocess: Django 테스트 Client 로 같은 프로세스에서 호출 (해시 검증 횟수도 이 모드에서 셈)
+- http: gunicorn 서버(--server 프로필)를 띄워 keep-alive HTTP 클라이언트로 호출 (한 사용자로 반복 로그인)
+- rehash: 이전 반복 횟수로 저장된 사용자의 첫 로그인 (검증 후 새 해시로 다시 저장하는 비용 포함)
+inprocess 요청은 여러 사용자에게 돌아가며 보내 사용자 행/캐시 재사용의 영향을 줄입니다.
+"""
+import argparse
+import itertools
+import json
+import threading
+from contextlib import contextmanager
+
+from benchmarks.utils import (
+    SERVER_PROFILES, benchmark_database, environment, http_client, measure, run_load, serve, setup_django,
+    summarize, write_report,
+)
+
+PASSWORD = 'bench-password-1!'
+OUTDATED_ITERATIONS = 100000
+
+
+def seed_users(count, prefix='login', iterations=None):
+    """같은 비밀번호 해시(해시 계산은 한 번)를 가진 사용자 count 명을 생성하고 username 목록을 반환"""
+    from django.contrib.auth.hashers import PBKDF2PasswordHasher, make_password
+    from authentication.models import Business, BusinessMember
+
+    if iterations:
+        hasher = PBKDF2PasswordHasher()
+        password = hasher.encode(PASSWORD, hasher.salt(), iterations=iterations)
+    else:
+        password = make_password(PASSWORD)
+    business = Business.objects.create(name=prefix)
+    members = BusinessMember.objects.bulk_create([
+        BusinessMember(username=f'{prefix}-{i}', password=password, business=business) for i in range(count)
+    ])
+    return [member.username for member in members]
+
+
+@contextmanager
+def counting_hashes():
+    """이 프로세스에서 수행된 PBKDF2 검증 횟수를 세는 리스트를 반환"""
+    from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+    calls = []
+    verify = PBKDF2PasswordHasher.verify
+
+    def counted(self, password, encoded):
+        calls.append(1)
+        return verify(self, password, encoded)
+
+    PBKDF2PasswordHasher.verify = counted
+    try:
+        yield calls
+    finally:
+        PBKDF2PasswordHasher.verify = verify
+
+
+def login_client(usernames):
+    """요청마다 다음 사용자로 로그인하는 in-process 요청 함수를 여는 client() (스레드 간에 사용자 순서를 공유)"""
+    lock = threading.Lock()
+    names = itertools.cycle(usernames)
+
+    def body():
+        with lock:
+            return {'username': next(names), 'password': PASSWORD}
+
+    @contextmanager
+    def client():
+        from django.db import connections
+        from django.test import Client
+
+        django = Client(HTTP_HOST='localhost', raise_request_exception=False)
+        try:
+            yield lambda: django.post('/api/auth/login/', body(), content_type='application/json').status_code
+        finally:
+            connections.close_all()
+    return client
+
+
+def run(args):
+    from django.contrib.auth.hashers import check_password, make_password
+
+    report = {
+        'benchmark': 'login', 'environment': None, 'users': args.users, 'requests': args.requests,
+        'server': args.server, 'workers': args.workers, 'results': {},
+    }
+
+    with benchmark_database(keepdb=args.keepdb) as database:
+        report['environment'] = environment()
+        usernames = seed_users(args.users)
+        encoded = make_password(PASSWORD)
+        report['results']['hash'] = summarize(measure(lambda: check_password(PASSWORD, encoded), args.hash_repeat))
+
+        results = report['results']['inprocess'] = {}
+        for concurrency in args.concurrency:
+            with counting_hashes() as calls:
+                result = run_load(login_client(usernames), concurrency, args.requests)
+            result['hashes_per_login'] = round(len(calls) / max(result['count'], 1), 2)
+            results[str(concurrency)] = result
+
+        # 첫 로그인에서 새 해시로 다시 저장되는 사용자 (한 사용자당 한 번만 측정되도록 요청 수 = 사용자 수)
+        outdated = seed_users(args.requests, prefix='outdated', iterations=OUTDATED_ITERATIONS)
+        with counting_hashes() as calls:
+            result = run_load(login_client(outdated), 1, len(outdated))
+        result['hashes_per_login'] = round(len(calls) / max(result['count'], 1), 2)
+        report['results']['rehash'] = result
+
+        if 'http' in args.modes:
+            results = report['results']['http'] = {}
+            with serve(args.server, database, workers=args.workers) as base_url:
+                for concurrency in args.concurrency:
+                    results[str(concurrency)] = run_load(
+                        lambda: http_client(
+                            base_url + '/api/auth/login/', {'Content-Type': 'application/json'}, 'POST',
+                            json.dumps({'username': usernames[0], 'password': PASSWORD}),
+                        ),
+                        concurrency, args.requests,
+                    )
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 8])
+    parser.add_argument('--requests', type=int, default=200, help='동시성 단계별 로그인 요청 수')
+    parser.add_argument('--hash-repeat', type=int, default=20, help='해시 한 번의 시간 측정 반복 수')
+    parser.add_argument('--modes', nargs='+', choices=['inprocess', 'http'], default=['inprocess', 'http'])
+    parser.add_argument('--server', choices=list(SERVER_PROFILES), default='asgi', help='http 측정 시 서버 프로필')
+    parser.add_argument('--workers', type=int, default=4, help='http 측정 시 gunicorn 워커 수')
+    parser.add_argument('--keepdb', action='store_true', help='테스트 DB를 삭제하지 않고 재사용')
+    parser.add_argument('--output', help='결과 JSON 파일 경로 (기본: stdout)')
+    args = parser.parse_args()
+
+    setup_django()
+    write_report(run(args), args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+DB 연결 풀과 서버 동시성 프로필 비교.
+
+    python -m benchmarks.pool --posts 20000 --threads 8 --concurrency 1 8 32 64 --requests 2000 --output pool.json
+
+벤치마크 DB 를 바라보는 gunicorn 서버를 구성마다 띄워 같은 머신의 스레드 클라이언트로 요청하고,
+측정 후 /metrics/ 의 연결 풀 지표(열린 연결 수, 대기 시간, 타임아웃)를 함께 기록합니다.
+응답 캐시는 끄고(BOARD_CACHE_TIMEOUT=0) DB 조회 경로를 측정합니다.
+- wsgi/no-pool: 기존 구성 (동기 워커, 요청마다 연결을 열고 닫음)
+- wsgi/pool: 동기 워커 + 워커별 연결 풀 (max_size 1)
+- gthread/pool: 스레드 워커 (워커당 --threads 개) + 스레드 수와 같은 크기의 연결 풀
+- asgi/pool: uvicorn 워커 + 연결 풀 (max_size 는 --threads)
+"""
+import argparse
+import http.client
+import os
+import tempfile
+from urllib.parse import urlsplit
+
+from benchmarks.utils import benchmark_database, environment, http_load, seed_board, serve, setup_django, write_report
+
+ENDPOINTS = {
+    'post_list': '/api/board/posts/?pagination=cursor',
+    'post_detail': '/api/board/posts/{post}/',
+    'comment_list': '/api/board/comments/?post={post}&pagination=cursor',
+}
+METRICS_TOKEN = 'bench-metrics'
+
+
+def cases(threads):
+    """이름: (서버 프로필, 워커당 스레드 수, 서버 환경 변수)"""
+    pool = {'DATABASE_POOL': 'True', 'DATABASE_POOL_MAX_SIZE': str(threads)}
+    return {
+        'wsgi/no-pool': ('wsgi', None, {'DATABASE_POOL': 'False'}),
+        'wsgi/pool': ('wsgi', None, {'DATABASE_POOL': 'True', 'DATABASE_POOL_MAX_SIZE': '1'}),
+        'gthread/pool': ('gthread', threads, pool),
+        'asgi/pool': ('asgi', None, pool),
+    }
+
+
+def pool_metrics(base_url):
+    """서버의 /metrics/ 에서 default DB 연결 풀 지표만 {이름: 값} 으로 반환 (풀을 사용하지 않으면 빈 dict)"""
+    parts = urlsplit(base_url)
+    conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=30)
+    try:
+        conn.request('GET', '/metrics/', headers={'Authorization': f'Bearer {METRICS_TOKEN}'})
+        body = conn.getresponse().read().decode()
+    finally:
+        conn.close()
+    values = {}
+    for line in body.splitlines():
+        if line.startswith('board_db_pool_') and '{database="default"}' in line:
+            name, value = line.split(' ', 1)
+            values[name.split('{', 1)[0]] = float(value)
+    return values
+
+
+def run(posts, comments_per_post, concurrency_levels, requests, workers, threads, keepdb, metrics_dir):
+    from rest_framework_simplejwt.tokens import AccessToken
+    from boards.models import Post
+
+    report = {
+        'benchmark': 'pool', 'environment': None, 'posts': posts, 'comments_per_post': comments_per_post,
+        'requests': requests, 'workers': workers, 'threads': threads, 'results': {},
+    }
+
+    with benchmark_database(keepdb=keepdb) as database:
+        report['environment'] = environment()
+        _, members = seed_board(posts, comments_per_post)
+        headers = {'Cookie': f'access_token={AccessToken.for_user(members[0])}'}
+        post_id = Post.objects.filter(is_public=True).values_list('pk', flat=True).first()
+
+        for name, (profile, profile_threads, env) in cases(threads).items():
+            # 워커별 지표 파일을 합산해야 서버 전체의 풀 지표가 되므로 구성마다 디렉터리를 따로 사용
+            directory = os.path.join(metrics_dir, name.replace('/', '-'))
+            os.makedirs(directory)
+            env = {
+                **env, 'BOARD_CACHE_TIMEOUT': '0', 'METRICS_TOKEN': METRICS_TOKEN,
+                'METRICS_DIR': directory, 'METRICS_FLUSH_INTERVAL': '0',
+            }
+            results = report['results'][name] = {}
+            with serve(profile, database, workers=workers, env=env, threads=profile_threads) as base_url:
+                for endpoint, path in ENDPOINTS.items():
+                    url = base_url + path.format(post=post_id)
+                    http_load(url, workers, workers * 5, headers)  # 워커별 초기화(연결, import) 워밍업
+                    results[endpoint] = {
+                        str(concurrency): http_load(url, concurrency, requests, headers)
+                        for concurrency in concurrency_levels
+                    }
+                results['pool'] = pool_metrics(base_url)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--posts', type=int, default=20000)
+    parser.add_argument('--comments-per-post', type=int, default=5)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32, 64])
+    parser.add_argument('--requests', type=int, default=2000, help='동시성 단계별 요청 수')
+    parser.add_argument('--workers', type=int, default=4, help='gunicorn 워커 수 (entrypoint.sh 기본값과 같음)')
+    parser.add_argument('--threads', type=int, default=8, help='gthread 워커당 스레드 수 (= 연결 풀 크기)')
+    parser.add_argument('--keepdb', action='store_true', help='테스트 DB를 삭제하지 않고 재사용')
+    parser.add_argument('--output', help='결과 JSON 파일 경로 (기본: stdout)')
+    args = parser.parse_args()
+
+    setup_django()
+    with tempfile.TemporaryDirectory() as metrics_dir:
+        report = run(args.posts, args.comments_per_post, args.concurrency, args.requests, args.workers,
+                     args.threads, args.keepdb, metrics_dir)
+    write_report(report, args.output)
+
+
+if __name__ == '__main__':
+    main()
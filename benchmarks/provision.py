@@ -0,0 +1,70 @@
+"""
+구성원 일괄 등록 벤치마크.
+
+    python -m benchmarks.provision --members 2000 --workers 1 2 4 8 --output provision.json
+
+같은 수의 구성원을 다음 방식으로 등록하고 소요 시간과 초당 등록 수를 기록합니다.
+- register: 회원가입 API 와 같은 RegisterSerializer 로 한 명씩 등록 (중복 조회, INSERT, 해시 후 UPDATE)
+- bulk/<workers>: MemberProvisioner (username 조회 한 번, 해시 프로세스 workers 개, bulk_create)
+register 는 한 명의 비용이 해시 한 번과 같으므로 --register-members 명만 측정하여 같은 단위로 환산합니다.
+"""
+import argparse
+import os
+import time
+
+from benchmarks.utils import benchmark_database, environment, setup_django, write_report
+
+PASSWORD = 'bench-password-1!'
+
+
+def rows(prefix, count):
+    return [(number, {'username': f'{prefix}-{number}', 'password': PASSWORD}) for number in range(1, count + 1)]
+
+
+def result(count, seconds):
+    return {'members': count, 'seconds': round(seconds, 3), 'members_per_second': round(count / seconds, 2)}
+
+
+def run(args):
+    from authentication.models import Business
+    from authentication.provisioning import MemberProvisioner
+    from authentication.serializers import RegisterSerializer
+
+    report = {
+        'benchmark': 'provision', 'environment': None, 'members': args.members, 'cpus': os.cpu_count(),
+        'results': {},
+    }
+
+    with benchmark_database(keepdb=args.keepdb):
+        report['environment'] = environment()
+        business = Business.objects.create(name='provision')
+
+        start = time.perf_counter()
+        for number, row in rows('register', args.register_members):
+            serializer = RegisterSerializer(data=dict(row, password2=PASSWORD, role='member', business=business.pk))
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+        report['results']['register'] = result(args.register_members, time.perf_counter() - start)
+
+        for workers in args.workers:
+            start = time.perf_counter()
+            provisioned = MemberProvisioner(business, workers=workers).run(rows(f'bulk{workers}', args.members))
+            report['results'][f'bulk/{workers}'] = result(provisioned.created, time.perf_counter() - start)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--members', type=int, default=2000, help='일괄 등록 방식별 구성원 수')
+    parser.add_argument('--register-members', type=int, default=50, help='한 명씩 등록하는 방식으로 측정할 구성원 수')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8], help='비교할 해시 프로세스 수')
+    parser.add_argument('--keepdb', action='store_true', help='테스트 DB를 삭제하지 않고 재사용')
+    parser.add_argument('--output', help='결과 JSON 파일 경로 (기본: stdout)')
+    args = parser.parse_args()
+
+    setup_django()
+    write_report(run(args), args.output)
+
+
+if __name__ == '__main__':
+    main()
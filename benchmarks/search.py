@@ -0,0 +1,60 @@
+"""
+게시글 검색 벤치마크: 기존 SearchFilter(icontains) 와 FullTextSearchFilter(tsvector + GIN) 비교.
+
+    python -m benchmarks.search --posts 100000 --repeat 30 --output search.json
+
+각 검색어에 대해 PostViewSet 과 같은 queryset/필터 조합으로 첫 페이지(20건)를 조회하는 시간을 측정합니다.
+"""
+import argparse
+
+from benchmarks.utils import (
+    benchmark_database, measure, seed_board, setup_django, summarize, write_report,
+)
+
+QUERIES = ['roadmap', 'budget review', 'incid', 'security audit migration', 'nomatch']
+
+
+def run(posts, repeat, keepdb):
+    from rest_framework import filters
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+    from boards.filters import FullTextSearchFilter
+    from boards.views import PostViewSet
+
+    factory = APIRequestFactory()
+    report = {'benchmark': 'search', 'posts': posts, 'repeat': repeat, 'results': {}}
+
+    with benchmark_database(keepdb=keepdb):
+        _, members = seed_board(posts)
+        view = PostViewSet()
+        view.request = Request(factory.get('/api/board/posts/'))
+        view.request.user = members[0]
+        view.format_kwarg = None
+
+        backends = {'icontains': filters.SearchFilter(), 'fulltext': FullTextSearchFilter()}
+        for term in QUERIES:
+            request = Request(factory.get('/api/board/posts/', {'search': term}))
+            request.user = members[0]
+            results = {}
+            for name, backend in backends.items():
+                def query():
+                    return list(backend.filter_queryset(request, view.get_queryset(), view)[:20])
+                results[name] = {**summarize(measure(query, repeat)), 'rows': len(query())}
+            report['results'][term] = results
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--posts', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--keepdb', action='store_true', help='테스트 DB를 삭제하지 않고 재사용')
+    parser.add_argument('--output', help='결과 JSON 파일 경로 (기본: stdout)')
+    args = parser.parse_args()
+
+    setup_django()
+    write_report(run(args.posts, args.repeat, args.keepdb), args.output)
+
+
+if __name__ == '__main__':
+    main()
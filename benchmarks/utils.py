@@ -0,0 +1,275 @@
+"""
+벤치마크 공통 유틸리티.
+
+벤치마크는 개발 DB를 건드리지 않도록 Django 테스트 DB(test_<POSTGRES_DB>)를 만들어 실행하고,
+결과는 릴리스 간 비교할 수 있도록 JSON 으로 출력합니다.
+"""
+import http.client
+import itertools
+import json
+import math
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+import django
+
+WORDS = (
+    'roadmap budget release deploy review meeting incident report customer contract '
+    'invoice onboarding security audit backlog sprint retro hiring payroll vendor '
+    'marketing launch pricing support ticket outage migration database cache latency'
+).split()
+
+
+def setup_django():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'miniintern.settings')
+    django.setup()
+
+
+@contextmanager
+def benchmark_database(keepdb=False):
+    """테스트 DB를 생성(또는 재사용)하고 종료 시 정리합니다."""
+    from django.db import connection
+
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=keepdb)
+    try:
+        yield connection.settings_dict['NAME']
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=keepdb)
+
+
+def random_text(rng, words=12):
+    return ' '.join(rng.choice(WORDS) for _ in range(words))
+
+
+def seed_board(posts, comments_per_post=0, authors=20, business_name='bench', seed=0, batch_size=5000):
+    """bulk_create 로 비즈니스 하나와 작성자, 게시글, 댓글을 생성합니다."""
+    from authentication.models import Business, BusinessMember
+    from boards.models import Post, Comment
+
+    rng = random.Random(seed)
+    business = Business.objects.create(name=business_name)
+    members = BusinessMember.objects.bulk_create([
+        BusinessMember(username=f'{business_name}-{i}', password='!', business=business)
+        for i in range(authors)
+    ])
+
+    created = 0
+    while created < posts:
+        size = min(batch_size, posts - created)
+        batch = Post.objects.bulk_create([
+            Post(
+                business=business,
+                author=rng.choice(members),
+                title=random_text(rng, 4),
+                content=random_text(rng, 40),
+                is_public=rng.random() > 0.2,
+            )
+            for _ in range(size)
+        ])
+        if comments_per_post:
+            Comment.objects.bulk_create([
+                Comment(post=post, business=business, author=rng.choice(members), content=random_text(rng, 15))
+                for post in batch
+                for _ in range(comments_per_post)
+            ], batch_size=batch_size)
+        created += size
+
+    from django.db import connection
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+    return business, members
+
+
+def measure(func, repeat, warmup=3):
+    """func 를 repeat 번 호출한 각 소요 시간(초) 목록을 반환합니다."""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def percentile(sorted_samples, q):
+    if not sorted_samples:
+        return 0.0
+    # nearest-rank 방식
+    index = min(len(sorted_samples) - 1, max(0, math.ceil(q / 100 * len(sorted_samples)) - 1))
+    return sorted_samples[index]
+
+
+def summarize(samples, elapsed=None):
+    """지연 시간 목록을 ms 단위 요약(p50/p95/p99 등)으로 변환합니다."""
+    ordered = sorted(samples)
+    summary = {
+        'count': len(ordered),
+        'mean_ms': round(statistics.fmean(ordered) * 1000, 3) if ordered else 0.0,
+        'p50_ms': round(percentile(ordered, 50) * 1000, 3),
+        'p95_ms': round(percentile(ordered, 95) * 1000, 3),
+        'p99_ms': round(percentile(ordered, 99) * 1000, 3),
+        'max_ms': round(ordered[-1] * 1000, 3) if ordered else 0.0,
+    }
+    if elapsed:
+        summary['throughput_rps'] = round(len(ordered) / elapsed, 2)
+    return summary
+
+
+# gunicorn 으로 띄우는 서버 프로필 (entrypoint.sh 의 SERVER_INTERFACE 와 같은 구성)
+SERVER_PROFILES = {
+    'wsgi': ['miniintern.wsgi:application'],
+    'gthread': ['miniintern.wsgi:application', '-k', 'gthread'],
+    'asgi': ['miniintern.asgi:application', '-k', 'uvicorn_worker.UvicornWorker'],
+}
+
+
+@contextmanager
+def serve(profile, database, workers=4, port=8765, env=None, timeout=30, threads=None):
+    """
+    벤치마크 DB 를 바라보는 gunicorn 서버를 하위 프로세스로 실행하고 기본 URL 을 반환합니다.
+    env 로 서버의 설정(BOARD_CACHE_TIMEOUT 등)을 덮어쓸 수 있습니다.
+    threads 를 지정하면 워커별 스레드 수와 함께 연결 풀 크기(GUNICORN_THREADS)도 맞춥니다.
+    """
+    command = [
+        sys.executable, '-m', 'gunicorn', *SERVER_PROFILES[profile],
+        '--bind', f'127.0.0.1:{port}', '--workers', str(workers), '--log-level', 'warning',
+    ]
+    env = {**os.environ, 'POSTGRES_DB': database, 'GUNICORN_WORKERS': str(workers), **(env or {})}
+    if threads:
+        command += ['--threads', str(threads)]
+        env['GUNICORN_THREADS'] = str(threads)
+    process = subprocess.Popen(command, env=env)
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                socket.create_connection(('127.0.0.1', port), timeout=1).close()
+                break
+            except OSError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError(f'{profile} 서버를 시작하지 못했습니다.')
+                time.sleep(0.2)
+        yield f'http://127.0.0.1:{port}'
+    finally:
+        process.terminate()
+        process.wait(timeout)
+
+
+def run_load(client, concurrency, total):
+    """
+    concurrency 개의 스레드가 각자 client() 로 연 요청 함수(상태 코드 반환)를 합계 total 번 호출합니다.
+    200 응답의 지연 시간 요약과 처리량, 그 외 상태 코드/예외별 오류 수를 반환합니다.
+    """
+    tickets = itertools.count()
+    lock = threading.Lock()
+    samples, errors = [], Counter()
+
+    def worker():
+        with client() as request:
+            while next(tickets) < total:
+                start = time.perf_counter()
+                try:
+                    status = request()
+                except Exception as e:  # 클라이언트 오류도 결과의 errors 에 기록
+                    status = type(e).__name__
+                elapsed = time.perf_counter() - start
+                with lock:
+                    if status == 200:
+                        samples.append(elapsed)
+                    else:
+                        errors[str(status)] += 1
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return {**summarize(samples, time.perf_counter() - start), 'errors': dict(errors)}
+
+
+@contextmanager
+def http_client(url, headers=None, method='GET', body=None, timeout=30):
+    """연결을 유지하며 url 로 요청을 보내는 요청 함수 (서버가 연결을 닫으면 다음 요청에서 다시 연결)"""
+    parts = urlsplit(url)
+    path = f'{parts.path}?{parts.query}' if parts.query else parts.path
+    conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=timeout)
+
+    def request():
+        try:
+            conn.request(method, path, body=body, headers=headers or {})
+            response = conn.getresponse()
+            response.read()
+            return response.status
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            return type(e).__name__
+
+    try:
+        yield request
+    finally:
+        conn.close()
+
+
+@contextmanager
+def django_client(path, cookies=None, method='get', data=None):
+    """네트워크 없이 미들웨어부터 뷰까지 같은 프로세스에서 요청하는 요청 함수 (스레드별 DB 연결은 종료 시 닫음)"""
+    from django.db import connections
+    from django.test import Client
+
+    client = Client(HTTP_HOST='localhost', raise_request_exception=False)
+    for name, value in (cookies or {}).items():
+        client.cookies[name] = value
+    kwargs = {'data': data, 'content_type': 'application/json'} if data is not None else {}
+
+    try:
+        yield lambda: getattr(client, method)(path, **kwargs).status_code
+    finally:
+        connections.close_all()
+
+
+def http_load(url, concurrency, total, headers=None, method='GET', body=None):
+    """concurrency 개의 HTTP 클라이언트로 url 을 합계 total 번 요청한 결과 요약"""
+    return run_load(lambda: http_client(url, headers, method, body), concurrency, total)
+
+
+def environment():
+    """릴리스 간 비교를 위해 결과에 함께 기록할 실행 환경"""
+    from django.db import connection
+
+    try:
+        revision = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        revision = ''
+    database = connection.vendor
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('SHOW server_version')
+            database = f'postgresql {cursor.fetchone()[0]}'
+    return {
+        'revision': revision or None,
+        'python': sys.version.split()[0],
+        'django': django.get_version(),
+        'database': database,
+    }
+
+
+def write_report(report, output=None):
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if output:
+        with open(output, 'w', encoding='utf-8') as fp:
+            fp.write(text + '\n')
+    else:
+        sys.stdout.write(text + '\n')
@@ -1,7 +1,9 @@
 # boards/admin.py
 
 from django.contrib import admin
-from .models import Post, Comment
+from .models import Post, Comment, ArchivedPost, ArchivedComment
+from .archive import restore_posts, restore_comments
+from .cache import invalidate_board_cache
 from authentication.models import Business, BusinessMember
 from django.contrib.auth.admin import UserAdmin
 
@@ -21,3 +23,30 @@ admin.site.register(Business, admin.ModelAdmin)
 admin.site.register(BusinessMember, BusinessMemberAdmin)
 admin.site.register(Post)
 admin.site.register(Comment)
+
+
+class ArchivedPostAdmin(admin.ModelAdmin):
+    list_display = ['id', 'business', 'author', 'title', 'deleted_at', 'archived_at']
+    list_filter = ['business']
+    search_fields = ['title']
+    actions = ['restore']
+
+    @admin.action(description='선택한 게시글을 댓글과 함께 복구 (삭제 상태 유지)')
+    def restore(self, request, queryset):
+        rows = restore_posts(queryset)
+        invalidate_board_cache()
+        self.message_user(request, f'게시글 {len(rows)}개를 복구했습니다.')
+
+class ArchivedCommentAdmin(admin.ModelAdmin):
+    list_display = ['id', 'post_id', 'business', 'author', 'deleted_at', 'archived_at']
+    list_filter = ['business']
+    actions = ['restore']
+
+    @admin.action(description='선택한 댓글 복구 (게시글이 보관된 댓글 제외)')
+    def restore(self, request, queryset):
+        rows = restore_comments(queryset)
+        invalidate_board_cache()
+        self.message_user(request, f'댓글 {len(rows)}개를 복구했습니다.')
+
+admin.site.register(ArchivedPost, ArchivedPostAdmin)
+admin.site.register(ArchivedComment, ArchivedCommentAdmin)
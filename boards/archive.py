@@ -0,0 +1,123 @@
+# boards/archive.py
+
+from collections import Counter
+from datetime import timedelta
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+from .models import Post, Comment, ArchivedPost, ArchivedComment
+
+# ============================
+# 보관(archive) 계층
+# - 보존 기간(BOARD_ARCHIVE_RETENTION_DAYS)보다 오래전에 논리적 삭제된 게시글/댓글을 boards_archivedpost/
+#   boards_archivedcomment 로 옮겨 핫 테이블과 인덱스를 작게 유지합니다. 게시글을 옮길 때는 그 댓글도 함께 옮깁니다.
+# - 행은 INSERT ... SELECT 로 id, created_at/updated_at 등을 그대로 복사하므로 복구하면 원래 행과 같아집니다.
+# - 배치마다 별도 트랜잭션에서 대상 행을 잠근 뒤 복사/삭제하므로, 중단되어도 다시 실행하면 남은 행부터 이어집니다.
+# ============================
+
+
+def retention_cutoff(days=None):
+    """이 시각보다 먼저 삭제된 행이 보관 대상"""
+    if days is None:
+        days = settings.BOARD_ARCHIVE_RETENTION_DAYS
+    return timezone.now() - timedelta(days=days)
+
+
+def _copy_rows(source, target, ids, archived_at=None):
+    """
+    source 테이블의 ids 행을 target 테이블로 복사. 두 모델에 공통인 컬럼만 옮기며,
+    보관 테이블로 복사할 때는 archived_at 을 채웁니다.
+    """
+    quote = connection.ops.quote_name
+    source_columns = {field.column for field in source._meta.concrete_fields}
+    columns = [
+        field.column for field in target._meta.concrete_fields
+        if field.column in source_columns
+    ]
+    select = [quote(column) for column in columns]
+    params = []
+    if archived_at is not None:
+        columns.append('archived_at')
+        select.append('%s')
+        params.append(archived_at)
+    placeholders = ', '.join(['%s'] * len(ids))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'INSERT INTO {quote(target._meta.db_table)} ({", ".join(quote(column) for column in columns)}) '
+            f'SELECT {", ".join(select)} FROM {quote(source._meta.db_table)} WHERE {quote("id")} IN ({placeholders})',
+            params + list(ids),
+        )
+
+
+def _archive_comment_ids(ids, now):
+    if ids:
+        _copy_rows(Comment, ArchivedComment, ids, archived_at=now)
+        Comment.objects.filter(pk__in=ids).delete()
+
+
+def archive_comment_batch(cutoff, batch_size, after=0):
+    """
+    cutoff 이전에 삭제된 댓글을 id 순으로 batch_size 개까지 보관. 옮긴 id 목록을 반환하며, 다음 배치는 after=ids[-1] 로 이어갑니다.
+    삭제된 게시글의 나머지 댓글은 archive_post_batch 가 게시글과 같은 트랜잭션에서 옮기므로, 중간에 중단되어도
+    핫 테이블에 댓글 없이 게시글만 남지 않습니다. 삭제된 댓글만 옮기므로 남은 게시글의 comment_count 는 바뀌지 않습니다.
+    """
+    with transaction.atomic():
+        ids = list(
+            Comment.objects.select_for_update()
+            .filter(deleted_at__lt=cutoff, pk__gt=after)
+            .order_by('pk').values_list('pk', flat=True)[:batch_size]
+        )
+        _archive_comment_ids(ids, timezone.now())
+    return ids
+
+
+def archive_post_batch(cutoff, batch_size, after=0):
+    """
+    cutoff 이전에 삭제된 게시글을 id 순으로 batch_size 개까지 그 댓글과 함께 보관.
+    """
+    with transaction.atomic():
+        ids = list(
+            Post.objects.select_for_update().filter(deleted_at__lt=cutoff, pk__gt=after)
+            .order_by('pk').values_list('pk', flat=True)[:batch_size]
+        )
+        if ids:
+            now = timezone.now()
+            _archive_comment_ids(list(Comment.objects.filter(post_id__in=ids).values_list('pk', flat=True)), now)
+            _copy_rows(Post, ArchivedPost, ids, archived_at=now)
+            Post.objects.filter(pk__in=ids).delete()
+    return ids
+
+
+def restore_posts(queryset):
+    """
+    보관된 게시글(ArchivedPost 쿼리셋)과 그 댓글을 핫 테이블로 되돌리고 복구한 게시글의 {'pk'} 목록을 반환.
+    deleted_at 은 그대로 유지되므로 다시 보이게 하려면 bulk_restore 로 삭제를 취소합니다.
+    """
+    with transaction.atomic():
+        ids = list(queryset.select_for_update().order_by('pk').values_list('pk', flat=True))
+        if ids:
+            _copy_rows(ArchivedPost, Post, ids)
+            comment_ids = list(ArchivedComment.objects.filter(post_id__in=ids).values_list('pk', flat=True))
+            if comment_ids:
+                # 게시글의 comment_count 는 보관 당시 값에 이미 반영되어 있음
+                _copy_rows(ArchivedComment, Comment, comment_ids)
+                ArchivedComment.objects.filter(pk__in=comment_ids).delete()
+            ArchivedPost.objects.filter(pk__in=ids).delete()
+    return [{'pk': pk} for pk in ids]
+
+
+def restore_comments(queryset):
+    """
+    보관된 댓글을 되돌리고 {'pk', 'post_id'} 목록을 반환. 게시글이 보관되어 있는 댓글은 제외되며 restore_posts 로 함께 복구됩니다.
+    """
+    with transaction.atomic():
+        rows = list(
+            queryset.select_for_update().filter(post_id__in=Post.objects.values('pk'))
+            .order_by('pk').values_list('pk', 'post_id', 'deleted_at')
+        )
+        if rows:
+            ids = [pk for pk, post_id, deleted_at in rows]
+            _copy_rows(ArchivedComment, Comment, ids)
+            ArchivedComment.objects.filter(pk__in=ids).delete()
+            Post.adjust_comment_counts(Counter(post_id for pk, post_id, deleted_at in rows if deleted_at is None))
+    return [{'pk': pk, 'post_id': post_id} for pk, post_id, deleted_at in rows]
@@ -0,0 +1,105 @@
+# boards/async_views.py
+
+from functools import wraps
+from django import forms
+from django.core.exceptions import ValidationError
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from .models import Post, Comment
+from .pagination import KeysetPagination
+from .routing import read_from_replica
+from .serializers import PostSerializer, CommentSerializer
+
+# ============================
+# 비동기 읽기 전용 API (/api/board/async/...)
+# - ASGI 로 구동할 때 DB 를 기다리는 동안 워커를 점유하지 않도록 async ORM(aiterator, aget)으로 조회합니다.
+# - 응답 형식은 동기 API 의 ?pagination=cursor 응답과 같으며, 정렬은 created_at 기준만 지원합니다.
+# - 인증은 쿠키(access_token)만 사용하며, 응답 캐시/ETag, search, 페이지 번호 방식은 적용하지 않습니다.
+# ============================
+
+FILTER_FIELDS = {
+    'is_public': forms.NullBooleanField(required=False),
+    'author': forms.IntegerField(required=False, min_value=1),
+    'post': forms.IntegerField(required=False, min_value=1),
+}
+
+
+def async_api_view(view):
+    """GET 만 허용하고(복제본에서 조회), 인증 여부 확인과 DRF/폼 검증 예외를 JSON 응답으로 변환"""
+    @require_GET
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return JsonResponse({'detail': 'Authentication credentials were not provided.'}, status=401)
+        try:
+            with read_from_replica(request):
+                return await view(request, *args, **kwargs)
+        except NotFound as e:
+            return JsonResponse({'detail': str(e.detail)}, status=404)
+        except ValidationError as e:
+            return JsonResponse(e.message_dict, status=400)
+    return wrapper
+
+
+def filter_queryset(queryset, request, fields):
+    """동기 API 의 filterset_fields 와 같은 이름의 쿼리 파라미터로 필터링 (DB 조회 없이 값만 검증)"""
+    lookups, errors = {}, {}
+    for name in fields:
+        if name not in request.GET:
+            continue
+        try:
+            value = FILTER_FIELDS[name].clean(request.GET[name])
+        except ValidationError as e:
+            errors[name] = e.messages
+            continue
+        if value is not None:
+            lookups[name] = value
+    if errors:
+        raise ValidationError(errors)
+
+    ordering = 'created_at' if request.GET.get('ordering') == 'created_at' else '-created_at'
+    return queryset.filter(**lookups).order_by(ordering)
+
+
+async def paginated_response(request, queryset, serializer_class):
+    paginator = KeysetPagination()
+    page = await paginator.apaginate_queryset(queryset, Request(request))
+    data = paginator.get_paginated_response(serializer_class(page, many=True).data).data
+    return JsonResponse(data, json_dumps_params={'ensure_ascii': False})
+
+
+@async_api_view
+async def post_list(request):
+    """
+    게시글 목록 (is_public, author 필터, ordering=created_at).
+    URL: /api/board/async/posts/
+    """
+    queryset = Post.objects.select_related('author').visible_to(request.user)
+    return await paginated_response(request, filter_queryset(queryset, request, ('is_public', 'author')), PostSerializer)
+
+
+@async_api_view
+async def post_detail(request, pk):
+    """
+    게시글 상세. 조회할 수 없는 게시글이면 404.
+    URL: /api/board/async/posts/<pk>/
+    """
+    try:
+        post = await Post.objects.select_related('author').visible_to(request.user).aget(pk=pk)
+    except Post.DoesNotExist:
+        raise NotFound()
+    return JsonResponse(PostSerializer(post).data, json_dumps_params={'ensure_ascii': False})
+
+
+@async_api_view
+async def comment_list(request):
+    """
+    댓글 목록 (post, is_public, author 필터, ordering=created_at).
+    URL: /api/board/async/comments/
+    """
+    queryset = Comment.objects.select_related('author').visible_to(request.user)
+    return await paginated_response(
+        request, filter_queryset(queryset, request, ('post', 'is_public', 'author')), CommentSerializer,
+    )
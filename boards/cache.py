@@ -0,0 +1,171 @@
+# boards/cache.py
+
+import hashlib
+import time
+from urllib.parse import urlencode
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control, quote_etag
+from django.utils.http import http_date
+from rest_framework.response import Response
+from authentication.models import BusinessMember
+from .routing import is_pinned, read_database
+
+# 게시판 응답 캐시의 버전 키. 쓰기가 일어나면 값이 바뀌어 이전 버전의 캐시 항목은 더 이상 조회되지 않음
+# 조회 범위가 비즈니스로 나뉘지 않으므로(공개 글은 모든 비즈니스에, 관리자에게는 전체가 보임) 비즈니스별로 두지 않고 하나만 사용.
+# 어느 비즈니스에서 쓰기가 일어나도 모든 비즈니스의 캐시가 무효화되는 대신 다른 비즈니스의 변경이 늦게 보이지 않음
+VERSION_KEY = 'board:version'
+# 버전을 올린 뒤 REPLICA_PIN_SECONDS 동안 남는 키. 이 동안 복제본에서 읽은 응답은 아직 쓰기가 반영되지 않았을 수 있음
+BUMPED_KEY = 'board:bumped'
+
+
+def get_cache():
+    return caches[getattr(settings, 'BOARD_CACHE_ALIAS', 'default')]
+
+
+def get_board_version():
+    """
+    현재 게시판 캐시 버전을 반환.
+    버전 키가 없으면(캐시 재시작/축출) 이전에 쓰인 값과 겹치지 않도록 현재 시각(ms)으로 초기화합니다.
+    """
+    cache = get_cache()
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, int(time.time() * 1000), None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def bump_board_version():
+    """게시판 캐시 버전을 올려 기존 응답 캐시를 모두 무효화."""
+    cache = get_cache()
+    if settings.DATABASE_REPLICAS:
+        cache.set(BUMPED_KEY, time.time(), settings.REPLICA_PIN_SECONDS)
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, int(time.time() * 1000), None)
+
+
+def sorted_query_string(request):
+    return urlencode(sorted(request.query_params.lists()), doseq=True)
+
+
+def conditional_response(request, etag, last_modified, build):
+    """
+    If-None-Match/If-Modified-Since 가 일치하면 build() 를 호출하지 않고 304 를, 아니면 build() 의 응답을 반환.
+    두 경우 모두 검증자 헤더와 'private, no-cache'(매번 재검증) 를 붙입니다.
+    """
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified) or build()
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    patch_cache_control(response, private=True, no_cache=True)
+    response.validators = (etag, last_modified)
+    return response
+
+
+def invalidate_board_cache():
+    """현재 트랜잭션이 커밋된 뒤 버전을 올림 (커밋 전 상태가 새 버전으로 캐시되지 않도록)."""
+    transaction.on_commit(bump_board_version)
+
+
+class BoardCacheMixin:
+    """
+    list/retrieve 응답 데이터를 캐시하는 ViewSet 믹스인.
+    키에는 비즈니스, 역할, (소유 여부로 조회 결과가 달라지는 일반 사용자는) 사용자 id, 경로와 정렬된 쿼리스트링,
+    응답 형식(accepted_media_type)이 포함됩니다. 저장된 ETag 가 응답 형식별로 다르므로 형식마다 따로 캐시합니다.
+    게시글은 비즈니스와 무관하게 공개 여부로 노출되므로 버전은 게시판 전체에 하나이며,
+    쓰기(perform_create/update/destroy)에서 invalidate_board_cache() 로 올립니다.
+    """
+
+    def get_cache_key(self, request):
+        user = request.user
+        owner = user.pk if user.role != BusinessMember.BUSINESS_ADMIN else '-'
+        digest = hashlib.md5(
+            f'{request.accepted_media_type}:{request.path}?{sorted_query_string(request)}'.encode()
+        ).hexdigest()
+        return f'board:{get_board_version()}:{self.basename}:{user.business_id}:{user.role}:{owner}:{digest}'
+
+    def cached_response(self, request, handler, *args, **kwargs):
+        timeout = getattr(settings, 'BOARD_CACHE_TIMEOUT', 0)
+        if not timeout:
+            return handler(request, *args, **kwargs)
+
+        cache = get_cache()
+        key = self.get_cache_key(request)
+        # 쓰기 직후(default 에서 읽는) 클라이언트는 지연된 복제본에서 채워진 항목을 받지 않도록 캐시를 건너뜀
+        entry = None if is_pinned(request) else cache.get(key)
+        if entry is not None:
+            # 응답과 함께 저장된 검증자로 DB 조회 없이 304 여부를 판단
+            data, validators = entry
+            if validators is None:
+                return Response(data)
+            return conditional_response(request, *validators, lambda: Response(data))
+
+        response = handler(request, *args, **kwargs)
+        # 버전을 올린 직후 복제본에서 읽은 응답은 쓰기 이전 상태일 수 있으므로, 새 버전으로 캐시하지 않음
+        if response.status_code == 200 and not (read_database() and cache.get(BUMPED_KEY)):
+            cache.set(key, (response.data, getattr(response, 'validators', None)), timeout)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(request, super().retrieve, *args, **kwargs)
+
+
+class ConditionalGetMixin:
+    """
+    응답 본문을 직렬화하지 않고 updated_at 으로부터 강한 ETag 와 Last-Modified 를 계산하여,
+    조건부 요청이 일치하면 304 Not Modified 를 반환하는 ViewSet 믹스인.
+    - retrieve: 객체의 (id, updated_at, deleted_at) + get_etag_parts(), Last-Modified 는 get_last_modified() (None 이면 생략)
+    - list: 필터된 쿼리셋의 (max(updated_at), count) + 쿼리스트링 (집계 쿼리 1회 추가). 보이는 행이 삭제/숨김되면
+      max(updated_at) 가 과거로 돌아가 If-Modified-Since 만 보내는 클라이언트가 304 를 받으므로 Last-Modified 는 보내지 않음
+    ETag 에는 응답 형식(accepted_media_type)이 포함되어 JSON 과 Browsable API 응답을 구분합니다.
+    """
+    conditional_actions = ('retrieve', 'list')
+
+    def get_etag_parts(self, instance):
+        return ()
+
+    def get_last_modified(self, instance):
+        return instance.updated_at
+
+    def make_etag(self, request, *parts):
+        value = ':'.join(str(part) for part in (self.basename, request.accepted_media_type, *parts))
+        return quote_etag(hashlib.md5(value.encode()).hexdigest())
+
+    def retrieve(self, request, *args, **kwargs):
+        if 'retrieve' not in self.conditional_actions:
+            return super().retrieve(request, *args, **kwargs)
+
+        instance = self.get_object()
+        etag = self.make_etag(request, instance.pk, instance.updated_at.isoformat(), instance.deleted_at,
+                              *self.get_etag_parts(instance))
+        last_modified = self.get_last_modified(instance)
+        return conditional_response(
+            request, etag, last_modified and int(last_modified.timestamp()),
+            lambda: Response(self.get_serializer(instance).data),
+        )
+
+    def list(self, request, *args, **kwargs):
+        if 'list' not in self.conditional_actions:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        stats = queryset.aggregate(last_modified=Max('updated_at'), count=Count('pk'))
+        last_modified = stats['last_modified']
+        etag = self.make_etag(request, sorted_query_string(request), stats['count'],
+                              last_modified and last_modified.isoformat())
+
+        def build():
+            page = self.paginate_queryset(queryset)
+            if page is not None:
+                return self.get_paginated_response(self.get_serializer(page, many=True).data)
+            return Response(self.get_serializer(queryset, many=True).data)
+
+        return conditional_response(request, etag, None, build)
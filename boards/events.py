@@ -0,0 +1,289 @@
+# boards/events.py
+
+import asyncio
+import json
+import logging
+import select
+import threading
+import time
+from collections import defaultdict
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections, connection, connections, transaction
+from authentication.models import BusinessMember
+
+logger = logging.getLogger(__name__)
+
+# ============================
+# 게시판 실시간 이벤트 (SSE)
+# - 채널: post:<id> (댓글 생성/수정/삭제), business:<id> (게시글 생성/수정/삭제)
+# - 쓰기 트랜잭션이 커밋된 뒤 발행되며, 같은 프로세스의 구독자에게는 Broker 가 전달합니다.
+# - BOARD_EVENTS_BACKEND=postgresql 이면 NOTIFY 로 다른 워커에도 전달합니다.
+# ============================
+
+NOTIFY_CHANNEL = 'board_events'
+
+
+def post_channel(post_id):
+    return f'post:{post_id}'
+
+
+def business_channel(business_id):
+    return f'business:{business_id}'
+
+
+class Subscription:
+    """한 SSE 연결의 구독. 이벤트는 구독한 이벤트 루프에서 큐에 쌓입니다."""
+
+    def __init__(self, channel, maxsize):
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize)
+        self.overflowed = False
+
+    def deliver(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # 느린 구독자는 쌓인 이벤트를 버리고 resync 로 전체 재조회를 요청
+            self.overflowed = True
+
+    async def get(self):
+        if self.overflowed:
+            self.overflowed = False
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            return {'channel': self.channel, 'type': 'resync'}
+        return await self.queue.get()
+
+
+class Broker:
+    """프로세스 내 발행/구독. publish 는 어느 스레드에서 호출해도 구독자의 이벤트 루프로 전달됩니다."""
+
+    def __init__(self, queue_size=100):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscriptions = defaultdict(set)
+
+    def subscribe(self, channel):
+        subscription = Subscription(channel, self.queue_size)
+        with self._lock:
+            self._subscriptions[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.channel)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.channel]
+
+    def has_subscribers(self, channel):
+        with self._lock:
+            return channel in self._subscriptions
+
+    def publish(self, event):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(event['channel'], ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+            except RuntimeError:  # 이미 닫힌 이벤트 루프
+                self.unsubscribe(subscription)
+
+
+broker = Broker()
+
+
+def event_channel(instance):
+    """게시글은 비즈니스 채널, 댓글은 게시글 채널"""
+    from .models import Post
+
+    if isinstance(instance, Post):
+        return business_channel(instance.business_id)
+    return post_channel(instance.post_id)
+
+
+def build_event(kind, instance, was_public=None):
+    """
+    모델 인스턴스로부터 구독자에게 보낼 이벤트를 생성. visibility 는 구독자별 노출 여부 판단에 사용됩니다.
+    was_public 은 변경 전 공개 여부 (생략하면 현재 값). 수정/삭제된 대상이 변경 전에 보였던 구독자에게만 삭제 이벤트를 보내는 데 사용
+    """
+    from .models import Post
+    from .serializers import CommentSerializer, PostSerializer
+
+    if isinstance(instance, Post):
+        name, data = 'post', PostSerializer(instance).data
+    else:
+        name, data = 'comment', CommentSerializer(instance).data
+    return {
+        'channel': event_channel(instance),
+        'type': f'{name}.{kind}',
+        'data': data,
+        'visibility': {
+            'is_public': instance.is_public,
+            'author_id': instance.author_id,
+            'deleted': instance.deleted_at is not None,
+            'was_public': instance.is_public if was_public is None else was_public,
+        },
+    }
+
+
+def is_visible(event, user):
+    """BoardQuerySet.visible_to 와 같은 기준으로 이벤트의 대상이 사용자에게 보이는지 판단"""
+    if user.role == BusinessMember.BUSINESS_ADMIN:
+        return True
+    visibility = event['visibility']
+    return not visibility['deleted'] and (visibility['is_public'] or visibility['author_id'] == user.pk)
+
+
+def was_visible(event, user):
+    """
+    수정/삭제 이벤트의 대상이 변경 전에 사용자에게 보였는지 판단.
+    삭제된 대상은 수정/삭제할 수 없으므로 변경 전에는 삭제되지 않은 상태이며, 작성자는 바뀌지 않습니다.
+    """
+    if user.role == BusinessMember.BUSINESS_ADMIN:
+        return True
+    visibility = event['visibility']
+    return visibility['was_public'] or visibility['author_id'] == user.pk
+
+
+def format_event(event, user):
+    """
+    SSE 메시지로 직렬화. 보이지 않게 된 대상은 변경 전에 보였던 사용자에게만 id 만 담은 *.deleted 로 보내고,
+    그 외(보이지 않는 대상의 생성 포함)에는 비공개 대상의 id 가 드러나지 않도록 None 을 반환합니다.
+    """
+    name, _, kind = event['type'].partition('.')
+    if event['type'] == 'resync':
+        name, data = 'resync', {}
+    elif is_visible(event, user):
+        name, data = event['type'], event['data']
+    elif kind != 'created' and was_visible(event, user):
+        name, data = name + '.deleted', {'id': event['data']['id']}
+    else:
+        return None
+    return f'event: {name}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n'
+
+
+class LocalBackend:
+    """같은 프로세스의 구독자에게만 전달 (단일 워커 또는 개발 환경)."""
+
+    def send(self, kind, instance, was_public=None):
+        broker.publish(build_event(kind, instance, was_public))
+
+    def send_resync(self, channel):
+        broker.publish({'channel': channel, 'type': 'resync'})
+
+    def ensure_listening(self):
+        pass
+
+
+class PostgresNotifyBackend:
+    """
+    NOTIFY 로 모든 워커에 (채널, 모델, id, 종류)만 전달하고, 각 워커의 LISTEN 스레드가 행을 다시 읽어 Broker 로 발행합니다.
+    NOTIFY 페이로드는 8000 바이트로 제한되므로 본문은 싣지 않으며, 채널을 구독하는 연결이 없는 워커는 행을 읽지 않습니다.
+    """
+
+    def __init__(self):
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def notify(self, payload):
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_notify(%s, %s)', [NOTIFY_CHANNEL, json.dumps(payload)])
+
+    def send(self, kind, instance, was_public=None):
+        # 다른 워커는 변경 후의 행을 다시 읽으므로 변경 전 공개 여부를 함께 전달
+        self.notify({
+            'channel': event_channel(instance), 'model': instance._meta.model_name, 'id': instance.pk, 'kind': kind,
+            'was_public': instance.is_public if was_public is None else was_public,
+        })
+
+    def send_resync(self, channel):
+        self.notify({'channel': channel, 'kind': 'resync'})
+
+    def dispatch(self, payload):
+        from .models import Post, Comment
+
+        message = json.loads(payload)
+        if not broker.has_subscribers(message['channel']):
+            return
+        if message['kind'] == 'resync':
+            broker.publish({'channel': message['channel'], 'type': 'resync'})
+            return
+        model = {'post': Post, 'comment': Comment}[message['model']]
+        close_old_connections()
+        instance = model.objects.select_related('author').filter(pk=message['id']).first()
+        if instance is not None:
+            broker.publish(build_event(message['kind'], instance, message.get('was_public')))
+
+    def ensure_listening(self):
+        """첫 구독 시 워커마다 LISTEN 스레드를 하나 시작"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self.listen_forever, name='board-events-listener', daemon=True)
+                self._thread.start()
+
+    def listen_forever(self):
+        while True:
+            try:
+                self.listen()
+            except Exception:
+                logger.exception('board events listener failed; reconnecting')
+                time.sleep(1)
+
+    def listen(self):
+        wrapper = connections['default']
+        database = wrapper.Database
+        conn = database.connect(**wrapper.get_connection_params())
+        try:
+            conn.autocommit = True
+            conn.cursor().execute(f'LISTEN {NOTIFY_CHANNEL}')
+            if hasattr(conn, 'notifies') and callable(conn.notifies):  # psycopg 3
+                for notify in conn.notifies():
+                    self.dispatch(notify.payload)
+            else:  # psycopg2
+                while True:
+                    if select.select([conn], [], [], 5) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        self.dispatch(conn.notifies.pop(0).payload)
+        finally:
+            conn.close()
+
+
+BACKENDS = {
+    'local': LocalBackend,
+    'postgresql': PostgresNotifyBackend,
+}
+_backend = None
+
+
+def get_backend():
+    global _backend
+    name = getattr(settings, 'BOARD_EVENTS_BACKEND', 'local')
+    if _backend is None or not isinstance(_backend, BACKENDS[name]):
+        _backend = BACKENDS[name]()
+    return _backend
+
+
+def release_connections():
+    """
+    현재 스레드의 DB 연결을 닫음 (연결 풀을 사용하면 풀로 반환). 트랜잭션 중인 연결은 그대로 둡니다.
+    스트리밍 응답은 끝날 때까지 request_finished 가 발생하지 않으므로, SSE 연결이 인증에 쓴 DB 연결을 붙잡지 않도록 호출
+    """
+    for conn in connections.all(initialized_only=True):
+        if not conn.in_atomic_block:
+            conn.close()
+
+
+def publish(kind, instance, was_public=None):
+    """커밋 후 게시글/댓글 이벤트를 발행 (kind: created, updated, deleted). was_public 은 변경 전 공개 여부"""
+    transaction.on_commit(lambda: get_backend().send(kind, instance, was_public))
+
+
+def publish_resync(channel):
+    """일괄 변경처럼 개별 이벤트가 없는 변경 후 구독자에게 전체 재조회를 요청"""
+    transaction.on_commit(lambda: get_backend().send_resync(channel))
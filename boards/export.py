@@ -0,0 +1,124 @@
+# boards/export.py
+
+import csv
+import json
+import zlib
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+# ============================
+# 게시판 내보내기 (PostViewSet.export)
+# - 게시글, 이어서 댓글을 서버 측 커서(iterator)로 chunk_size 행씩 읽어 바로 응답으로 흘려보내므로,
+#   메모리 사용량은 비즈니스의 게시글 수와 무관합니다. 전체 개수(COUNT) 조회도 하지 않습니다.
+# - 행 형식은 가져오기(boards/importer.py)와 같아서 내보낸 파일을 import_board 로 그대로 가져올 수 있습니다.
+# ============================
+
+EXPORT_FIELDS = (
+    'type', 'id', 'post', 'author', 'title', 'content', 'is_public', 'comment_count',
+    'created_at', 'updated_at', 'deleted_at',
+)
+CONTENT_TYPES = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv; charset=utf-8'}
+# 응답에 한 번에 쓰는 최소 크기. ASGI 에서는 덩어리마다 스레드를 오가므로 너무 작지 않게 묶음
+BUFFER_SIZE = 64 * 1024
+
+
+def _isoformat(value):
+    return value.isoformat() if value is not None else None
+
+
+def export_records(posts, comments, chunk_size=2000):
+    """게시글/댓글 쿼리셋을 가져오기 형식의 dict 로 하나씩 생성"""
+    post_fields = ('pk', 'author__username', 'title', 'content', 'is_public', 'comment_count',
+                   'created_at', 'updated_at', 'deleted_at')
+    for pk, author, title, content, is_public, comment_count, created_at, updated_at, deleted_at in (
+        posts.order_by('pk').values_list(*post_fields).iterator(chunk_size=chunk_size)
+    ):
+        yield {
+            'type': 'post', 'id': pk, 'author': author, 'title': title, 'content': content,
+            'is_public': is_public, 'comment_count': comment_count, 'created_at': _isoformat(created_at),
+            'updated_at': _isoformat(updated_at), 'deleted_at': _isoformat(deleted_at),
+        }
+
+    comment_fields = ('pk', 'post_id', 'author__username', 'content', 'is_public', 'created_at', 'updated_at', 'deleted_at')
+    for pk, post_id, author, content, is_public, created_at, updated_at, deleted_at in (
+        comments.order_by('pk').values_list(*comment_fields).iterator(chunk_size=chunk_size)
+    ):
+        yield {
+            'type': 'comment', 'id': pk, 'post': post_id, 'author': author, 'content': content,
+            'is_public': is_public, 'created_at': _isoformat(created_at),
+            'updated_at': _isoformat(updated_at), 'deleted_at': _isoformat(deleted_at),
+        }
+
+
+def render_ndjson(records):
+    for record in records:
+        yield json.dumps(record, ensure_ascii=False) + '\n'
+
+
+class _Echo:
+    """csv.writer 가 쓴 한 줄을 그대로 반환"""
+
+    def write(self, value):
+        return value
+
+
+def render_csv(records):
+    writer = csv.DictWriter(_Echo(), fieldnames=EXPORT_FIELDS)
+    yield writer.writeheader()
+    for record in records:
+        yield writer.writerow(record)
+
+
+def buffered(lines, size=BUFFER_SIZE):
+    """줄들을 size 바이트 이상의 UTF-8 덩어리로 묶음"""
+    parts, length = [], 0
+    for line in lines:
+        data = line.encode()
+        parts.append(data)
+        length += len(data)
+        if length >= size:
+            yield b''.join(parts)
+            parts, length = [], 0
+    if parts:
+        yield b''.join(parts)
+
+
+def gzipped(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31: gzip 헤더 포함
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+async def _aiterate(iterator):
+    """
+    동기 반복자를 비동기로 소비. StreamingHttpResponse 는 ASGI 에서 동기 반복자를 끝까지 읽어 메모리에 모으므로,
+    덩어리마다 같은 스레드(thread_sensitive)에서 next() 를 호출해 서버 측 커서를 유지한 채 흘려보냄
+    """
+    done = object()
+    while (chunk := await sync_to_async(next)(iterator, done)) is not done:
+        yield chunk
+
+
+def export_response(request, posts, comments, output='ndjson', compress=False, filename='board'):
+    """posts, comments 를 output(ndjson/csv) 형식으로 스트리밍하는 응답. compress 이면 .gz 파일로 내려줌"""
+    render = render_csv if output == 'csv' else render_ndjson
+    content = buffered(render(export_records(posts, comments)))
+    filename = f'{filename}-{timezone.localdate():%Y%m%d}.{output}'
+    content_type = CONTENT_TYPES[output]
+    if compress:
+        content = gzipped(content)
+        filename += '.gz'
+        content_type = 'application/gzip'
+    if isinstance(request, ASGIRequest):
+        content = _aiterate(content)
+
+    response = StreamingHttpResponse(content, content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    response['Cache-Control'] = 'no-store'
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -0,0 +1,53 @@
+# boards/filters.py
+
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections
+from django.db.models import F
+from rest_framework import filters
+
+# tsquery 연산자(&, |, !, :, 괄호 등)가 섞이지 않도록 검색어에서 단어 문자만 추출
+WORD_RE = re.compile(r'\w+')
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """
+    ?search= 파라미터를 PostgreSQL 전문 검색으로 처리하는 필터.
+    - PostgreSQL: search_vector(tsvector) 컬럼과 GIN 인덱스로 검색하고, ordering 파라미터가 없으면 관련도 순으로 정렬
+    - 그 외 DB(SQLite 등): 기존 SearchFilter 와 같이 search_fields 에 대한 icontains 검색
+    각 단어는 접두어 검색(단어:*)으로 처리되어 입력 중인 단어도 찾을 수 있습니다.
+    OrderingFilter 의 정렬을 관련도 순으로 덮어쓰기 위해 filter_backends 에서 OrderingFilter 뒤에 둡니다.
+    """
+    search_config = 'simple'
+    vector_field = 'search_vector'
+    rank_annotation = 'search_rank'
+
+    def filter_queryset(self, request, queryset, view):
+        if connections[queryset.db].vendor != 'postgresql':
+            return super().filter_queryset(request, queryset, view)
+
+        query = self.get_search_query(request)
+        if query is None:
+            return queryset
+
+        queryset = queryset.filter(**{self.vector_field: query})
+        if request.query_params.get(self.get_ordering_param()):
+            return queryset
+        return queryset.annotate(
+            **{self.rank_annotation: SearchRank(F(self.vector_field), query)}
+        ).order_by(f'-{self.rank_annotation}', *queryset.query.order_by)
+
+    def get_search_query(self, request):
+        words = [word for term in self.get_search_terms(request) for word in WORD_RE.findall(term)]
+        if not words:
+            return None
+        return SearchQuery(
+            ' & '.join(f'{word}:*' for word in words),
+            config=self.search_config,
+            search_type='raw',
+        )
+
+    @staticmethod
+    def get_ordering_param():
+        return filters.OrderingFilter.ordering_param
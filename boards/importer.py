@@ -0,0 +1,295 @@
+# boards/importer.py
+
+import csv
+import io
+import json
+import time
+from collections import Counter
+from datetime import datetime
+from itertools import islice
+from django.db import connection, transaction
+from authentication.models import BusinessMember
+from .cache import invalidate_board_cache
+from .models import Post, Comment
+from .serializers import ImportPostSerializer, ImportCommentSerializer
+from . import events
+
+# ============================
+# 게시판 가져오기 (import_board 명령, 관리자 가져오기 API)
+# - JSONL/CSV 입력을 한 행씩 읽어 chunk_size 행 단위로 검증하고 기록하므로, 메모리는 입력 크기와 무관하게
+#   청크 크기와 (원본 게시글 id -> 새 id) 매핑에만 비례합니다.
+# - 행의 type 은 post 또는 comment 이며, 댓글은 앞서 가져온 게시글을 원본 id(post)로 참조합니다.
+# - PostgreSQL 에서는 COPY 로 기록하고(게시글 id 는 시퀀스에서 미리 발급), 그 외 DB 에서는 bulk_create 를 사용합니다.
+#   어느 쪽이든 created_at/updated_at 은 원본 값을 유지합니다.
+# - 청크마다 별도 트랜잭션으로 커밋되며, 잘못된 행은 건너뛰고 줄 번호와 함께 보고합니다.
+# ============================
+
+ROW_SERIALIZERS = {'post': ImportPostSerializer, 'comment': ImportCommentSerializer}
+POST_COLUMNS = (
+    'id', 'business_id', 'author_id', 'title', 'content', 'is_public', 'comment_count',
+    'deleted_at', 'created_at', 'updated_at',
+)
+COMMENT_COLUMNS = ('post_id', 'business_id', 'author_id', 'content', 'is_public', 'deleted_at', 'created_at', 'updated_at')
+# 보고서에 담을 최대 오류 수 (건너뛴 행 수는 모두 집계)
+MAX_REPORTED_ERRORS = 100
+
+
+class BoardImportError(Exception):
+    """가져오기를 시작할 수 없는 오류 (형식, 기본 작성자 등)"""
+
+
+def detect_format(name):
+    """파일 이름의 확장자로 입력 형식을 판단"""
+    lowered = (name or '').lower()
+    if lowered.endswith(('.jsonl', '.ndjson', '.json')):
+        return 'jsonl'
+    if lowered.endswith('.csv'):
+        return 'csv'
+    raise BoardImportError(f'입력 형식을 알 수 없습니다: {name} (jsonl 또는 csv 를 지정하세요)')
+
+
+def read_rows(stream, format):
+    """
+    텍스트 스트림에서 (줄 번호, 행) 을 하나씩 생성. 읽을 수 없는 행은 dict 대신 오류 메시지(str)를 생성합니다.
+    CSV 의 빈 칸은 값을 생략한 것으로 처리합니다 (content 제외).
+    """
+    if format == 'jsonl':
+        for line_number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield line_number, f'JSON 을 읽을 수 없습니다: {e}'
+                continue
+            yield line_number, row if isinstance(row, dict) else 'JSON 객체가 아닙니다.'
+    elif format == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, {
+                key: value for key, value in row.items()
+                if key and value is not None and (value != '' or key == 'content')
+            }
+    else:
+        raise BoardImportError(f'지원하지 않는 입력 형식입니다: {format}')
+
+
+def _copy_value(value):
+    """COPY text 형식의 값"""
+    if value is None:
+        return r'\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+
+def copy_rows(table, columns, rows):
+    """PostgreSQL COPY ... FROM STDIN 으로 rows(dict 목록) 를 기록 (psycopg2, psycopg 3 모두 지원)"""
+    quote = connection.ops.quote_name
+    sql = f'COPY {quote(table)} ({", ".join(quote(column) for column in columns)}) FROM STDIN'
+    with connection.cursor() as cursor:
+        raw = cursor.cursor
+        if hasattr(raw, 'copy_expert'):  # psycopg2
+            buffer = io.StringIO()
+            for row in rows:
+                buffer.write('\t'.join(_copy_value(row[column]) for column in columns) + '\n')
+            buffer.seek(0)
+            raw.copy_expert(sql, buffer)
+        else:  # psycopg 3
+            with raw.copy(sql) as copy:
+                for row in rows:
+                    copy.write_row([row[column] for column in columns])
+
+
+class ImportReport:
+    """가져오기 진행 상황과 결과"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.posts = 0
+        self.comments = 0
+        self.skipped = 0
+        self.errors = []
+
+    @property
+    def rows(self):
+        return self.posts + self.comments + self.skipped
+
+    @property
+    def seconds(self):
+        return time.perf_counter() - self.start
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def add_error(self, line, detail):
+        self.skipped += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'line': line, 'errors': detail})
+
+    def as_dict(self):
+        return {
+            'posts': self.posts,
+            'comments': self.comments,
+            'skipped': self.skipped,
+            'errors': self.errors,
+            'seconds': round(self.seconds, 3),
+            'rows_per_second': round(self.rows_per_second, 1),
+        }
+
+
+class BoardImporter:
+    """
+    business 의 게시판으로 행을 가져옴.
+    - default_author: 작성자를 찾을 수 없는 행에 사용할 username (없으면 해당 행을 건너뜀)
+    - id_map: 이전 실행에서 가져온 (원본 게시글 id -> 새 id). 이미 있는 원본 id 의 게시글은 다시 가져오지 않음
+    - progress: 청크를 기록할 때마다 ImportReport 와 함께 호출
+    """
+
+    def __init__(self, business, chunk_size=1000, use_copy=None, default_author=None, id_map=None, progress=None):
+        self.business = business
+        self.chunk_size = chunk_size
+        self.use_copy = connection.vendor == 'postgresql' if use_copy is None else use_copy
+        self.id_map = {} if id_map is None else id_map
+        self.progress = progress
+        self.members = {}  # username -> 구성원 id (없으면 None)
+        self.default_author_id = None
+        if default_author:
+            self.default_author_id = self.resolve_members({default_author}).get(default_author)
+            if self.default_author_id is None:
+                raise BoardImportError(f'기본 작성자 {default_author} 가 비즈니스 구성원이 아닙니다.')
+        self.report = ImportReport()
+
+    def run(self, rows):
+        """(줄 번호, 행) 반복자를 끝까지 가져오고 ImportReport 를 반환"""
+        rows = iter(rows)
+        while chunk := list(islice(rows, self.chunk_size)):
+            self.import_chunk(chunk)
+            if self.progress:
+                self.progress(self.report)
+        if self.report.posts or self.report.comments:
+            invalidate_board_cache()
+            events.publish_resync(events.business_channel(self.business.pk))
+        return self.report
+
+    def resolve_members(self, usernames):
+        """username -> 구성원 id. 처음 보는 username 만 조회하여 캐시"""
+        missing = usernames - self.members.keys()
+        if missing:
+            found = dict(
+                BusinessMember.objects.filter(business=self.business, username__in=missing)
+                .values_list('username', 'pk')
+            )
+            self.members.update({username: found.get(username) for username in missing})
+        return self.members
+
+    def validate(self, chunk):
+        """검증된 (줄 번호, type, 데이터) 목록. 잘못된 행은 보고서에 기록"""
+        valid = []
+        for line, row in chunk:
+            if isinstance(row, str):
+                self.report.add_error(line, {'non_field_errors': [row]})
+                continue
+            row_type = row.get('type', 'post')
+            serializer_class = ROW_SERIALIZERS.get(row_type)
+            if serializer_class is None:
+                self.report.add_error(line, {'type': [f'post 또는 comment 이어야 합니다: {row_type}']})
+                continue
+            serializer = serializer_class(data=row)
+            if not serializer.is_valid():
+                self.report.add_error(line, serializer.errors)
+                continue
+            valid.append((line, row_type, serializer.validated_data))
+        return valid
+
+    def build_row(self, line, data):
+        """모델 컬럼 값 dict. 작성자를 찾을 수 없으면 None"""
+        author_id = self.members.get(data['author']) or self.default_author_id
+        if author_id is None:
+            self.report.add_error(line, {'author': [f'비즈니스 구성원이 아닙니다: {data["author"]}']})
+            return None
+        return {
+            'business_id': self.business.pk,
+            'author_id': author_id,
+            'content': data['content'],
+            'is_public': data['is_public'],
+            'deleted_at': data.get('deleted_at'),
+            'created_at': data['created_at'],
+            'updated_at': data.get('updated_at') or data['created_at'],
+        }
+
+    def import_chunk(self, chunk):
+        valid = self.validate(chunk)
+        self.resolve_members({data['author'] for line, row_type, data in valid})
+
+        posts, sources, comments = [], [], []
+        for line, row_type, data in valid:
+            if row_type == 'post':
+                source = data.get('id')
+                if source is not None and (source in self.id_map or source in sources):
+                    self.report.add_error(line, {'id': [f'이미 가져온 게시글입니다: {source}']})
+                    continue
+                row = self.build_row(line, data)
+                if row is not None:
+                    posts.append(dict(row, title=data['title'], comment_count=0))
+                    sources.append(source)
+            else:
+                comments.append((line, data))
+
+        # 청크가 롤백되면 그 게시글 id 가 매핑(--id-map 파일)에 남지 않도록 커밋된 뒤에 self.id_map 에 합침
+        chunk_map = {}
+        with transaction.atomic():
+            if posts:
+                for source, pk in zip(sources, self.write_posts(posts)):
+                    if source is not None:
+                        chunk_map[source] = pk
+
+            rows = []
+            for line, data in comments:
+                post_id = chunk_map.get(data['post']) or self.id_map.get(data['post'])
+                if post_id is None:
+                    self.report.add_error(line, {'post': [f'가져온 게시글이 아닙니다: {data["post"]}']})
+                    continue
+                row = self.build_row(line, data)
+                if row is not None:
+                    rows.append(dict(row, post_id=post_id))
+            if rows:
+                self.write_comments(rows)
+                Post.adjust_comment_counts(Counter(row['post_id'] for row in rows if row['deleted_at'] is None))
+        self.id_map.update(chunk_map)
+
+        self.report.posts += len(posts)
+        self.report.comments += len(rows)
+
+    def write_posts(self, rows):
+        """게시글을 기록하고 새 id 목록을 rows 순서대로 반환"""
+        if self.use_copy:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT nextval(pg_get_serial_sequence(%s, 'id')) FROM generate_series(1, %s)",
+                    [Post._meta.db_table, len(rows)],
+                )
+                ids = [row[0] for row in cursor.fetchall()]
+            copy_rows(Post._meta.db_table, POST_COLUMNS, [dict(row, id=pk) for pk, row in zip(ids, rows)])
+            return ids
+        posts = Post.objects.bulk_create([Post(**row) for row in rows])
+        self.restore_timestamps(Post, posts, rows)
+        return [post.pk for post in posts]
+
+    def write_comments(self, rows):
+        if self.use_copy:
+            copy_rows(Comment._meta.db_table, COMMENT_COLUMNS, rows)
+            return
+        comments = Comment.objects.bulk_create([Comment(**row) for row in rows])
+        self.restore_timestamps(Comment, comments, rows)
+
+    @staticmethod
+    def restore_timestamps(model, objects, rows):
+        """bulk_create 에서 auto_now_add/auto_now 가 덮어쓴 원본 created_at/updated_at 을 다시 기록"""
+        for obj, row in zip(objects, rows):
+            obj.created_at = row['created_at']
+            obj.updated_at = row['updated_at']
+        model.objects.bulk_update(objects, ['created_at', 'updated_at'])
@@ -0,0 +1,52 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from boards.archive import archive_comment_batch, archive_post_batch, retention_cutoff
+from boards.cache import invalidate_board_cache
+from boards.models import Post, Comment
+
+
+class Command(BaseCommand):
+    help = (
+        "보존 기간보다 오래전에 논리적 삭제된 게시글/댓글을 보관 테이블로 옮깁니다. "
+        "배치마다 커밋하므로 중단되면 다시 실행하여 이어서 처리할 수 있습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.BOARD_ARCHIVE_RETENTION_DAYS,
+                            help='보존 기간(일). 이보다 오래전에 삭제된 행을 옮김')
+        parser.add_argument('--batch-size', type=int, default=1000, help='한 트랜잭션에서 옮길 행 수')
+        parser.add_argument('--max-batches', type=int, default=0, help='실행당 최대 배치 수 (0 이면 제한 없음)')
+        parser.add_argument('--sleep', type=float, default=0.0, help='배치 사이 대기 시간(초). 운영 중 부하를 줄일 때 사용')
+        parser.add_argument('--dry-run', action='store_true', help='옮기지 않고 대상 행 수만 출력')
+
+    def handle(self, *args, **options):
+        cutoff = retention_cutoff(options['days'])
+        if options['dry_run']:
+            posts = Post.objects.filter(deleted_at__lt=cutoff).count()
+            comments = Comment.objects.filter(Q(deleted_at__lt=cutoff) | Q(post__deleted_at__lt=cutoff)).count()
+            self.stdout.write(f'{cutoff:%Y-%m-%d %H:%M} 이전 삭제: 게시글 {posts}개, 댓글 {comments}개')
+            return
+
+        # 삭제된 댓글을 먼저 옮겨 게시글 배치에서 함께 옮길 댓글을 적게 유지 (삭제된 게시글의 다른 댓글은 게시글과 함께)
+        self.batches = 0
+        comments = self.run_batches(archive_comment_batch, cutoff, options)
+        posts = self.run_batches(archive_post_batch, cutoff, options)
+        if posts or comments:
+            invalidate_board_cache()  # 관리자 목록에는 삭제된 행도 보임
+        self.stdout.write(self.style.SUCCESS(f'게시글 {posts}개, 댓글 {comments}개 보관'))
+
+    def run_batches(self, archive_batch, cutoff, options):
+        moved = last_id = 0
+        max_batches = options['max_batches']
+        while not max_batches or self.batches < max_batches:
+            ids = archive_batch(cutoff, options['batch_size'], after=last_id)
+            if not ids:
+                break
+            self.batches += 1
+            moved += len(ids)
+            last_id = ids[-1]
+            if options['sleep']:
+                time.sleep(options['sleep'])
+        return moved
@@ -0,0 +1,80 @@
+import csv
+import sys
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from authentication.models import Business
+from boards.importer import BoardImportError, BoardImporter, detect_format, read_rows
+
+
+class Command(BaseCommand):
+    help = (
+        "JSONL/CSV 파일의 게시글/댓글을 비즈니스 게시판으로 가져옵니다. "
+        "행의 type(post/comment), author(username), created_at 등은 README 의 가져오기 형식을 따릅니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('business_id', type=int, help='대상 비즈니스 id')
+        parser.add_argument('paths', nargs='+', help='입력 파일 (- 이면 표준 입력). 게시글 파일을 댓글 파일보다 먼저 지정')
+        parser.add_argument('--format', choices=['jsonl', 'csv'], help='입력 형식 (기본: 확장자로 판단)')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='한 트랜잭션에서 검증/기록할 행 수')
+        parser.add_argument('--no-copy', action='store_true', help='PostgreSQL 에서도 COPY 대신 bulk_create 사용')
+        parser.add_argument('--default-author', help='작성자를 찾을 수 없는 행에 사용할 username')
+        parser.add_argument('--id-map', help='원본 게시글 id -> 새 id 매핑 CSV. 있으면 읽어서 이어 가져오고, 끝나면 갱신')
+
+    def handle(self, *args, **options):
+        try:
+            business = Business.objects.get(pk=options['business_id'])
+        except Business.DoesNotExist:
+            raise CommandError(f'비즈니스 {options["business_id"]} 가 없습니다.')
+
+        id_map = self.load_id_map(options['id_map'])
+        try:
+            importer = BoardImporter(
+                business,
+                chunk_size=options['chunk_size'],
+                use_copy=False if options['no_copy'] else None,
+                default_author=options['default_author'],
+                id_map=id_map,
+                progress=self.write_progress,
+            )
+            try:
+                for path in options['paths']:
+                    format = options['format'] or detect_format(path)
+                    if path == '-':
+                        importer.run(read_rows(sys.stdin, format))
+                        continue
+                    with open(path, newline='', encoding='utf-8-sig') as stream:
+                        importer.run(read_rows(stream, format))
+            finally:
+                # 중단되어도 커밋된 청크의 매핑은 남겨 다음 실행에서 이어 가져올 수 있도록 함
+                self.save_id_map(options['id_map'], id_map)
+        except BoardImportError as e:
+            raise CommandError(str(e))
+
+        report = importer.report
+        for error in report.errors:
+            self.stderr.write(f'{error["line"]}행: {error["errors"]}')
+        self.stdout.write(self.style.SUCCESS(
+            f'게시글 {report.posts}개, 댓글 {report.comments}개 가져옴, {report.skipped}행 건너뜀 '
+            f'({report.seconds:.1f}초, {report.rows_per_second:.0f}행/초)'
+        ))
+
+    def write_progress(self, report):
+        self.stdout.write(
+            f'{report.rows}행 처리 (게시글 {report.posts}, 댓글 {report.comments}, 건너뜀 {report.skipped}) '
+            f'{report.rows_per_second:.0f}행/초'
+        )
+
+    @staticmethod
+    def load_id_map(path):
+        if not path or not Path(path).exists():
+            return {}
+        with open(path, newline='') as stream:
+            return {source: int(pk) for source, pk in csv.reader(stream)}
+
+    @staticmethod
+    def save_id_map(path, id_map):
+        if not path:
+            return
+        with open(path, 'w', newline='') as stream:
+            csv.writer(stream).writerows(id_map.items())
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+from authentication.models import Business
+from boards.partitioning import (
+    PartitioningError, create_business_partition, detach_business_partition, list_partitions,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "비즈니스의 게시글/댓글을 전용 파티션으로 옮기거나(기본), 전용 파티션을 분리/삭제합니다. "
+        "PostgreSQL 에서 게시글/댓글 테이블이 분할되어 있어야 합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('business_ids', nargs='*', type=int, help='대상 비즈니스 id')
+        parser.add_argument('--list', action='store_true', help='파티션 목록과 추정 행 수를 출력')
+        parser.add_argument('--detach', action='store_true', help='전용 파티션을 분리 (테이블은 남김)')
+        parser.add_argument('--drop', action='store_true', help='--detach 와 함께 사용하면 분리한 테이블을 삭제')
+
+    def handle(self, *args, **options):
+        if options['drop'] and not options['detach']:
+            raise CommandError('--drop 은 --detach 와 함께 사용해야 합니다.')
+
+        try:
+            if options['list']:
+                for table, name, bound, rows in list_partitions():
+                    self.stdout.write(f'{table}\t{name}\t{bound}\t~{rows}')
+                return
+
+            if not options['business_ids']:
+                raise CommandError('비즈니스 id 를 지정하거나 --list 를 사용하세요.')
+            for business_id in options['business_ids']:
+                if options['detach']:
+                    detached = detach_business_partition(business_id, drop=options['drop'])
+                    action = '삭제' if options['drop'] else '분리'
+                    self.stdout.write(self.style.SUCCESS(f'비즈니스 {business_id}: {", ".join(detached)} {action}'))
+                else:
+                    if not Business.objects.filter(pk=business_id).exists():
+                        raise CommandError(f'비즈니스 {business_id} 가 없습니다.')
+                    moved = create_business_partition(business_id)
+                    summary = ', '.join(f'{table} {count}행' for table, count in moved)
+                    self.stdout.write(self.style.SUCCESS(f'비즈니스 {business_id}: 전용 파티션으로 이동 ({summary})'))
+        except PartitioningError as e:
+            raise CommandError(str(e))
@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from boards.models import Post, Comment
+
+
+def live_comment_count():
+    """게시글별 삭제되지 않은 댓글 수 서브쿼리"""
+    return Coalesce(Subquery(
+        Comment.objects.filter(post=OuterRef('pk'), deleted_at__isnull=True)
+        .order_by().values('post').annotate(count=Count('pk')).values('count')
+    ), 0)
+
+
+class Command(BaseCommand):
+    help = "Post.comment_count 를 실제 댓글 수로 재계산합니다. 게시글 id 순으로 배치 단위로 처리합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='한 트랜잭션에서 처리할 게시글 수')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        last_id = 0
+        checked = fixed = 0
+
+        while True:
+            with transaction.atomic():
+                # 배치의 게시글을 잠근 뒤 재계산하여, 동시에 진행 중인 댓글 생성/삭제의 증감이 덮어써지지 않도록 함
+                ids = list(
+                    Post.objects.select_for_update().filter(pk__gt=last_id)
+                    .order_by('pk').values_list('pk', flat=True)[:batch_size]
+                )
+                if not ids:
+                    break
+                fixed += (
+                    Post.objects.filter(pk__in=ids)
+                    .annotate(actual=live_comment_count())
+                    .exclude(comment_count=F('actual'))
+                    .update(comment_count=live_comment_count())
+                )
+            checked += len(ids)
+            last_id = ids[-1]
+
+        self.stdout.write(self.style.SUCCESS(f'{checked}개 게시글 확인, {fixed}개 comment_count 수정'))
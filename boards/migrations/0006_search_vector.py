@@ -0,0 +1,82 @@
+# Generated by Django 5.1.1 on 2026-10-18 15:27
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# 검색 설정은 boards.filters.FullTextSearchFilter.search_config 와 일치해야 합니다.
+# 한국어 사전이 없으므로 형태소 분석 없이 공백 기준으로 토큰화하는 'simple' 을 사용합니다.
+FORWARD_SQL = [
+    """
+    CREATE OR REPLACE FUNCTION boards_post_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('simple', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(NEW.content, '')), 'B');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER boards_post_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, content ON boards_post
+    FOR EACH ROW EXECUTE FUNCTION boards_post_search_vector_update()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION boards_comment_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := to_tsvector('simple', coalesce(NEW.content, ''));
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER boards_comment_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF content ON boards_comment
+    FOR EACH ROW EXECUTE FUNCTION boards_comment_search_vector_update()
+    """,
+    # 기존 행 채우기 (트리거가 다시 계산)
+    "UPDATE boards_post SET title = title",
+    "UPDATE boards_comment SET content = content",
+    "CREATE INDEX post_search_vector_idx ON boards_post USING gin (search_vector)",
+    "CREATE INDEX comment_search_vector_idx ON boards_comment USING gin (search_vector)",
+]
+
+REVERSE_SQL = [
+    "DROP INDEX IF EXISTS comment_search_vector_idx",
+    "DROP INDEX IF EXISTS post_search_vector_idx",
+    "DROP TRIGGER IF EXISTS boards_comment_search_vector_trigger ON boards_comment",
+    "DROP FUNCTION IF EXISTS boards_comment_search_vector_update()",
+    "DROP TRIGGER IF EXISTS boards_post_search_vector_trigger ON boards_post",
+    "DROP FUNCTION IF EXISTS boards_post_search_vector_update()",
+]
+
+
+def _run_on_postgresql(statements):
+    def run(apps, schema_editor):
+        # tsvector 트리거와 GIN 인덱스는 PostgreSQL 전용 (SQLite 등에서는 건너뜀)
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0005_post_comment_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(_run_on_postgresql(FORWARD_SQL), _run_on_postgresql(REVERSE_SQL)),
+    ]
@@ -0,0 +1,29 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_comment_count(apps, schema_editor):
+    Post = apps.get_model('boards', 'Post')
+    Comment = apps.get_model('boards', 'Comment')
+    live_comments = (
+        Comment.objects.filter(post=OuterRef('pk'), deleted_at__isnull=True)
+        .order_by().values('post').annotate(count=Count('pk')).values('count')
+    )
+    Post.objects.update(comment_count=Coalesce(Subquery(live_comments), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0006_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_comment_count, migrations.RunPython.noop),
+    ]
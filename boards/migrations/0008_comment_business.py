@@ -0,0 +1,40 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_comment_business(apps, schema_editor):
+    Post = apps.get_model('boards', 'Post')
+    Comment = apps.get_model('boards', 'Comment')
+    Comment.objects.update(business=Subquery(Post.objects.filter(pk=OuterRef('post_id')).values('business')[:1]))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0001_initial'),
+        ('boards', '0007_post_comment_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='business',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE,
+                                    related_name='comments', to='authentication.business'),
+        ),
+        migrations.RunPython(backfill_comment_business, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='comment',
+            name='business',
+            field=models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE,
+                                    related_name='comments', to='authentication.business'),
+        ),
+        # 분할된 boards_post 의 기본 키는 (id, business_id) 이므로 post_id 만으로는 외래 키 제약을 걸 수 없음
+        migrations.AlterField(
+            model_name='comment',
+            name='post',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE,
+                                    related_name='comments', to='boards.post'),
+        ),
+    ]
@@ -0,0 +1,98 @@
+from django.db import migrations
+
+# 게시글/댓글 테이블을 business_id 기준 LIST 분할 테이블로 변환 (PostgreSQL 전용, 그 외 DB 에서는 건너뜀)
+# - 모든 비즈니스의 행은 우선 DEFAULT 파티션(<table>_default)에 저장되며, 큰 비즈니스는
+#   partition_business 명령으로 전용 파티션으로 옮깁니다 (boards/partitioning.py).
+# - 분할 테이블의 기본 키/유일 제약에는 분할 키가 포함되어야 하므로 기본 키는 (id, business_id) 이고,
+#   id 는 모든 파티션이 공유하는 시퀀스로 발급됩니다.
+# - 기존 인덱스, CHECK/외래 키 제약, 트리거(search_vector)는 원래 이름 그대로 부모 테이블에 다시 만들어져
+#   모든 파티션에 적용됩니다.
+# - 기존 행을 새 테이블로 복사하므로 행이 많으면 점검 시간에 적용합니다.
+TABLES = ('boards_post', 'boards_comment')
+PARTITION_KEY = 'business_id'
+
+
+def _table_definition(cursor, table):
+    """기본 키를 제외한 인덱스, CHECK/외래 키 제약, 트리거 정의"""
+    cursor.execute(
+        "SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'p'", [table],
+    )
+    primary_key = cursor.fetchone()[0]
+    cursor.execute(
+        'SELECT indexname, indexdef FROM pg_indexes WHERE schemaname = current_schema() AND tablename = %s',
+        [table],
+    )
+    # 분할 테이블의 인덱스 정의는 'ON ONLY' 로 표시되며, 그대로 만들면 파티션에 전파되지 않음
+    indexes = [definition.replace(' ON ONLY ', ' ON ') for name, definition in cursor.fetchall() if name != primary_key]
+    cursor.execute(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE conrelid = %s::regclass AND contype IN ('c', 'f') ORDER BY conname",
+        [table],
+    )
+    constraints = cursor.fetchall()
+    cursor.execute(
+        'SELECT pg_get_triggerdef(oid) FROM pg_trigger WHERE tgrelid = %s::regclass AND NOT tgisinternal', [table],
+    )
+    triggers = [row[0] for row in cursor.fetchall()]
+    return primary_key, indexes, constraints, triggers
+
+
+def _rebuild(schema_editor, table, partitioned):
+    """table 을 같은 이름의 (분할 또는 일반) 테이블로 다시 만들고 행과 정의를 옮김"""
+    quote = schema_editor.quote_name
+    old = f'{table}__old'
+    with schema_editor.connection.cursor() as cursor:
+        primary_key, indexes, constraints, triggers = _table_definition(cursor, table)
+
+    partition_by = f' PARTITION BY LIST ({quote(PARTITION_KEY)})' if partitioned else ''
+    key_columns = f'{quote("id")}, {quote(PARTITION_KEY)}' if partitioned else quote('id')
+    sequence = f'{table}_id_seq'
+
+    schema_editor.execute(f'ALTER TABLE {quote(table)} RENAME TO {quote(old)}')
+    schema_editor.execute(f'CREATE TABLE {quote(table)} (LIKE {quote(old)} INCLUDING DEFAULTS){partition_by}')
+    # id 기본값(기존 시퀀스/identity)은 기존 테이블과 함께 삭제되므로 새 시퀀스로 교체
+    schema_editor.execute(f'ALTER TABLE {quote(table)} ALTER COLUMN {quote("id")} DROP DEFAULT')
+    if partitioned:
+        schema_editor.execute(f'CREATE TABLE {quote(table + "_default")} PARTITION OF {quote(table)} DEFAULT')
+    schema_editor.execute(f'INSERT INTO {quote(table)} SELECT * FROM {quote(old)}')
+    schema_editor.execute(f'DROP TABLE {quote(old)} CASCADE')
+
+    schema_editor.execute(f'CREATE SEQUENCE {quote(sequence)} AS bigint OWNED BY {quote(table)}.{quote("id")}')
+    schema_editor.execute(
+        f"SELECT setval('{sequence}', COALESCE(MAX({quote('id')}), 0) + 1, false) FROM {quote(table)}"
+    )
+    schema_editor.execute(
+        f"ALTER TABLE {quote(table)} ALTER COLUMN {quote('id')} SET DEFAULT nextval('{sequence}')"
+    )
+    schema_editor.execute(f'ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(primary_key)} PRIMARY KEY ({key_columns})')
+    for definition in indexes:
+        schema_editor.execute(definition)
+    for name, definition in constraints:
+        schema_editor.execute(f'ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(name)} {definition}')
+    for definition in triggers:
+        schema_editor.execute(definition)
+
+
+def partition_tables(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table in TABLES:
+        _rebuild(schema_editor, table, partitioned=True)
+
+
+def unpartition_tables(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table in reversed(TABLES):
+        _rebuild(schema_editor, table, partitioned=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0008_comment_business'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_tables, unpartition_tables),
+    ]
@@ -1,8 +1,35 @@
-from django.db import models
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
+from django.db.models import Case, F, Q, Value, When
+from django.db.models.functions import Greatest
 from django.utils import timezone
 from authentication.models import Business, BusinessMember
 
+class BoardQuerySet(models.QuerySet):
+    @staticmethod
+    def visibility_filter(user):
+        """
+        사용자에게 보이는 게시글/댓글 조건. None 이면 제한 없음.
+        - Admin: 삭제된 것을 포함한 전체
+        - Member: 삭제되지 않은 공개 글과 자신이 작성한 글
+        """
+        if user.role == BusinessMember.BUSINESS_ADMIN:
+            return None
+        return Q(Q(is_public=True) | Q(author=user), deleted_at__isnull=True)
+
+    def visible_to(self, user):
+        """사용자에게 보이는 게시글/댓글만 남김."""
+        condition = self.visibility_filter(user)
+        return self if condition is None else self.filter(condition)
+
+class BoardManager(models.Manager.from_queryset(BoardQuerySet)):
+    """search_vector 는 검색 조건/정렬에만 쓰이므로 조회 시 기본으로 불러오지 않습니다."""
+
+    def get_queryset(self):
+        return super().get_queryset().defer('search_vector')
+
 class Post(models.Model):
+    # PostgreSQL 에서는 게시글/댓글 테이블이 business_id 로 LIST 분할됨 (boards/migrations/0009_partition_by_business.py)
     business = models.ForeignKey(Business, on_delete=models.CASCADE, related_name='posts')
     author = models.ForeignKey(BusinessMember, on_delete=models.CASCADE, related_name='posts')
     title = models.CharField(max_length=255)
@@ -11,6 +38,24 @@ class Post(models.Model):
     deleted_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # 전문 검색용 tsvector. PostgreSQL에서는 트리거가 title/content 로부터 유지하고 GIN 인덱스를 가짐
+    # (boards/migrations/0006_search_vector.py). 그 외 DB에서는 NULL 로 남고 검색은 icontains 로 동작
+    search_vector = SearchVectorField(null=True, editable=False)
+    # 삭제되지 않은 댓글 수. 댓글 생성/삭제/복구 시 F() 로 갱신되며, 어긋나면 recount_comments 명령으로 재계산
+    comment_count = models.PositiveIntegerField(default=0, editable=False)
+
+    objects = BoardManager()
+
+    class Meta:
+        indexes = [
+            # 관리자 목록: 삭제 여부와 무관하게 최신순 정렬
+            models.Index(fields=['-created_at', '-id'], name='post_created_idx'),
+            # 일반 사용자 목록: 삭제되지 않은 게시글만 최신순 정렬 (부분 인덱스)
+            models.Index(fields=['-created_at', '-id'], name='post_live_created_idx',
+                         condition=Q(deleted_at__isnull=True)),
+            # my_posts: 작성자별 최신순 정렬
+            models.Index(fields=['author', '-created_at'], name='post_author_created_idx'),
+        ]
 
     def soft_delete(self):
         """Marks the post as deleted by setting deleted_at to current time."""
@@ -27,26 +72,130 @@ class Post(models.Model):
         """Checks if the post is marked as deleted."""
         return self.deleted_at is not None
 
+    @classmethod
+    def adjust_comment_count(cls, post_id, delta):
+        """
+        Atomically adds delta to the post's comment_count without reading it first.
+        Never goes below zero, so comments written outside the API only leave drift for recount_comments to fix.
+        """
+        cls.objects.filter(pk=post_id).update(comment_count=Greatest(F('comment_count') + delta, 0))
+
+    @classmethod
+    def adjust_comment_counts(cls, deltas):
+        """Applies {post_id: delta} to several posts in a single UPDATE."""
+        deltas = {post_id: delta for post_id, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        delta = Case(*[When(pk=post_id, then=Value(d)) for post_id, d in deltas.items()], default=Value(0))
+        cls.objects.filter(pk__in=deltas).update(comment_count=Greatest(F('comment_count') + delta, 0))
+
 class Comment(models.Model):
-    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='comments')
+    # PostgreSQL 에서 boards_post 는 business_id 로 분할되어 (id, business_id) 가 기본 키이므로 DB 외래 키 제약은 두지 않음
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='comments', db_constraint=False)
+    # 분할 키로 쓰기 위해 게시글의 business 를 복제. 저장 시 post 로부터 채워짐
+    business = models.ForeignKey(Business, on_delete=models.CASCADE, related_name='comments', editable=False)
     author = models.ForeignKey(BusinessMember, on_delete=models.CASCADE, related_name='comments')
     content = models.TextField()
     is_public = models.BooleanField(default=True)
     deleted_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # 전문 검색용 tsvector. PostgreSQL에서는 트리거가 content 로부터 유지 (Post.search_vector 참고)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = BoardManager()
+
+    class Meta:
+        indexes = [
+            # 게시글 상세의 댓글 목록: 게시글별 삭제되지 않은 댓글 최신순 정렬 (부분 인덱스)
+            models.Index(fields=['post', '-created_at', '-id'], name='comment_post_live_idx',
+                         condition=Q(deleted_at__isnull=True)),
+            # 일반 사용자 댓글 목록: 삭제되지 않은 댓글만 최신순 정렬 (부분 인덱스)
+            models.Index(fields=['-created_at', '-id'], name='comment_live_created_idx',
+                         condition=Q(deleted_at__isnull=True)),
+            # my_comments: 작성자별 최신순 정렬
+            models.Index(fields=['author', '-created_at'], name='comment_author_created_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        if self.business_id is None and self.post_id is not None:
+            self.business_id = self.post.business_id
+        super().save(*args, **kwargs)
 
     def soft_delete(self):
-        """Marks the comment as deleted by setting deleted_at to current time."""
-        self.deleted_at = timezone.now()
-        self.save()
+        """
+        Marks the comment as deleted by setting deleted_at to current time.
+        Returns False if it was already deleted; the post's comment_count is only decremented on a real change.
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            changed = Comment.objects.filter(pk=self.pk, deleted_at__isnull=True).update(deleted_at=now, updated_at=now)
+            if changed:
+                Post.adjust_comment_count(self.post_id, -1)
+        if changed:
+            self.deleted_at = self.updated_at = now
+        return bool(changed)
 
     def restore(self):
-        """Restores the comment by setting deleted_at to None."""
-        self.deleted_at = None
-        self.save()
+        """
+        Restores the comment by setting deleted_at to None.
+        Returns False if it was not deleted; the post's comment_count is only incremented on a real change.
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            changed = Comment.objects.filter(pk=self.pk, deleted_at__isnull=False).update(deleted_at=None, updated_at=now)
+            if changed:
+                Post.adjust_comment_count(self.post_id, 1)
+        if changed:
+            self.deleted_at = None
+            self.updated_at = now
+        return bool(changed)
 
     @property
     def is_deleted(self):
         """Checks if the comment is marked as deleted."""
         return self.deleted_at is not None
+
+class ArchivedPost(models.Model):
+    """
+    보존 기간이 지나 핫 테이블에서 옮겨진 논리적 삭제 게시글 (archive_deleted 명령, boards/archive.py).
+    id 는 원래 게시글 id 이며, 복구 시 같은 id 로 boards_post 에 다시 들어갑니다. search_vector 는 복구 시 트리거가 다시 계산.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    business = models.ForeignKey(Business, on_delete=models.CASCADE, related_name='archived_posts')
+    author = models.ForeignKey(BusinessMember, on_delete=models.CASCADE, related_name='archived_posts')
+    title = models.CharField(max_length=255)
+    content = models.TextField()
+    is_public = models.BooleanField(default=True)
+    comment_count = models.PositiveIntegerField(default=0)
+    deleted_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            # 관리자 보관 목록: 비즈니스별 최근 삭제순
+            models.Index(fields=['business', '-deleted_at'], name='archived_post_business_idx'),
+        ]
+
+class ArchivedComment(models.Model):
+    """
+    보존 기간이 지난 논리적 삭제 댓글과, 보관된 게시글에 달려 있던 댓글.
+    post_id 는 boards_post 또는 boards_archivedpost 의 id 입니다.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    post_id = models.BigIntegerField(db_index=True)
+    business = models.ForeignKey(Business, on_delete=models.CASCADE, related_name='archived_comments')
+    author = models.ForeignKey(BusinessMember, on_delete=models.CASCADE, related_name='archived_comments')
+    content = models.TextField()
+    is_public = models.BooleanField(default=True)
+    deleted_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['business', '-deleted_at'], name='archived_comment_business_idx'),
+        ]
@@ -0,0 +1,173 @@
+# boards/pagination.py
+
+from base64 import b64decode, b64encode
+from collections import namedtuple
+from urllib import parse
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+Cursor = namedtuple('Cursor', ['created_at', 'id', 'reverse'])
+
+
+class KeysetPagination(BasePagination):
+    """
+    (created_at, id) 기준 keyset 페이지네이션.
+    COUNT(*)와 OFFSET 없이 커서 위치 이후의 행만 조회하므로 깊은 페이지에서도 비용이 일정합니다.
+    - ordering=created_at 이면 오름차순, 그 외에는 최신순(-created_at, -id)으로 고정됩니다.
+    """
+    cursor_query_param = 'cursor'
+    page_size = api_settings.PAGE_SIZE
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = self.prepare_queryset(queryset, request)
+        # 다음 페이지 존재 여부를 COUNT 없이 판단하기 위해 한 건을 더 조회
+        return self.set_page(list(queryset[:self.page_size + 1]))
+
+    async def apaginate_queryset(self, queryset, request):
+        """비동기 뷰용 paginate_queryset. 조회는 aiterator 로 수행합니다."""
+        queryset = self.prepare_queryset(queryset, request)
+        return self.set_page([row async for row in queryset[:self.page_size + 1].aiterator()])
+
+    def prepare_queryset(self, queryset, request):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.descending = self.is_descending(queryset)
+        self.cursor = self.decode_cursor(request)
+
+        reverse = self.cursor is not None and self.cursor.reverse
+        return self.apply_cursor(queryset, self.cursor, descending=self.descending != reverse)
+
+    def set_page(self, rows):
+        """page_size + 1 건의 조회 결과로 현재 페이지와 이전/다음 페이지 존재 여부를 설정"""
+        reverse = self.cursor is not None and self.cursor.reverse
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+
+        if reverse:
+            rows.reverse()
+            self.has_previous, self.has_next = has_more, True
+        else:
+            self.has_previous, self.has_next = self.cursor is not None, has_more
+
+        self.page = rows
+        return rows
+
+    @staticmethod
+    def is_descending(queryset):
+        order_by = queryset.query.order_by
+        return not (order_by and order_by[0] == 'created_at')
+
+    @staticmethod
+    def apply_cursor(queryset, cursor, descending=True):
+        """커서 위치 이후의 행만 남기고 (created_at, id) 순서로 정렬합니다."""
+        if cursor is not None:
+            lookup = 'lt' if descending else 'gt'
+            queryset = queryset.filter(
+                Q(**{f'created_at__{lookup}': cursor.created_at}) |
+                Q(created_at=cursor.created_at, **{f'id__{lookup}': cursor.id})
+            )
+        if descending:
+            return queryset.order_by('-created_at', '-id')
+        return queryset.order_by('created_at', 'id')
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            querystring = b64decode(encoded.encode('ascii')).decode('ascii')
+            tokens = parse.parse_qs(querystring, keep_blank_values=True)
+            created_at = parse_datetime(tokens['c'][0])
+            pk = int(tokens['i'][0])
+            reverse = bool(int(tokens.get('r', ['0'])[0]))
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if created_at is None:
+            raise NotFound(self.invalid_cursor_message)
+        return Cursor(created_at=created_at, id=pk, reverse=reverse)
+
+    @staticmethod
+    def encode_cursor_value(instance, reverse=False):
+        tokens = {'c': instance.created_at.isoformat(), 'i': instance.pk}
+        if reverse:
+            tokens['r'] = '1'
+        return b64encode(parse.urlencode(tokens).encode('ascii')).decode('ascii')
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        cursor = self.encode_cursor_value(self.page[-1])
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        cursor = self.encode_cursor_value(self.page[0], reverse=True)
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+
+class BoardPagination(PageNumberPagination):
+    """
+    게시판 목록용 페이지네이션.
+    기본은 기존과 같은 페이지 번호 방식이며, ?pagination=cursor 를 주면 KeysetPagination으로 동작합니다.
+    """
+    mode_query_param = 'pagination'
+    cursor_mode = 'cursor'
+    keyset_class = KeysetPagination
+    keyset = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if request.query_params.get(self.mode_query_param) == self.cursor_mode:
+            self.keyset = self.keyset_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        self.keyset = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_next_link(self):
+        if self.keyset is not None:
+            return self.keyset.get_next_link()
+        return super().get_next_link()
+
+    def get_previous_link(self):
+        if self.keyset is not None:
+            return self.keyset.get_previous_link()
+        return super().get_previous_link()
+
+    def get_schema_operation_parameters(self, view):
+        return super().get_schema_operation_parameters(view) + [
+            {
+                'name': self.mode_query_param,
+                'required': False,
+                'in': 'query',
+                'description': "'cursor' 이면 (created_at, id) keyset 페이지네이션을 사용합니다.",
+                'schema': {'type': 'string', 'enum': [self.cursor_mode]},
+            },
+            {
+                'name': KeysetPagination.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'keyset 페이지네이션의 커서 값 (next/previous 링크에 포함).',
+                'schema': {'type': 'string'},
+            },
+        ]
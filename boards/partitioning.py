@@ -0,0 +1,121 @@
+# boards/partitioning.py
+
+from django.db import connection, transaction
+
+# ============================
+# 비즈니스별 파티션 관리 (PostgreSQL)
+# - 게시글/댓글 테이블은 business_id 로 LIST 분할되어 있으며(0009_partition_by_business),
+#   모든 비즈니스의 행은 기본으로 DEFAULT 파티션에 저장됩니다.
+# - 행이 많은 비즈니스는 전용 파티션으로 옮겨 다른 비즈니스의 인덱스/테이블 크기에 영향을 주지 않게 하고,
+#   비즈니스를 정리할 때는 전용 파티션을 분리(detach)하거나 삭제합니다.
+# - 파티션으로의 행 배치(튜플 라우팅)는 PostgreSQL 이 수행하므로 애플리케이션 쿼리는 바뀌지 않으며,
+#   business_id 조건이 있는 쿼리(관리자 일괄 작업 등)는 해당 파티션만 조회합니다.
+# ============================
+
+# 댓글을 먼저 처리 (게시글과 같은 비즈니스의 파티션을 함께 유지)
+PARTITIONED_TABLES = ('boards_comment', 'boards_post')
+PARTITION_KEY = 'business_id'
+
+
+class PartitioningError(Exception):
+    pass
+
+
+def is_partitioned():
+    """게시글/댓글 테이블이 분할되어 있는지 (PostgreSQL 이 아니면 항상 False)"""
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [PARTITIONED_TABLES[-1]])
+        row = cursor.fetchone()
+    return row is not None and row[0] == 'p'
+
+
+def default_partition(table):
+    return f'{table}_default'
+
+
+def business_partition(table, business_id):
+    return f'{table}_b{int(business_id)}'
+
+
+def list_partitions():
+    """(테이블, 파티션, 범위, 추정 행 수) 목록"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT parent.relname, child.relname, pg_get_expr(child.relpartbound, child.oid), child.reltuples
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = ANY(%s) AND child.relkind IN ('r', 'p')
+            ORDER BY parent.relname, child.relname
+            """,
+            [list(PARTITIONED_TABLES)],
+        )
+        return [(table, name, bound, max(int(rows), 0)) for table, name, bound, rows in cursor.fetchall()]
+
+
+def _partition_exists(cursor, name):
+    cursor.execute('SELECT to_regclass(%s) IS NOT NULL', [name])
+    return cursor.fetchone()[0]
+
+
+def create_business_partition(business_id):
+    """
+    비즈니스의 행을 DEFAULT 파티션에서 전용 파티션으로 옮김. 옮긴 (테이블, 행 수) 목록을 반환합니다.
+    이동 중에는 DEFAULT 파티션이 잠기므로 (다른 비즈니스의 쓰기도 대기) 점검 시간에 실행합니다.
+    """
+    if not is_partitioned():
+        raise PartitioningError('게시글/댓글 테이블이 분할되어 있지 않습니다 (PostgreSQL 과 0009 마이그레이션 필요).')
+
+    business_id = int(business_id)
+    quote = connection.ops.quote_name
+    moved = []
+    with transaction.atomic(), connection.cursor() as cursor:
+        for table in PARTITIONED_TABLES:
+            name, default = business_partition(table, business_id), default_partition(table)
+            if _partition_exists(cursor, name):
+                raise PartitioningError(f'{name} 파티션이 이미 있습니다.')
+            check = quote(f'{name}_key_check')
+
+            # 이동 중 DEFAULT 파티션에 같은 비즈니스의 행이 새로 쓰이지 않도록 잠금
+            cursor.execute(f'LOCK TABLE {quote(default)} IN EXCLUSIVE MODE')
+            cursor.execute(f'CREATE TABLE {quote(name)} (LIKE {quote(table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+            # 분할 키 CHECK 가 있으면 ATTACH 시 새 파티션 전체를 다시 검사하지 않음
+            cursor.execute(f'ALTER TABLE {quote(name)} ADD CONSTRAINT {check} CHECK ({PARTITION_KEY} = {business_id})')
+            cursor.execute(
+                f'WITH moved AS (DELETE FROM {quote(default)} WHERE {PARTITION_KEY} = %s RETURNING *) '
+                f'INSERT INTO {quote(name)} SELECT * FROM moved',
+                [business_id],
+            )
+            moved.append((table, cursor.rowcount))
+            # 부모의 인덱스, 외래 키, 트리거는 ATTACH 시 파티션에 만들어짐
+            cursor.execute(f'ALTER TABLE {quote(table)} ATTACH PARTITION {quote(name)} FOR VALUES IN ({business_id})')
+            cursor.execute(f'ALTER TABLE {quote(name)} DROP CONSTRAINT {check}')
+    return moved
+
+
+def detach_business_partition(business_id, drop=False):
+    """
+    비즈니스 전용 파티션을 분리. 분리된 테이블은 독립 테이블로 남아 백업/보관 후 삭제할 수 있으며,
+    drop=True 이면 바로 삭제합니다. 분리 후 게시글/댓글은 조회되지 않습니다.
+    """
+    if not is_partitioned():
+        raise PartitioningError('게시글/댓글 테이블이 분할되어 있지 않습니다 (PostgreSQL 과 0009 마이그레이션 필요).')
+
+    quote = connection.ops.quote_name
+    detached = []
+    with transaction.atomic(), connection.cursor() as cursor:
+        if drop:
+            # 같은 트랜잭션에서 쓴 행의 지연된 외래 키 검사가 남아 있으면 테이블을 삭제할 수 없음
+            cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+        for table in PARTITIONED_TABLES:
+            name = business_partition(table, business_id)
+            if not _partition_exists(cursor, name):
+                raise PartitioningError(f'{name} 파티션이 없습니다. 먼저 전용 파티션으로 옮겨야 합니다.')
+            cursor.execute(f'ALTER TABLE {quote(table)} DETACH PARTITION {quote(name)}')
+            if drop:
+                cursor.execute(f'DROP TABLE {quote(name)}')
+            detached.append(name)
+    return detached
@@ -0,0 +1,78 @@
+# boards/routing.py
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework import permissions
+
+# ============================
+# 읽기 복제본 라우팅 (settings.DATABASE_ROUTERS, DATABASE_REPLICAS)
+# - 게시판 API 의 안전한 메서드 요청(ReplicaReadMixin, 비동기 읽기 API)은 read_from_replica() 안에서 처리되어
+#   boards 앱 모델 조회가 요청마다 고른 복제본 하나로 갑니다. 인증/관리 명령 등 그 밖의 조회와 모든 쓰기는 default 로 갑니다.
+# - 쓰기에 성공한 응답에는 REPLICA_PIN_SECONDS 동안 유지되는 쿠키를 붙이며, 쿠키가 있는 요청은 default 에서 읽어
+#   복제 지연이 있어도 방금 쓴 내용이 보이도록 합니다 (게시글 작성 후 목록으로 이동하는 경우 등).
+# - ContextVar 는 sync_to_async 로 실행되는 스레드에도 전달되므로 async ORM 조회에도 적용됩니다.
+# ============================
+
+PIN_COOKIE = 'db_pin'
+
+_read_database = ContextVar('read_database', default=None)
+
+
+def is_pinned(request):
+    return PIN_COOKIE in request.COOKIES
+
+
+def read_database():
+    """현재 게시판 조회가 가는 복제본 별칭 (default 이면 None)"""
+    return _read_database.get()
+
+
+@contextmanager
+def read_from_replica(request):
+    """이 블록 안의 게시판 조회를 복제본에서 처리 (복제본이 없거나 쓰기 직후인 클라이언트는 default)"""
+    replicas = settings.DATABASE_REPLICAS
+    alias = random.choice(replicas) if replicas and not is_pinned(request) else None
+    token = _read_database.set(alias)
+    try:
+        yield alias
+    finally:
+        _read_database.reset(token)
+
+
+def pin_primary(response):
+    """쓰기에 성공한 응답에 붙여 잠시 default 에서 읽도록 함"""
+    if settings.DATABASE_REPLICAS:
+        response.set_cookie(
+            PIN_COOKIE, '1', max_age=settings.REPLICA_PIN_SECONDS, httponly=True, secure=True, samesite='Lax',
+        )
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label == 'boards':
+            return _read_database.get()
+        return None
+
+    def db_for_write(self, model, **hints):
+        # 복제본에서 읽은 인스턴스도 default 에 저장 (라우터가 None 을 반환하면 인스턴스를 읽은 DB 에 저장됨)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 default 와 같은 데이터이므로 어느 DB 에서 읽은 인스턴스끼리도 연결 가능
+        return True
+
+
+class ReplicaReadMixin:
+    """안전한 메서드 요청은 복제본에서 읽고, 쓰기에 성공하면 pin_primary 쿠키를 붙이는 ViewSet 믹스인"""
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method in permissions.SAFE_METHODS:
+            with read_from_replica(request):
+                return super().dispatch(request, *args, **kwargs)
+        response = super().dispatch(request, *args, **kwargs)
+        if response.status_code < 400:
+            pin_primary(response)
+        return response
@@ -1,16 +1,20 @@
 # boards/serializers.py
 
+from urllib.parse import urlencode
+from django.urls import reverse
 from rest_framework import serializers
-from .models import Post, Comment
+from .models import Post, Comment, ArchivedPost, ArchivedComment
+from .pagination import BoardPagination, KeysetPagination
+from .sync import new_sync_token
 
 class PostSerializer(serializers.ModelSerializer):
     author = serializers.ReadOnlyField(source='author.username')
-    business = serializers.ReadOnlyField(source='business.id')  # Business는 현재 사용자와 연관됨
+    business = serializers.ReadOnlyField(source='business_id')  # Business는 현재 사용자와 연관됨 (FK 값만 사용하여 추가 조회 없음)
 
     class Meta:
         model = Post
-        fields = ['id', 'business', 'author', 'title', 'content', 'is_public', 'deleted_at', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'business', 'author', 'deleted_at', 'created_at', 'updated_at']
+        fields = ['id', 'business', 'author', 'title', 'content', 'is_public', 'comment_count', 'deleted_at', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'business', 'author', 'comment_count', 'deleted_at', 'created_at', 'updated_at']
 
 class CommentSerializer(serializers.ModelSerializer):
     author = serializers.ReadOnlyField(source='author.username')
@@ -20,3 +24,96 @@ class CommentSerializer(serializers.ModelSerializer):
         model = Comment
         fields = ['id', 'post', 'author', 'content', 'is_public', 'deleted_at', 'created_at', 'updated_at']
         read_only_fields = ['id', 'post', 'author', 'deleted_at', 'created_at', 'updated_at']
+
+class BulkActionSerializer(serializers.Serializer):
+    """일괄 삭제/복구 요청. ids 를 생략하면 목록과 같은 쿼리 파라미터 필터로 대상을 지정"""
+    ids = serializers.ListField(child=serializers.IntegerField(), required=False, allow_empty=False, max_length=1000)
+
+class ArchivedPostSerializer(serializers.ModelSerializer):
+    author = serializers.ReadOnlyField(source='author.username')
+    business = serializers.ReadOnlyField(source='business_id')
+
+    class Meta:
+        model = ArchivedPost
+        fields = ['id', 'business', 'author', 'title', 'content', 'is_public', 'comment_count', 'deleted_at', 'created_at', 'updated_at', 'archived_at']
+        read_only_fields = fields
+
+class ArchivedCommentSerializer(serializers.ModelSerializer):
+    author = serializers.ReadOnlyField(source='author.username')
+    post = serializers.ReadOnlyField(source='post_id')
+
+    class Meta:
+        model = ArchivedComment
+        fields = ['id', 'post', 'author', 'content', 'is_public', 'deleted_at', 'created_at', 'updated_at', 'archived_at']
+        read_only_fields = fields
+
+class RestoreArchivedSerializer(serializers.Serializer):
+    """보관된 게시글/댓글 복구 요청"""
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=1000)
+
+class ImportPostSerializer(serializers.Serializer):
+    """
+    가져오기(import_board) 게시글 행. id 는 원본 게시판의 id 로, 같은 가져오기의 댓글 행이 post 로 참조합니다.
+    author 는 대상 비즈니스 구성원의 username 이며, updated_at 을 생략하면 created_at 과 같게 저장합니다.
+    """
+    id = serializers.CharField(max_length=64, required=False)
+    author = serializers.CharField(max_length=150)
+    title = serializers.CharField(max_length=255)
+    content = serializers.CharField(allow_blank=True, trim_whitespace=False)
+    is_public = serializers.BooleanField(default=True)
+    created_at = serializers.DateTimeField()
+    updated_at = serializers.DateTimeField(required=False)
+    deleted_at = serializers.DateTimeField(required=False, allow_null=True)
+
+class ImportCommentSerializer(serializers.Serializer):
+    """가져오기 댓글 행. post 는 앞서 가져온 게시글 행의 (원본) id"""
+    post = serializers.CharField(max_length=64)
+    author = serializers.CharField(max_length=150)
+    content = serializers.CharField(allow_blank=True, trim_whitespace=False)
+    is_public = serializers.BooleanField(default=True)
+    created_at = serializers.DateTimeField()
+    updated_at = serializers.DateTimeField(required=False)
+    deleted_at = serializers.DateTimeField(required=False, allow_null=True)
+
+class ImportUploadSerializer(serializers.Serializer):
+    """관리자 가져오기 API 요청. format 을 생략하면 파일 확장자(.jsonl/.csv)로 판단"""
+    file = serializers.FileField()
+    format = serializers.ChoiceField(choices=['jsonl', 'csv'], required=False)
+    default_author = serializers.CharField(max_length=150, required=False)
+
+class PostWithCommentsSerializer(PostSerializer):
+    """
+    게시글 상세에 댓글 첫 페이지를 포함한 표현 (?include=comments).
+    comments 는 커서 페이지네이션 응답과 같은 형태이며, next 는 /api/board/comments/ 의 커서 링크,
+    token 은 이후 변경분을 /api/board/comments/?post=<id>&changed_since=<token> 으로 받기 위한 동기화 토큰입니다.
+    """
+    comments = serializers.SerializerMethodField()
+
+    class Meta(PostSerializer.Meta):
+        fields = PostSerializer.Meta.fields + ['comments']
+
+    def get_comments(self, post):
+        request = self.context['request']
+        page_size = KeysetPagination.page_size
+        token = new_sync_token()
+        comments = list(
+            Comment.objects.select_related('author').visible_to(request.user)
+            .filter(post=post).order_by('-created_at', '-id')[:page_size + 1]
+        )
+
+        next_link = None
+        if len(comments) > page_size:
+            comments = comments[:page_size]
+            query = urlencode({
+                'post': post.pk,
+                BoardPagination.mode_query_param: BoardPagination.cursor_mode,
+                KeysetPagination.cursor_query_param: KeysetPagination.encode_cursor_value(comments[-1]),
+            })
+            next_link = f"{request.build_absolute_uri(reverse('comment-list'))}?{query}"
+
+        return {
+            'next': next_link,
+            'previous': None,
+            'token': token,
+            'results': CommentSerializer(comments, many=True, context=self.context).data,
+        }
@@ -0,0 +1,27 @@
+# boards/sync.py
+
+from datetime import datetime, timedelta, timezone as dt_timezone
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+# 델타 동기화 토큰은 서버 시각(UTC epoch 마이크로초)이며, 조회 시작 시각보다 SYNC_OVERLAP 만큼 앞선 값으로 발급됩니다.
+# updated_at 은 커밋보다 먼저 기록되고 앱 서버 간 시계도 조금씩 다를 수 있으므로, 겹치는 구간의 변경은 다음 동기화에서
+# 한 번 더 전달될 수 있습니다. 클라이언트는 id 기준으로 덮어쓰기 때문에 중복은 무해합니다.
+SYNC_OVERLAP = timedelta(seconds=5)
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def new_sync_token():
+    """지금부터의 변경을 받을 수 있는 토큰. 데이터를 조회하기 전에 발급해야 합니다."""
+    return encode_sync_token(timezone.now() - SYNC_OVERLAP)
+
+
+def encode_sync_token(moment):
+    return str((moment - EPOCH) // timedelta(microseconds=1))
+
+
+def decode_sync_token(value):
+    try:
+        return EPOCH + timedelta(microseconds=int(value))
+    except (TypeError, ValueError, OverflowError):
+        raise ValidationError({'changed_since': '유효하지 않은 동기화 토큰입니다.'})
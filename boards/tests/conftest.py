@@ -1,9 +1,17 @@
 # boards/tests/conftest.py
 
 import pytest
+from django.core.cache import cache
 from rest_framework.test import APIClient
 from boards.tests.factories import *
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """테스트 간 응답/사용자 캐시가 공유되지 않도록 매 테스트 전후로 캐시를 비움"""
+    cache.clear()
+    yield
+    cache.clear()
+
 @pytest.fixture
 def api_client():
     """Django REST Framework의 APIClient 인스턴스를 반환"""
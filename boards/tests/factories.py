@@ -52,4 +52,13 @@ class CommentFactory(DjangoModelFactory):
     is_public = True
     deleted_at = None
     author = factory.SubFactory(UserFactory)
-    post = factory.SubFactory(PostFactory)
\ No newline at end of file
+    post = factory.SubFactory(PostFactory)
+
+    @classmethod
+    def _create(cls, model_class, *args, **kwargs):
+        """API 로 생성한 것처럼 게시글의 comment_count 도 함께 증가"""
+        comment = super()._create(model_class, *args, **kwargs)
+        if comment.deleted_at is None:
+            Post.adjust_comment_count(comment.post_id, 1)
+            comment.post.comment_count += 1
+        return comment
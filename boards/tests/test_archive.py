@@ -0,0 +1,109 @@
+# boards/tests/test_archive.py
+
+import pytest
+from datetime import timedelta
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from boards.models import Post, Comment, ArchivedPost, ArchivedComment
+from boards.sync import encode_sync_token
+from boards.tests.factories import BusinessFactory, CommentFactory, PostFactory, UserFactory
+
+# ============================
+# 보관(archive) 테스트
+# ============================
+
+def _deleted_days_ago(instance, days):
+    moment = timezone.now() - timedelta(days=days)
+    type(instance).objects.filter(pk=instance.pk).update(deleted_at=moment)
+
+@pytest.mark.django_db
+def test_archive_deleted_moves_only_expired_rows(user, business):
+    """
+    보존 기간이 지난 삭제 게시글(댓글 포함)과 삭제 댓글만 옮겨지고, 배치 수를 제한해도 다시 실행하면 이어지는지 테스트
+    """
+    old_post = PostFactory(author=user, business=business)
+    old_post_comments = CommentFactory.create_batch(2, author=user, post=old_post)
+    _deleted_days_ago(old_post, 100)
+    recent_post = PostFactory(author=user, business=business)
+    _deleted_days_ago(recent_post, 10)
+
+    live_post = PostFactory(author=user, business=business)
+    old_comment, recent_comment, live_comment = CommentFactory.create_batch(3, author=user, post=live_post)
+    _deleted_days_ago(old_comment, 100)
+    _deleted_days_ago(recent_comment, 10)
+    Post.objects.filter(pk=live_post.pk).update(comment_count=1)
+
+    # 배치 하나씩만 처리하고 중단된 상황
+    call_command('archive_deleted', '--days', '90', '--batch-size', '1', '--max-batches', '1')
+    assert set(ArchivedComment.objects.values_list('pk', flat=True)) == {old_comment.pk}
+    # 게시글이 옮겨지기 전에는 그 댓글도 핫 테이블에 남음
+    assert old_post.comments.count() == 2
+    call_command('archive_deleted', '--days', '90', '--batch-size', '1')
+
+    assert set(ArchivedPost.objects.values_list('pk', flat=True)) == {old_post.pk}
+    assert set(ArchivedComment.objects.values_list('pk', flat=True)) == {old_comment.pk, *(c.pk for c in old_post_comments)}
+    assert set(Post.objects.values_list('pk', flat=True)) == {recent_post.pk, live_post.pk}
+    assert set(Comment.objects.values_list('pk', flat=True)) == {recent_comment.pk, live_comment.pk}
+    assert Post.objects.get(pk=live_post.pk).comment_count == 1
+
+    archived = ArchivedPost.objects.get(pk=old_post.pk)
+    assert (archived.title, archived.created_at, archived.business_id) == (old_post.title, old_post.created_at, business.id)
+    assert archived.archived_at is not None
+
+@pytest.mark.django_db
+def test_restore_archived(admin_authenticated_client, user, business):
+    """
+    관리자가 보관된 게시글을 댓글과 함께 같은 id 로 복구하고, 다른 비즈니스의 행과 게시글이 보관된 댓글은 제외되는지 테스트
+    """
+    post = PostFactory(author=user, business=business)
+    comments = CommentFactory.create_batch(2, author=user, post=post)
+    Post.objects.filter(pk=post.pk).update(comment_count=2)
+    _deleted_days_ago(post, 100)
+    live_post = PostFactory(author=user, business=business)
+    deleted_comment = CommentFactory(author=user, post=live_post)
+    _deleted_days_ago(deleted_comment, 100)
+    Post.objects.filter(pk=live_post.pk).update(comment_count=0)
+    other_business = BusinessFactory()
+    foreign = PostFactory(author=UserFactory(business=other_business), business=other_business)
+    _deleted_days_ago(foreign, 100)
+    call_command('archive_deleted')
+
+    response = admin_authenticated_client.get(reverse('post-archived'))
+    assert response.status_code == status.HTTP_200_OK
+    assert [row['id'] for row in response.data['results']] == [post.pk]
+
+    # 게시글이 보관된 댓글은 댓글 복구로 되돌릴 수 없음
+    response = admin_authenticated_client.post(
+        reverse('comment-restore-archived'), {'ids': [comments[0].pk, deleted_comment.pk]}, format='json',
+    )
+    assert response.data == {'count': 1, 'ids': [deleted_comment.pk]}
+    assert Comment.objects.get(pk=deleted_comment.pk).is_deleted
+    assert Post.objects.get(pk=live_post.pk).comment_count == 0
+
+    response = admin_authenticated_client.post(
+        reverse('post-restore-archived'), {'ids': [post.pk, foreign.pk]}, format='json',
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == {'count': 1, 'ids': [post.pk]}
+    restored = Post.objects.get(pk=post.pk)
+    assert (restored.created_at, restored.comment_count, restored.is_deleted) == (post.created_at, 2, True)
+    assert set(Comment.objects.filter(post=post).values_list('pk', flat=True)) == {c.pk for c in comments}
+    assert not ArchivedComment.objects.exists()
+    assert list(ArchivedPost.objects.values_list('pk', flat=True)) == [foreign.pk]
+
+@pytest.mark.django_db
+def test_archive_endpoints_require_admin(authenticated_client):
+    response = authenticated_client.post(reverse('post-restore-archived'), {'ids': [1]}, format='json')
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+@pytest.mark.django_db
+def test_sync_token_older_than_retention_resets(authenticated_client, post):
+    """
+    보존 기간보다 오래된 동기화 토큰은 (보관된 댓글의 삭제를 전달할 수 없으므로) reset 으로 응답하는지 테스트
+    """
+    token = encode_sync_token(timezone.now() - timedelta(days=365))
+    response = authenticated_client.get(reverse('comment-list'), {'post': post.id, 'changed_since': token})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data['reset'] is True
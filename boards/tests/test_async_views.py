@@ -0,0 +1,70 @@
+# boards/tests/test_async_views.py
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+from boards.tests.factories import CommentFactory, PostFactory
+
+# ============================
+# 비동기 읽기 API 테스트
+# ============================
+
+def async_get(user, url, data=None):
+    """AsyncClient 로 쿠키 인증(access_token) GET 요청을 보내고 응답을 반환"""
+    async def request():
+        client = AsyncClient()
+        if user is not None:
+            client.cookies['access_token'] = str(AccessToken.for_user(user))
+        return await client.get(url, data or {})
+    return async_to_sync(request)()
+
+@pytest.mark.django_db
+def test_async_post_list_matches_sync(authenticated_client, user, other_user, business):
+    """
+    비동기 게시글 목록이 동기 API 의 커서 페이지네이션과 같은 게시글과 다음 페이지 링크를 반환하는지 테스트
+    """
+    PostFactory.create_batch(15, author=other_user, business=business)
+    PostFactory.create_batch(5, author=other_user, business=business, is_public=False)
+    PostFactory.create_batch(10, author=user, business=business, is_public=False)
+
+    expected = authenticated_client.get(reverse('post-list'), {'pagination': 'cursor'}).data
+    response = async_get(user, reverse('async-post-list'))
+    assert response.status_code == 200
+    data = response.json()
+    assert [post['id'] for post in data['results']] == [post['id'] for post in expected['results']]
+    assert data['previous'] is None
+
+    second = async_get(user, data['next']).json()
+    assert len(second['results']) == 5  # 공개 15 + 본인 비공개 10 중 나머지
+    assert second['next'] is None
+
+@pytest.mark.django_db
+def test_async_post_filters_and_detail(user, other_user, business):
+    """
+    필터 적용, 잘못된 필터 값의 400, 볼 수 없는 게시글의 404, 인증되지 않은 요청의 401 을 테스트
+    """
+    mine = PostFactory(author=user, business=business, is_public=False)
+    hidden = PostFactory(author=other_user, business=business, is_public=False)
+
+    data = async_get(user, reverse('async-post-list'), {'author': user.id, 'is_public': 'false'}).json()
+    assert [post['id'] for post in data['results']] == [mine.id]
+    assert async_get(user, reverse('async-post-list'), {'author': 'x'}).status_code == 400
+
+    assert async_get(user, reverse('async-post-detail', args=[mine.id])).json()['title'] == mine.title
+    assert async_get(user, reverse('async-post-detail', args=[hidden.id])).status_code == 404
+    assert async_get(None, reverse('async-post-list')).status_code == 401
+
+@pytest.mark.django_db
+def test_async_comment_list(user, other_user, post):
+    """
+    게시글별 댓글 목록에서 다른 사용자의 비공개 댓글이 제외되는지 테스트
+    """
+    visible = CommentFactory.create_batch(3, post=post, author=other_user)
+    CommentFactory(post=post, author=other_user, is_public=False)
+    CommentFactory(author=user)  # 다른 게시글
+
+    data = async_get(user, reverse('async-comment-list'), {'post': post.id, 'ordering': 'created_at'}).json()
+    assert [comment['id'] for comment in data['results']] == [comment.id for comment in visible]
+    assert data['results'][0]['post'] == post.id
@@ -1,4 +1,5 @@
 import pytest
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, identify_hasher
 from django.urls import reverse
 from rest_framework import status
 
@@ -46,3 +47,40 @@ def test_login_invalid_password(api_client, user):
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
     assert 'detail' in response.data
     assert response.data['detail'] == 'No active account found with the given credentials'
+
+@pytest.mark.django_db
+def test_login_verifies_password_once(api_client, user, monkeypatch, django_assert_num_queries):
+    """
+    로그인 한 번에 비밀번호 해시 검증과 사용자 조회가 한 번씩만 수행되고 토큰은 쿠키로 내려오는지 테스트
+    """
+    verified = []
+    verify = PBKDF2PasswordHasher.verify
+    monkeypatch.setattr(PBKDF2PasswordHasher, 'verify', lambda self, *args: verified.append(1) or verify(self, *args))
+
+    # 사용자 조회, 발급한 refresh 토큰 기록(OutstandingToken)
+    with django_assert_num_queries(2):
+        response = api_client.post(reverse('token_obtain_pair'), {'username': user.username, 'password': 'password123!'}, format='json')
+    assert response.status_code == status.HTTP_200_OK
+    assert {'access_token', 'refresh_token'} <= set(response.cookies)
+    assert len(verified) == 1
+
+@pytest.mark.django_db
+def test_login_rehashes_outdated_password(api_client, user):
+    """
+    반복 횟수가 현재 설정보다 적은 해시로 저장된 사용자는 로그인에 성공할 때 새 해시로 다시 저장되는지 테스트
+    """
+    hasher = PBKDF2PasswordHasher()
+    user.password = hasher.encode('password123!', hasher.salt(), iterations=1000)
+    user.save(update_fields=['password'])
+
+    response = api_client.post(reverse('token_obtain_pair'), {'username': user.username, 'password': 'wrong'}, format='json')
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    user.refresh_from_db()
+    assert hasher.decode(user.password)['iterations'] == 1000
+
+    response = api_client.post(reverse('token_obtain_pair'), {'username': user.username, 'password': 'password123!'}, format='json')
+    assert response.status_code == status.HTTP_200_OK
+    user.refresh_from_db()
+    assert hasher.decode(user.password)['iterations'] == hasher.iterations
+    assert not identify_hasher(user.password).must_update(user.password)
+    assert user.check_password('password123!')
@@ -0,0 +1,96 @@
+# boards/tests/test_bulk.py
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from boards.models import Post, Comment
+from boards.tests.factories import PostFactory, CommentFactory, BusinessFactory, UserFactory
+
+# ============================
+# 관리자 일괄 삭제/복구 테스트
+# ============================
+
+@pytest.mark.django_db
+def test_bulk_soft_delete_posts_by_ids(admin_authenticated_client, django_assert_max_num_queries, user, business):
+    """
+    ids 로 지정한 게시글 중 삭제되지 않은 것만 삭제되고, 다른 비즈니스의 게시글은 제외되는지 테스트
+    """
+    posts = PostFactory.create_batch(3, author=user, business=business)
+    already_deleted = PostFactory(author=user, business=business)
+    already_deleted.soft_delete()
+    other_business = BusinessFactory()
+    foreign = PostFactory(author=UserFactory(business=other_business), business=other_business)
+
+    ids = [p.id for p in posts[:2]] + [already_deleted.id, foreign.id]
+    # SELECT ... FOR UPDATE + UPDATE (+ 테스트 트랜잭션 안에서의 SAVEPOINT/RELEASE)
+    with django_assert_max_num_queries(4):
+        response = admin_authenticated_client.post(reverse('post-bulk-soft-delete'), {'ids': ids}, format='json')
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == {'count': 2, 'ids': sorted(p.id for p in posts[:2])}
+
+    deleted = set(Post.objects.filter(deleted_at__isnull=False).values_list('id', flat=True))
+    assert deleted == {posts[0].id, posts[1].id, already_deleted.id}
+
+@pytest.mark.django_db
+def test_bulk_soft_delete_posts_by_filter(admin_authenticated_client, user, other_user, business):
+    """
+    ids 대신 쿼리 파라미터(author) 필터로 대상을 지정할 수 있고, 필터가 없으면 400 을 반환하는지 테스트
+    """
+    spam = PostFactory.create_batch(2, author=other_user, business=business)
+    keep = PostFactory(author=user, business=business)
+    url = reverse('post-bulk-soft-delete')
+
+    response = admin_authenticated_client.post(url, {}, format='json')
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    # 값이 빈 필터는 무시되어 비즈니스 전체가 대상이 되므로 거부
+    for query in ('search=', 'author=', 'is_public=', 'search=%20'):
+        response = admin_authenticated_client.post(f'{url}?{query}', {}, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert not Post.objects.filter(deleted_at__isnull=False).exists()
+
+    response = admin_authenticated_client.post(f'{url}?author={other_user.id}', {}, format='json')
+    assert response.status_code == status.HTTP_200_OK
+    assert set(response.data['ids']) == {p.id for p in spam}
+    assert not Post.objects.get(pk=keep.pk).is_deleted
+
+@pytest.mark.django_db
+def test_bulk_restore_posts(admin_authenticated_client, user, business):
+    """
+    삭제된 게시글만 복구되는지 테스트
+    """
+    deleted = PostFactory(author=user, business=business)
+    deleted.soft_delete()
+    live = PostFactory(author=user, business=business)
+
+    response = admin_authenticated_client.post(reverse('post-bulk-restore'), {'ids': [deleted.id, live.id]}, format='json')
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data['ids'] == [deleted.id]
+    assert not Post.objects.get(pk=deleted.pk).is_deleted
+
+@pytest.mark.django_db
+def test_bulk_comments_adjust_comment_count(admin_authenticated_client, user, post, published_post):
+    """
+    댓글 일괄 삭제/복구 시 게시글별 comment_count 가 함께 조정되는지 테스트
+    """
+    comments = CommentFactory.create_batch(3, post=post, author=user) + [CommentFactory(post=published_post, author=user)]
+    ids = [c.id for c in comments]
+
+    response = admin_authenticated_client.post(reverse('comment-bulk-soft-delete'), {'ids': ids}, format='json')
+    assert response.data['count'] == 4
+    assert Comment.objects.filter(deleted_at__isnull=True).count() == 0
+    assert Post.objects.get(pk=post.pk).comment_count == 0
+    assert Post.objects.get(pk=published_post.pk).comment_count == 0
+
+    response = admin_authenticated_client.post(reverse('comment-bulk-restore'), {'ids': ids[:2]}, format='json')
+    assert response.data['count'] == 2
+    assert Post.objects.get(pk=post.pk).comment_count == 2
+
+@pytest.mark.django_db
+def test_bulk_actions_admin_only(authenticated_client, post):
+    """
+    일반 사용자는 자신의 게시글이라도 일괄 삭제할 수 없는지 테스트
+    """
+    response = authenticated_client.post(reverse('post-bulk-soft-delete'), {'ids': [post.id]}, format='json')
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert not Post.objects.get(pk=post.pk).is_deleted
@@ -0,0 +1,80 @@
+# boards/tests/test_cache.py
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from boards.tests.factories import PostFactory, CommentFactory
+
+# ============================
+# 게시판 응답 캐시 테스트
+# ============================
+
+@pytest.fixture(autouse=True)
+def board_cache(settings):
+    settings.BOARD_CACHE_TIMEOUT = 60
+
+@pytest.mark.django_db
+def test_list_served_from_cache(authenticated_client, django_assert_num_queries, post):
+    """
+    같은 목록 요청은 두 번째부터 DB 조회 없이 캐시에서 응답하는지 테스트
+    """
+    url = reverse('post-list')
+    first = authenticated_client.get(url, {'page': 1, 'is_public': 'true'}, format='json')
+    with django_assert_num_queries(0):
+        # 쿼리 파라미터 순서가 달라도 같은 키
+        second = authenticated_client.get(url + '?is_public=true&page=1', format='json')
+    assert second.status_code == status.HTTP_200_OK
+    assert second.data == first.data
+
+@pytest.mark.django_db
+def test_cache_invalidated_by_writes(authenticated_client, django_capture_on_commit_callbacks, post):
+    """
+    게시글 생성/수정/삭제와 댓글 생성 후 목록/상세 캐시가 무효화되는지 테스트
+    """
+    list_url = reverse('post-list')
+    detail_url = reverse('post-detail', args=[post.id])
+    assert authenticated_client.get(list_url, format='json').data['count'] == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        authenticated_client.post(list_url, {'title': 'New', 'content': 'body'}, format='json')
+    assert authenticated_client.get(list_url, format='json').data['count'] == 2
+
+    assert authenticated_client.get(detail_url, format='json').data['comment_count'] == 0
+    with django_capture_on_commit_callbacks(execute=True):
+        authenticated_client.post(reverse('comment-list'), {'content': 'hi', 'post': post.id}, format='json')
+    assert authenticated_client.get(detail_url, format='json').data['comment_count'] == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        authenticated_client.patch(detail_url, {'title': 'Edited'}, format='json')
+    assert authenticated_client.get(detail_url, format='json').data['title'] == 'Edited'
+
+    with django_capture_on_commit_callbacks(execute=True):
+        authenticated_client.delete(detail_url)
+    assert authenticated_client.get(detail_url, format='json').status_code == status.HTTP_404_NOT_FOUND
+
+@pytest.mark.django_db
+def test_cache_key_depends_on_user(api_client, user, other_user, admin_user):
+    """
+    비공개 게시글이 포함된 응답이 다른 사용자에게 캐시로 노출되지 않는지 테스트
+    """
+    private = PostFactory(author=user, business=user.business, is_public=False)
+    url = reverse('post-list')
+
+    api_client.force_authenticate(user=user)
+    assert [p['id'] for p in api_client.get(url, format='json').data['results']] == [private.id]
+
+    api_client.force_authenticate(user=other_user)
+    assert api_client.get(url, format='json').data['results'] == []
+
+    api_client.force_authenticate(user=admin_user)
+    assert [p['id'] for p in api_client.get(url, format='json').data['results']] == [private.id]
+
+@pytest.mark.django_db
+def test_comment_list_cached_per_query(authenticated_client, post, published_post, user):
+    """
+    댓글 목록은 ?post= 값마다 다른 키로 캐시되는지 테스트
+    """
+    comment = CommentFactory(post=post, author=user)
+    url = reverse('comment-list')
+    assert [c['id'] for c in authenticated_client.get(url, {'post': post.id}, format='json').data['results']] == [comment.id]
+    assert authenticated_client.get(url, {'post': published_post.id}, format='json').data['results'] == []
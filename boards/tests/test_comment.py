@@ -190,4 +190,23 @@ def test_my_comments(authenticated_client, user):
     assert len(response.data['results']) >= 2
     assert any(c['id'] == comment1.id for c in response.data['results'])
     assert any(c['id'] == comment2.id for c in response.data['results'])
-    assert all(p['author'] == user.username for p in response.data['results'])
\ No newline at end of file
+    assert all(p['author'] == user.username for p in response.data['results'])
+
+@pytest.mark.django_db
+def test_list_comments_cursor_pagination(authenticated_client, user, post):
+    """
+    ?pagination=cursor 로 특정 게시글의 댓글을 커서 기반으로 페이지 이동하는지 테스트
+    """
+    comments = [CommentFactory(post=post, author=user) for _ in range(23)]
+    url = reverse('comment-list') + f'?post={post.id}&pagination=cursor'
+    response = authenticated_client.get(url, format='json')
+    assert response.status_code == status.HTTP_200_OK
+    assert 'count' not in response.data
+    assert len(response.data['results']) == 20
+
+    response = authenticated_client.get(response.data['next'], format='json')
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data['results']) == 3
+    assert response.data['next'] is None
+    assert response.data['previous'] is not None
+    assert [c['id'] for c in response.data['results']] == [c.id for c in comments[2::-1]]
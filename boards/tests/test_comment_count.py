@@ -0,0 +1,66 @@
+# boards/tests/test_comment_count.py
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from boards.models import Post
+from boards.tests.factories import CommentFactory
+
+# ============================
+# Post.comment_count 테스트
+# ============================
+
+def _comment_count(post):
+    return Post.objects.values_list('comment_count', flat=True).get(pk=post.pk)
+
+@pytest.mark.django_db
+def test_comment_count_follows_create_and_delete(authenticated_client, post):
+    """
+    댓글 생성 시 증가하고, 삭제 시 감소하며, 이미 삭제된 댓글을 다시 삭제해도 변하지 않는지 테스트
+    """
+    url = reverse('comment-list')
+    ids = [
+        authenticated_client.post(url, {'content': f'comment {i}', 'post': post.id}, format='json').data['id']
+        for i in range(3)
+    ]
+    assert _comment_count(post) == 3
+
+    response = authenticated_client.delete(reverse('comment-detail', args=[ids[0]]))
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert _comment_count(post) == 2
+
+    response = authenticated_client.get(reverse('post-detail', args=[post.id]), format='json')
+    assert response.data['comment_count'] == 2
+
+@pytest.mark.django_db
+def test_comment_count_follows_soft_delete_and_restore(post, user):
+    """
+    soft_delete/restore 가 실제로 상태가 바뀐 경우에만 comment_count 를 조정하는지 테스트
+    (팩토리는 comment_count 를 올리지 않으므로 recount_comments 로 맞춘 뒤 확인하며, 0 하한에 걸리지 않도록 댓글 여러 개 사용)
+    """
+    comment, *_ = CommentFactory.create_batch(3, post=post, author=user)
+    call_command('recount_comments')
+    assert _comment_count(post) == 3
+
+    assert comment.soft_delete() is True
+    assert comment.soft_delete() is False
+    assert _comment_count(post) == 2
+
+    assert comment.restore() is True
+    assert comment.restore() is False
+    assert _comment_count(post) == 3
+
+@pytest.mark.django_db
+def test_recount_comments_command(post, user, published_post):
+    """
+    recount_comments 명령이 어긋난 comment_count 를 삭제되지 않은 댓글 수로 재계산하는지 테스트
+    """
+    CommentFactory.create_batch(3, post=post, author=user)
+    CommentFactory(post=post, author=user).soft_delete()
+    Post.objects.filter(pk=post.pk).update(comment_count=0)
+    Post.objects.filter(pk=published_post.pk).update(comment_count=5)
+
+    call_command('recount_comments', batch_size=1)
+    assert _comment_count(post) == 3
+    assert _comment_count(published_post) == 0
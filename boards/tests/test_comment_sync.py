@@ -0,0 +1,106 @@
+# boards/tests/test_comment_sync.py
+
+import pytest
+from datetime import timedelta
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from boards.models import Comment
+from boards.sync import encode_sync_token
+from boards.tests.factories import CommentFactory
+
+# ============================
+# 댓글 델타 동기화 (?changed_since=) 테스트
+# ============================
+
+def _changes(client, post, token):
+    response = client.get(reverse('comment-list'), {'post': post.id, 'changed_since': token}, format='json')
+    assert response.status_code == status.HTTP_200_OK
+    return response.data
+
+def _age(comment, seconds=60):
+    """토큰 이전에 변경된 것처럼 updated_at 을 과거로 옮김"""
+    Comment.objects.filter(pk=comment.pk).update(updated_at=timezone.now() - timedelta(seconds=seconds))
+
+@pytest.mark.django_db
+def test_changes_since_token(authenticated_client, post, user, other_user):
+    """
+    토큰 이후 생성/수정된 댓글만 반환되고, 볼 수 있었던 댓글 중 삭제된 것만 tombstone 으로 반환되며
+    다른 사용자의 비공개 댓글 id 는 반환되지 않는지 테스트
+    """
+    unchanged, edited, deleted, hidden = CommentFactory.create_batch(4, post=post, author=other_user)
+    private = CommentFactory(post=post, author=other_user, is_public=False)
+    for comment in (unchanged, edited, deleted, hidden, private):
+        _age(comment)
+    token = encode_sync_token(timezone.now() - timedelta(seconds=30))
+
+    created = CommentFactory(post=post, author=user)
+    Comment.objects.filter(pk=edited.pk).update(content='edited', updated_at=timezone.now())
+    deleted.soft_delete()
+    Comment.objects.filter(pk=hidden.pk).update(is_public=False, updated_at=timezone.now())
+    Comment.objects.filter(pk=private.pk).update(content='edited', updated_at=timezone.now())
+    private.soft_delete()
+
+    data = _changes(authenticated_client, post, token)
+    assert data['reset'] is False
+    assert {c['id'] for c in data['results']} == {created.id, edited.id}
+    assert set(data['deleted']) == {deleted.id}
+    assert data['token']
+
+    # 새 토큰은 겹침 구간 이후의 변경만 반환
+    _age(created, 10)
+    for comment in (edited, deleted, hidden):
+        _age(comment, 10)
+    data = _changes(authenticated_client, post, data['token'])
+    assert data['results'] == [] and data['deleted'] == []
+
+@pytest.mark.django_db
+def test_admin_sees_deleted_as_changes(admin_authenticated_client, post, user):
+    """
+    삭제된 댓글도 조회 가능한 관리자에게는 tombstone 대신 deleted_at 이 채워진 댓글로 반환되는지 테스트
+    """
+    comment = CommentFactory(post=post, author=user)
+    token = encode_sync_token(timezone.now() - timedelta(seconds=1))
+    comment.soft_delete()
+
+    data = _changes(admin_authenticated_client, post, token)
+    assert [c['id'] for c in data['results']] == [comment.id]
+    assert data['results'][0]['deleted_at'] is not None
+    assert data['deleted'] == []
+
+@pytest.mark.django_db
+def test_changes_reset_when_too_many(authenticated_client, monkeypatch, post, user):
+    """
+    변경이 delta_limit 를 넘으면 reset 으로 전체 조회를 요청하는지 테스트
+    """
+    from boards.views import CommentViewSet
+    monkeypatch.setattr(CommentViewSet, 'delta_limit', 2)
+    CommentFactory.create_batch(3, post=post, author=user)
+    token = encode_sync_token(timezone.now() - timedelta(seconds=60))
+
+    data = _changes(authenticated_client, post, token)
+    assert data['reset'] is True
+    assert data['results'] == []
+
+@pytest.mark.django_db
+def test_invalid_token(authenticated_client, post):
+    """
+    잘못된 토큰이나 post 가 없는 요청은 400 을 반환하는지 테스트
+    """
+    response = authenticated_client.get(reverse('comment-list'), {'post': post.id, 'changed_since': 'abc'}, format='json')
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    token = encode_sync_token(timezone.now())
+    response = authenticated_client.get(reverse('comment-list'), {'changed_since': token}, format='json')
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert 'post' in response.data
+
+@pytest.mark.django_db
+def test_post_with_comments_includes_token(authenticated_client, post, user):
+    """
+    댓글 포함 상세의 token 으로 이후 변경분을 받을 수 있는지 테스트
+    """
+    response = authenticated_client.get(reverse('post-detail', args=[post.id]), {'include': 'comments'}, format='json')
+    token = response.data['comments']['token']
+    created = CommentFactory(post=post, author=user)
+    assert [c['id'] for c in _changes(authenticated_client, post, token)['results']] == [created.id]
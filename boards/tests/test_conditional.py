@@ -0,0 +1,124 @@
+# boards/tests/test_conditional.py
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from boards.tests.factories import CommentFactory
+
+# ============================
+# 조건부 GET (ETag / Last-Modified) 테스트
+# ============================
+
+@pytest.fixture(autouse=True)
+def no_response_cache(settings):
+    """검증자 계산 자체를 확인하기 위해 응답 캐시는 끔"""
+    settings.BOARD_CACHE_TIMEOUT = 0
+
+@pytest.mark.django_db
+def test_post_detail_not_modified(authenticated_client, django_assert_num_queries, post):
+    """
+    같은 ETag 로 다시 요청하면 게시글 1회 조회만으로 본문 없이 304 를 반환하는지 테스트
+    """
+    url = reverse('post-detail', args=[post.id])
+    response = authenticated_client.get(url, format='json')
+    assert response.status_code == status.HTTP_200_OK
+    assert response['Cache-Control'] == 'private, no-cache'
+    etag = response['ETag']
+
+    with django_assert_num_queries(1):
+        response = authenticated_client.get(url, format='json', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response['ETag'] == etag
+    assert not response.content
+
+@pytest.mark.django_db
+def test_post_detail_etag_changes(authenticated_client, post, user):
+    """
+    게시글 수정, 댓글 수 변경 시 ETag 가 바뀌어 200 을 반환하는지 테스트
+    """
+    url = reverse('post-detail', args=[post.id])
+    etag = authenticated_client.get(url, format='json')['ETag']
+
+    CommentFactory(post=post, author=user)
+    response = authenticated_client.get(url, format='json', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data['comment_count'] == 1
+    etag = response['ETag']
+
+    authenticated_client.patch(url, {'title': 'Edited'}, format='json')
+    response = authenticated_client.get(url, format='json', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response['ETag'] != etag
+
+@pytest.mark.django_db
+def test_post_detail_if_modified_since(authenticated_client, post):
+    """
+    If-Modified-Since 가 Last-Modified 이후이면 304 를 반환하는지 테스트
+    """
+    url = reverse('post-detail', args=[post.id])
+    last_modified = authenticated_client.get(url, format='json')['Last-Modified']
+    response = authenticated_client.get(url, format='json', HTTP_IF_MODIFIED_SINCE=last_modified)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+@pytest.mark.django_db
+def test_comment_list_not_modified(authenticated_client, post, user):
+    """
+    댓글 목록은 추가/수정/삭제 시에만 ETag 가 바뀌고, 쿼리스트링이 다르면 다른 ETag 를 갖는지 테스트
+    """
+    comment = CommentFactory(post=post, author=user)
+    url = reverse('comment-list')
+    etag = authenticated_client.get(url, {'post': post.id}, format='json')['ETag']
+
+    response = authenticated_client.get(url, {'post': post.id}, format='json', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert authenticated_client.get(url, {'post': post.id, 'page': 1}, format='json')['ETag'] != etag
+
+    authenticated_client.delete(reverse('comment-detail', args=[comment.id]))
+    response = authenticated_client.get(url, {'post': post.id}, format='json', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data['results'] == []
+
+@pytest.mark.django_db
+def test_no_last_modified_for_composite_responses(authenticated_client, post, user):
+    """
+    가장 최근 댓글이 삭제되면 보이는 행의 최종 수정 시각이 과거로 돌아가므로, 목록과 댓글 포함 상세는
+    Last-Modified 없이 ETag 로만 검증하여 If-Modified-Since 로 304 를 받지 않는지 테스트
+    """
+    CommentFactory(post=post, author=user)
+    newest = CommentFactory(post=post, author=user)
+    requests = [
+        (reverse('comment-list'), {'post': post.id}),
+        (reverse('post-detail', args=[post.id]), {'include': 'comments'}),
+    ]
+    for url, params in requests:
+        response = authenticated_client.get(url, params, format='json')
+        assert 'Last-Modified' not in response and response['ETag']
+
+    authenticated_client.delete(reverse('comment-detail', args=[newest.id]))
+    for url, params in requests:
+        response = authenticated_client.get(url, params, format='json', HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT')
+        assert response.status_code == status.HTTP_200_OK
+
+@pytest.mark.django_db
+def test_not_modified_from_response_cache(authenticated_client, django_assert_num_queries, settings, post):
+    """
+    응답 캐시에 저장된 검증자로 DB 조회 없이 304 를 반환하는지 테스트
+    """
+    settings.BOARD_CACHE_TIMEOUT = 60
+    url = reverse('post-detail', args=[post.id])
+    etag = authenticated_client.get(url, format='json')['ETag']
+    with django_assert_num_queries(0):
+        response = authenticated_client.get(url, format='json', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+@pytest.mark.django_db
+def test_response_cache_per_media_type(authenticated_client, settings, post):
+    """
+    JSON 응답으로 채워진 캐시 항목의 ETag 로 Browsable API 요청이 304 를 받지 않는지 테스트
+    """
+    settings.BOARD_CACHE_TIMEOUT = 60
+    url = reverse('post-detail', args=[post.id])
+    etag = authenticated_client.get(url, format='json')['ETag']
+    response = authenticated_client.get(url, HTTP_ACCEPT='text/html', HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response['ETag'] != etag
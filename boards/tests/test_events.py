@@ -0,0 +1,147 @@
+# boards/tests/test_events.py
+
+import asyncio
+import json
+import threading
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.test import AsyncClient, Client
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from boards import events
+from boards.tests.factories import CommentFactory, PostFactory
+
+# ============================
+# 실시간 이벤트 (SSE) 테스트
+# ============================
+
+def _parse(chunk):
+    """'event: <name>\\ndata: <json>\\n\\n' 형식의 SSE 메시지를 (name, data) 로 변환"""
+    lines = dict(line.split(': ', 1) for line in chunk.decode().strip().split('\n'))
+    return lines['event'], json.loads(lines['data'])
+
+def test_broker_delivers_across_threads():
+    """
+    다른 스레드에서 발행한 이벤트가 구독한 이벤트 루프로 전달되고, 큐가 넘치면 resync 로 바뀌는지 테스트
+    """
+    broker = events.Broker(queue_size=2)
+
+    async def scenario():
+        subscription = broker.subscribe('post:1')
+        publisher = threading.Thread(target=broker.publish, args=({'channel': 'post:1', 'type': 'x'},))
+        publisher.start()
+        publisher.join()
+        assert (await asyncio.wait_for(subscription.get(), 1))['type'] == 'x'
+
+        for _ in range(3):
+            broker.publish({'channel': 'post:1', 'type': 'x'})
+        broker.publish({'channel': 'post:2', 'type': 'other'})
+        await asyncio.sleep(0)
+        assert (await subscription.get())['type'] == 'resync'
+        assert subscription.queue.empty()
+
+        broker.unsubscribe(subscription)
+        assert not broker._subscriptions
+
+    async_to_sync(scenario)()
+
+@pytest.mark.django_db
+def test_format_event_respects_visibility(post, user, other_user, admin_user):
+    """
+    비공개 댓글은 작성자와 관리자에게만 내용이 전달되고, 다른 사용자에게는 생성 이벤트가 전달되지 않는지 테스트
+    """
+    comment = CommentFactory(post=post, author=user, is_public=False)
+    event = events.build_event('created', comment)
+    assert event['channel'] == f'post:{post.id}'
+
+    assert _parse(events.format_event(event, user).encode()) == ('comment.created', event['data'])
+    assert _parse(events.format_event(event, admin_user).encode())[0] == 'comment.created'
+    assert events.format_event(event, other_user) is None
+
+@pytest.mark.django_db
+def test_format_event_tombstone_only_if_previously_visible(post, user, other_user):
+    """
+    보이지 않게 된 대상의 삭제 이벤트는 변경 전에 보였던 사용자에게만 전달되는지 테스트
+    """
+    comment = CommentFactory(post=post, author=user, is_public=False)
+    hidden = events.build_event('updated', comment, was_public=True)
+    assert _parse(events.format_event(hidden, other_user).encode()) == ('comment.deleted', {'id': comment.id})
+    assert events.format_event(events.build_event('updated', comment), other_user) is None
+    assert events.format_event(events.build_event('deleted', comment), other_user) is None
+
+@pytest.mark.django_db(transaction=True)
+def test_notify_dispatch_skips_unsubscribed_channels(post, user, monkeypatch, django_assert_num_queries):
+    """
+    NOTIFY 를 받은 워커가 채널의 구독자가 없으면 행을 다시 읽지 않고, 구독자가 있으면 읽어서 전달하는지 테스트
+    (LISTEN 스레드처럼 커밋된 행을 읽도록 transaction=True)
+    """
+    broker, published = events.Broker(), []
+    monkeypatch.setattr(broker, 'publish', published.append)
+    monkeypatch.setattr(events, 'broker', broker)
+    backend = events.PostgresNotifyBackend()
+    comment = CommentFactory(post=post, author=user)
+    channel = events.event_channel(comment)
+    payload = json.dumps({'channel': channel, 'model': 'comment', 'id': comment.id, 'kind': 'created'})
+
+    with django_assert_num_queries(0):
+        backend.dispatch(payload)
+    assert not published
+
+    broker._subscriptions[channel].add('subscription')
+    backend.dispatch(payload)
+    assert [(event['type'], event['data']['id']) for event in published] == [('comment.created', comment.id)]
+
+@pytest.mark.django_db
+def test_comment_event_stream(post, user, django_capture_on_commit_callbacks):
+    """
+    댓글 생성/삭제가 커밋 후 게시글 채널의 SSE 스트림으로 전달되는지 테스트
+    """
+    api_client = APIClient()
+    api_client.force_authenticate(user=user)
+
+    def create_and_delete():
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.post(reverse('comment-list'), {'content': 'live', 'post': post.id}, format='json')
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.delete(reverse('comment-detail', args=[response.data['id']]))
+        return response.data['id']
+
+    async def scenario():
+        client = AsyncClient()
+        client.cookies['access_token'] = str(AccessToken.for_user(user))
+        response = await client.get(reverse('comment-events', args=[post.id]))
+        assert response.status_code == 200
+        assert response['Content-Type'] == 'text/event-stream'
+
+        stream = aiter(response.streaming_content)
+        assert await anext(stream) == b'retry: 3000\n\n'  # 이 시점에 구독됨
+        comment_id = await sync_to_async(create_and_delete)()
+
+        name, data = _parse(await asyncio.wait_for(anext(stream), 5))
+        assert (name, data['id'], data['content']) == ('comment.created', comment_id, 'live')
+        assert _parse(await asyncio.wait_for(anext(stream), 5)) == ('comment.deleted', {'id': comment_id})
+        await stream.aclose()
+
+    async_to_sync(scenario)()
+
+@pytest.mark.django_db
+def test_event_stream_access(user, other_user):
+    """
+    인증되지 않으면 401, 볼 수 없는 게시글이면 404, WSGI 로 요청하면 스트리밍 대신 204 를 반환하는지 테스트
+    """
+    private = PostFactory(author=other_user, business=other_user.business, is_public=False)
+    visible = PostFactory(author=other_user, business=other_user.business)
+    token = str(AccessToken.for_user(user))
+
+    async def scenario():
+        client = AsyncClient()
+        assert (await client.get(reverse('post-events'))).status_code == 401
+        client.cookies['access_token'] = token
+        assert (await client.get(reverse('comment-events', args=[private.id]))).status_code == 404
+
+    async_to_sync(scenario)()
+
+    client = Client()
+    client.cookies['access_token'] = token
+    assert client.get(reverse('comment-events', args=[visible.id])).status_code == 204
@@ -0,0 +1,95 @@
+# boards/tests/test_export.py
+
+import gzip
+import io
+import json
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+from boards.importer import BoardImporter, read_rows
+from boards.models import Post, Comment
+from boards.tests.factories import BusinessFactory, CommentFactory, PostFactory, UserFactory
+
+# ============================
+# 게시판 내보내기 테스트
+# ============================
+
+@pytest.fixture
+def exported_board(user, business):
+    posts = PostFactory.create_batch(3, author=user, business=business)
+    posts[2].soft_delete()
+    comments = CommentFactory.create_batch(2, author=user, post=posts[0])
+    other_business = BusinessFactory()
+    foreign = PostFactory(author=UserFactory(business=other_business), business=other_business)
+    CommentFactory(author=foreign.author, post=foreign)
+    return posts, comments
+
+def _content(response):
+    return b''.join(response.streaming_content)
+
+@pytest.mark.django_db
+def test_export_ndjson(admin_authenticated_client, exported_board, business):
+    """
+    관리자 내보내기는 소속 비즈니스의 게시글(삭제 포함)과 그 댓글만 스트리밍하고, 목록 필터를 적용하는지 테스트
+    """
+    posts, comments = exported_board
+    response = admin_authenticated_client.get(reverse('post-export'))
+    assert response.status_code == status.HTTP_200_OK
+    assert response.streaming
+    assert response['Content-Type'] == 'application/x-ndjson'
+    assert f'board-{business.pk}-' in response['Content-Disposition']
+
+    records = [json.loads(line) for line in _content(response).decode().splitlines()]
+    assert [(r['type'], r['id']) for r in records] == (
+        [('post', p.pk) for p in posts] + [('comment', c.pk) for c in comments]
+    )
+    assert records[2]['deleted_at'] is not None
+    assert records[3]['post'] == posts[0].pk
+
+    response = admin_authenticated_client.get(reverse('post-export'), {'is_public': 'false'})
+    assert _content(response) == b''
+
+@pytest.mark.django_db
+def test_export_csv_gzip_round_trip(admin_authenticated_client, exported_board, business):
+    """
+    gzip CSV 로 내보낸 파일을 다른 비즈니스로 가져오면 게시글/댓글이 그대로 복원되는지 테스트
+    """
+    response = admin_authenticated_client.get(reverse('post-export'), {'output': 'csv', 'gzip': 'true'})
+    assert response['Content-Type'] == 'application/gzip'
+    assert response['Content-Disposition'].endswith('.csv.gz"')
+
+    text = gzip.decompress(_content(response)).decode()
+    target = BusinessFactory()
+    # 원본 작성자는 대상 비즈니스의 구성원이 아니므로 기본 작성자로 대체됨
+    importer = BoardImporter(target, default_author=UserFactory(business=target).username)
+    report = importer.run(read_rows(io.StringIO(text, newline=''), 'csv'))
+    assert (report.posts, report.comments, report.skipped) == (3, 2, 0)
+
+    source = Post.objects.filter(business=business).order_by('pk')
+    copied = Post.objects.filter(business=target).order_by('pk')
+    assert [(p.title, p.created_at, p.deleted_at, p.comment_count) for p in copied] == [
+        (p.title, p.created_at, p.deleted_at, p.comment_count) for p in source
+    ]
+    assert Comment.objects.filter(business=target).count() == 2
+
+@pytest.mark.django_db
+def test_export_streams_under_asgi(admin_user, exported_board):
+    """ASGI 에서도 비동기 반복자로 흘려보내는지 테스트"""
+    client = AsyncClient()
+    client.cookies['access_token'] = str(AccessToken.for_user(admin_user))
+
+    async def export():
+        response = await client.get(reverse('post-export'))
+        return response, b''.join([chunk async for chunk in response.streaming_content])
+
+    response, content = async_to_sync(export)()
+    assert response.is_async
+    assert len(content.decode().splitlines()) == 5
+
+@pytest.mark.django_db
+def test_export_requires_admin(authenticated_client):
+    response = authenticated_client.get(reverse('post-export'))
+    assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,124 @@
+# boards/tests/test_import.py
+
+import json
+import pytest
+from datetime import datetime, timezone as dt_timezone
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from boards.importer import BoardImporter
+from boards.models import Post, Comment
+
+# ============================
+# 게시판 가져오기 테스트
+# ============================
+
+CREATED = datetime(2021, 3, 1, 9, 30, tzinfo=dt_timezone.utc)
+
+def _jsonl(rows):
+    return ''.join(json.dumps(row, ensure_ascii=False) + '\n' for row in rows)
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('copy', [
+    pytest.param(True, marks=pytest.mark.skipif(connection.vendor != 'postgresql', reason='COPY 는 PostgreSQL 전용')),
+    False,
+])
+def test_import_board_command(tmp_path, capsys, copy, user, other_user, business):
+    """
+    원본 id 로 댓글이 게시글에 연결되고, 작성자/원본 시각/comment_count 가 유지되며 잘못된 행은 건너뛰는지 테스트
+    """
+    path = tmp_path / 'board.jsonl'
+    path.write_text(_jsonl([
+        {'id': 'p1', 'author': user.username, 'title': '첫 글', 'content': 'tab\there\nnewline \\N', 'created_at': CREATED.isoformat()},
+        {'id': 'p2', 'author': other_user.username, 'title': '비공개', 'content': '', 'is_public': False,
+         'created_at': '2021-03-02T10:00:00+00:00', 'deleted_at': '2021-04-01T00:00:00+00:00'},
+        {'type': 'comment', 'post': 'p1', 'author': other_user.username, 'content': 'c1', 'created_at': CREATED.isoformat()},
+        {'type': 'comment', 'post': 'p1', 'author': user.username, 'content': 'deleted', 'created_at': CREATED.isoformat(),
+         'deleted_at': CREATED.isoformat()},
+        {'type': 'comment', 'post': 'missing', 'author': user.username, 'content': 'c', 'created_at': CREATED.isoformat()},
+        {'id': 'p3', 'author': 'stranger', 'title': 't', 'content': 'c', 'created_at': CREATED.isoformat()},
+        {'id': 'p1', 'author': user.username, 'title': '중복', 'content': 'c', 'created_at': CREATED.isoformat()},
+    ]) + '{broken\n')
+    id_map = tmp_path / 'ids.csv'
+
+    args = ['import_board', business.pk, str(path), '--chunk-size', '2', '--id-map', str(id_map)]
+    call_command(*args, *([] if copy else ['--no-copy']))
+    output = capsys.readouterr()
+    assert '게시글 2개, 댓글 2개 가져옴, 4행 건너뜀' in output.out
+    assert '5행' in output.err and '8행' in output.err
+
+    first, second = Post.objects.filter(business=business).order_by('created_at')
+    assert (first.title, first.author, first.content) == ('첫 글', user, 'tab\there\nnewline \\N')
+    assert first.created_at == first.updated_at == CREATED
+    assert first.comment_count == 1
+    assert (second.is_public, second.is_deleted, second.author) == (False, True, other_user)
+    comments = Comment.objects.filter(post=first).order_by('content')
+    assert [(c.content, c.business_id, c.created_at) for c in comments] == [
+        ('c1', business.pk, CREATED), ('deleted', business.pk, CREATED),
+    ]
+
+    # 매핑 파일로 이어서 가져오면 이미 가져온 게시글은 건너뛰고 댓글은 기존 게시글에 연결
+    path.write_text(_jsonl([
+        {'id': 'p2', 'author': user.username, 'title': 'again', 'content': 'c', 'created_at': CREATED.isoformat()},
+        {'type': 'comment', 'post': 'p2', 'author': user.username, 'content': 'late', 'created_at': CREATED.isoformat()},
+    ]))
+    call_command(*args)
+    assert Post.objects.filter(business=business).count() == 2
+    assert Comment.objects.get(content='late').post == second
+
+@pytest.mark.django_db
+def test_import_rollback_keeps_id_map(monkeypatch, user, business):
+    """
+    청크 기록이 실패해 롤백되면 그 청크의 게시글이 매핑에 남지 않아 다음 실행에서 다시 가져오는지 테스트
+    """
+    rows = list(enumerate([
+        {'id': 'p1', 'author': user.username, 'title': 't', 'content': 'c', 'created_at': CREATED.isoformat()},
+        {'type': 'comment', 'post': 'p1', 'author': user.username, 'content': 'c', 'created_at': CREATED.isoformat()},
+    ], 1))
+    id_map = {}
+
+    def fail(rows):
+        raise RuntimeError('interrupted')
+
+    importer = BoardImporter(business, use_copy=False, id_map=id_map)
+    monkeypatch.setattr(importer, 'write_comments', fail)
+    with pytest.raises(RuntimeError):
+        importer.run(rows)
+    assert id_map == {}
+    assert not Post.objects.exists()
+
+    report = BoardImporter(business, use_copy=False, id_map=id_map).run(rows)
+    assert (report.posts, report.comments, report.skipped) == (1, 1, 0)
+    assert id_map == {'p1': Post.objects.get().pk}
+
+@pytest.mark.django_db
+def test_import_api(api_client, admin_user, user, business):
+    """
+    관리자는 CSV 를 업로드해 가져올 수 있고(기본 작성자 대체), 일반 사용자는 403 을 받는지 테스트
+    """
+    url = reverse('post-import-board')
+    csv_text = (
+        'type,id,post,author,title,content,is_public,created_at\n'
+        f'post,10,,{user.username},"제목, 쉼표",본문,true,2020-01-01T00:00:00Z\n'
+        'comment,,10,retired,,댓글,false,2020-01-02T00:00:00Z\n'
+    )
+
+    api_client.force_authenticate(user=user)
+    response = api_client.post(url, {'file': SimpleUploadedFile('old.csv', csv_text.encode())}, format='multipart')
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    api_client.force_authenticate(user=admin_user)
+    upload = SimpleUploadedFile('old.csv', csv_text.encode())
+    response = api_client.post(url, {'file': upload, 'default_author': user.username}, format='multipart')
+    assert response.status_code == status.HTTP_200_OK
+    assert (response.data['posts'], response.data['comments'], response.data['skipped']) == (1, 1, 0)
+
+    post = Post.objects.get(title='제목, 쉼표')
+    comment = post.comments.get()
+    assert (comment.author, comment.is_public, post.comment_count) == (user, False, 1)
+
+    upload = SimpleUploadedFile('old.txt', b'x')
+    response = api_client.post(url, {'file': upload}, format='multipart')
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,108 @@
+# boards/tests/test_indexes.py
+
+from types import SimpleNamespace
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+from boards.models import Post, Comment
+from boards.views import PostViewSet, CommentViewSet
+from authentication.models import BusinessMember
+
+pytestmark = pytest.mark.skipif(
+    connection.vendor != 'postgresql', reason='실행 계획 검증은 PostgreSQL에서만 수행'
+)
+
+# ============================
+# 인덱스 사용 여부(실행 계획) 테스트
+# ============================
+
+@pytest.fixture
+def seeded_board(db, business):
+    """작성자 20명, 게시글 2,000개(10%는 삭제, 20%는 비공개), 댓글 4,000개를 한 번에 생성"""
+    authors = BusinessMember.objects.bulk_create([
+        BusinessMember(username=f'author{i}', password='!', business=business) for i in range(20)
+    ])
+
+    now = timezone.now()
+    posts = Post.objects.bulk_create([
+        Post(
+            business=business,
+            author=authors[i % len(authors)],
+            title=f'title {i}',
+            content='content',
+            is_public=i % 5 != 0,
+            deleted_at=now if i % 10 == 0 else None,
+        )
+        for i in range(2000)
+    ])
+    Comment.objects.bulk_create([
+        Comment(
+            post=posts[i % 200],
+            business=business,
+            author=authors[i % len(authors)],
+            content='comment',
+            deleted_at=now if i % 10 == 0 else None,
+        )
+        for i in range(4000)
+    ])
+
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE boards_post')
+        cursor.execute('ANALYZE boards_comment')
+        # select_related 조인 상대의 통계가 오래되면(자동 VACUUM 직후 등) 작성자 쪽부터 조인하는 계획이 선택됨
+        cursor.execute('ANALYZE authentication_businessmember')
+        # 소규모 데이터에서도 "인덱스를 쓸 수 있는가"를 검증하도록 순차 스캔 비용을 높임
+        cursor.execute('SET LOCAL enable_seqscan = off')
+    return SimpleNamespace(authors=authors, posts=posts)
+
+def _get_queryset(viewset_class, user):
+    view = viewset_class()
+    view.request = SimpleNamespace(user=user)
+    return view.get_queryset()
+
+def _index_names(index_name):
+    """분할 테이블(PostgreSQL)이면 실행 계획에는 파티션별 인덱스 이름이 나타나므로 함께 반환"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid WHERE i.inhparent = %s::regclass',
+            [index_name],
+        )
+        return {index_name, *(row[0] for row in cursor.fetchall())}
+
+def _assert_uses_index(queryset, index_name, table):
+    plan = queryset.explain()
+    assert any(name in plan for name in _index_names(index_name)), plan
+    assert f'Seq Scan on {table}' not in plan, plan
+
+@pytest.mark.django_db
+def test_member_post_list_uses_live_index(seeded_board):
+    """일반 사용자 게시글 목록은 삭제되지 않은 게시글 부분 인덱스를 사용"""
+    member = seeded_board.authors[0]
+    _assert_uses_index(_get_queryset(PostViewSet, member)[:20], 'post_live_created_idx', 'boards_post')
+
+@pytest.mark.django_db
+def test_admin_post_list_uses_created_index(seeded_board, admin_user):
+    """관리자 게시글 목록은 created_at 복합 인덱스를 사용"""
+    _assert_uses_index(_get_queryset(PostViewSet, admin_user)[:20], 'post_created_idx', 'boards_post')
+
+@pytest.mark.django_db
+def test_my_posts_uses_author_index(seeded_board):
+    """my_posts 는 (author, created_at) 인덱스를 사용"""
+    member = seeded_board.authors[0]
+    queryset = _get_queryset(PostViewSet, member).filter(author=member)[:20]
+    _assert_uses_index(queryset, 'post_author_created_idx', 'boards_post')
+
+@pytest.mark.django_db
+def test_post_comment_list_uses_post_live_index(seeded_board):
+    """게시글별 댓글 목록은 (post, created_at) 부분 인덱스를 사용"""
+    member = seeded_board.authors[0]
+    queryset = _get_queryset(CommentViewSet, member).filter(post=seeded_board.posts[0])[:20]
+    _assert_uses_index(queryset, 'comment_post_live_idx', 'boards_comment')
+
+@pytest.mark.django_db
+def test_my_comments_uses_author_index(seeded_board):
+    """my_comments 는 (author, created_at) 인덱스를 사용"""
+    member = seeded_board.authors[0]
+    queryset = _get_queryset(CommentViewSet, member).filter(author=member)[:20]
+    _assert_uses_index(queryset, 'comment_author_created_idx', 'boards_comment')
@@ -0,0 +1,82 @@
+# boards/tests/test_jwt_auth.py
+
+import pytest
+from unittest import mock
+from datetime import timedelta
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+from authentication.backends import CookieJWTAuthentication
+
+# ============================
+# 쿠키 JWT 인증 테스트
+# - 미들웨어와 DRF 인증이 한 요청에서 토큰 검증/사용자 조회를 한 번만 수행하는지 확인
+# ============================
+
+@pytest.fixture
+def cookie_client(api_client, user):
+    """access_token 쿠키로 인증하는 클라이언트를 반환하는 Fixture"""
+    api_client.cookies['access_token'] = str(AccessToken.for_user(user))
+    return api_client
+
+@pytest.fixture
+def user_cache(settings):
+    """사용자 캐시를 활성화하는 Fixture (쿼리 수를 확인하기 위해 응답 캐시는 끔)"""
+    settings.JWT_USER_CACHE_TIMEOUT = 60
+    settings.BOARD_CACHE_TIMEOUT = 0
+
+def _count_validations():
+    return mock.patch.object(
+        CookieJWTAuthentication, 'get_validated_token',
+        autospec=True, side_effect=CookieJWTAuthentication.get_validated_token,
+    )
+
+@pytest.mark.django_db
+def test_token_validated_once_per_request(cookie_client, django_assert_num_queries, post):
+    """
+    토큰 검증 1회, 사용자 조회 1회 + 게시글 조회 1회로 처리되는지 테스트
+    """
+    with _count_validations() as validate, django_assert_num_queries(2):
+        response = cookie_client.get(reverse('post-detail', args=[post.id]), format='json')
+    assert response.status_code == status.HTTP_200_OK
+    assert validate.call_count == 1
+
+@pytest.mark.django_db
+def test_expired_token_validated_once(api_client, user):
+    """
+    만료된 토큰도 한 번만 검증되고 기존과 같은 401 메시지를 반환하는지 테스트
+    """
+    token = AccessToken.for_user(user)
+    token.set_exp(lifetime=-timedelta(minutes=1))
+    api_client.cookies['access_token'] = str(token)
+
+    with _count_validations() as validate:
+        response = api_client.get(reverse('post-list'), format='json')
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.data['detail'] == 'Access token has expired.'
+    assert validate.call_count == 1
+
+@pytest.mark.django_db
+def test_cached_user_skips_query(cookie_client, django_assert_num_queries, user_cache, post):
+    """
+    사용자 캐시가 켜져 있으면 두 번째 요청부터 사용자 조회 쿼리가 생략되는지 테스트
+    """
+    url = reverse('post-detail', args=[post.id])
+    with django_assert_num_queries(2):
+        cookie_client.get(url, format='json')
+    with django_assert_num_queries(1):
+        response = cookie_client.get(url, format='json')
+    assert response.status_code == status.HTTP_200_OK
+
+@pytest.mark.django_db
+def test_cached_user_invalidated_on_change(cookie_client, user_cache, user, post):
+    """
+    사용자가 비활성화되면 캐시가 무효화되어 다음 요청부터 인증에 실패하는지 테스트
+    """
+    url = reverse('post-detail', args=[post.id])
+    assert cookie_client.get(url, format='json').status_code == status.HTTP_200_OK
+
+    user.is_active = False
+    user.save()
+    response = cookie_client.get(url, format='json')
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
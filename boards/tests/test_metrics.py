@@ -0,0 +1,118 @@
+# boards/tests/test_metrics.py
+
+import json
+import pytest
+import threading
+from django.conf import settings as django_settings
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+from authentication import metrics
+
+# ============================
+# 요청 계측 (Server-Timing, /metrics) 테스트
+# ============================
+
+@pytest.fixture(autouse=True)
+def reset_registry(settings):
+    """테스트 간 지표가 섞이지 않도록 집계를 초기화하고 응답 캐시를 끔"""
+    settings.BOARD_CACHE_TIMEOUT = 0
+    metrics.registry.reset()
+    yield
+    metrics.registry.reset()
+
+@pytest.fixture
+def cookie_client(api_client, user):
+    api_client.cookies['access_token'] = str(AccessToken.for_user(user))
+    return api_client
+
+def _server_timing(response):
+    entries = {}
+    for entry in response['Server-Timing'].split(', '):
+        name, *params = entry.split(';')
+        entries[name] = dict(param.split('=', 1) for param in params)
+    return entries
+
+@pytest.mark.django_db
+def test_server_timing_header(cookie_client, post, django_assert_num_queries):
+    """
+    응답의 Server-Timing 에 인증/렌더링 단계와 실제 실행된 쿼리 수가 포함되는지 테스트
+    """
+    with django_assert_num_queries(3) as captured:
+        response = cookie_client.get(reverse('post-list'), format='json')
+    assert response.status_code == 200
+
+    timing = _server_timing(response)
+    assert {'jwt', 'render', 'app', 'db', 'total'} <= timing.keys()
+    assert timing['db']['desc'] == f'"{len(captured)} queries"'
+    assert float(timing['total']['dur']) >= float(timing['db']['dur'])
+
+@pytest.mark.django_db
+def test_metrics_aggregated_by_view_action(cookie_client, client, settings, post, tmp_path):
+    """
+    뷰/액션별로 집계되고, METRICS_DIR 의 다른 워커 지표와 합산되어 토큰이 있을 때만 조회되는지 테스트
+    """
+    settings.METRICS_TOKEN = 'secret'
+    settings.METRICS_DIR = str(tmp_path)
+    settings.METRICS_FLUSH_INTERVAL = 0
+
+    cookie_client.get(reverse('post-list'), format='json')
+    cookie_client.get(reverse('post-my-posts'), format='json')
+    cookie_client.get(reverse('post-detail', args=[post.id]), format='json')
+
+    # 다른 gunicorn 워커가 내보낸 지표
+    other = metrics.MetricsRegistry()
+    other.observe('PostViewSet.list', 'GET', 200, metrics.RequestTimings(), 0.2)
+    (tmp_path / 'metrics-99999.json').write_text(json.dumps(other.snapshot()))
+
+    assert client.get('/metrics/').status_code == 401
+    assert client.get('/metrics/', HTTP_AUTHORIZATION='Bearer wrong').status_code == 401
+    response = client.get('/metrics/', HTTP_AUTHORIZATION='Bearer secret')
+    assert response.status_code == 200
+    body = response.content.decode()
+
+    assert 'board_http_requests_total{view="PostViewSet.list",method="GET",status="200"} 2' in body
+    assert 'board_http_requests_total{view="PostViewSet.my_posts",method="GET",status="200"} 1' in body
+    assert 'board_http_request_duration_seconds_count{view="PostViewSet.retrieve"} 1' in body
+    assert 'board_db_queries_total{view="PostViewSet.list"}' in body
+    assert 'board_http_request_phase_seconds_total{view="PostViewSet.list",phase="jwt"}' in body
+
+    settings.METRICS_TOKEN = ''
+    assert client.get('/metrics/').status_code == 404
+
+def test_flush_from_threads(tmp_path):
+    """
+    스레드 워커(gthread, ASGI)의 여러 요청 스레드가 동시에 내보내도 오류 없이 파일 하나로 기록되는지 테스트
+    """
+    errors = []
+
+    def flush():
+        for _ in range(50):
+            try:
+                metrics.registry.flush(str(tmp_path))
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=flush) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert [path.suffix for path in tmp_path.iterdir()] == ['.json']
+
+@pytest.mark.skipif(not django_settings.DATABASES['default']['OPTIONS'].get('pool'), reason='DATABASE_POOL=False')
+@pytest.mark.django_db
+def test_metrics_include_pool_stats(cookie_client, client, settings):
+    """
+    연결 풀을 사용하면 DB 별 풀 크기/대기 지표가 함께 조회되는지 테스트
+    """
+    settings.METRICS_TOKEN = 'secret'
+    cookie_client.get(reverse('post-list'), format='json')
+
+    stats = metrics.pool_stats()['default']
+    assert stats['pool_max'] == django_settings.DATABASE_POOL_OPTIONS['max_size']
+    assert stats['pool_size'] >= 1 and stats['requests_num'] >= 1
+
+    body = client.get('/metrics/', HTTP_AUTHORIZATION='Bearer secret').content.decode()
+    assert f'board_db_pool_max_connections{{database="default"}} {stats["pool_max"]}' in body
+    assert 'board_db_pool_wait_seconds_total{database="default"}' in body
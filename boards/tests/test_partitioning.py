@@ -0,0 +1,68 @@
+# boards/tests/test_partitioning.py
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.urls import reverse
+from boards.models import Post, Comment
+from boards.partitioning import business_partition, is_partitioned
+from boards.tests.factories import BusinessFactory, CommentFactory, PostFactory, UserFactory
+
+# ============================
+# 비즈니스별 파티션 테스트
+# ============================
+
+requires_partitioning = pytest.mark.skipif(
+    connection.vendor != 'postgresql', reason='파티션은 PostgreSQL 전용',
+)
+
+def _partition_of(model, pk):
+    """행이 저장된 실제 파티션 이름"""
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT tableoid::regclass::text FROM {model._meta.db_table} WHERE id = %s', [pk])
+        return cursor.fetchone()[0]
+
+@pytest.mark.django_db
+def test_comment_copies_post_business(authenticated_client, post):
+    """
+    API 로 생성한 댓글에 게시글의 business 가 복제되는지 테스트
+    """
+    response = authenticated_client.post(reverse('comment-list'), {'content': 'hi', 'post': post.id}, format='json')
+    assert Comment.objects.get(pk=response.data['id']).business_id == post.business_id
+
+@requires_partitioning
+@pytest.mark.django_db
+def test_business_partition_lifecycle(admin_authenticated_client, business):
+    """
+    전용 파티션으로 옮긴 뒤에도 조회/쓰기가 그대로 동작하고, 분리하면 해당 비즈니스의 행만 사라지는지 테스트
+    """
+    assert is_partitioned()
+    tenant = BusinessFactory()
+    author = UserFactory(business=tenant)
+    post = PostFactory(author=author, business=tenant, title='quarterly roadmap')
+    comment = CommentFactory(post=post, author=author)
+    other = PostFactory(business=business, author=UserFactory(business=business))
+    assert _partition_of(Post, post.pk) == 'boards_post_default'
+
+    call_command('partition_business', tenant.pk)
+    assert _partition_of(Post, post.pk) == business_partition('boards_post', tenant.pk)
+    assert _partition_of(Comment, comment.pk) == business_partition('boards_comment', tenant.pk)
+
+    # 새 행은 PostgreSQL 이 전용 파티션으로 배치
+    new_post = PostFactory(author=author, business=tenant)
+    assert _partition_of(Post, new_post.pk) == business_partition('boards_post', tenant.pk)
+    response = admin_authenticated_client.get(reverse('comment-list'), {'post': post.pk})
+    assert [row['id'] for row in response.data['results']] == [comment.pk]
+    assert Post.objects.filter(search_vector='roadmap').exists()  # 트리거로 채운 검색 벡터 유지
+
+    with pytest.raises(CommandError):
+        call_command('partition_business', tenant.pk)  # 이미 전용 파티션이 있음
+
+    call_command('partition_business', tenant.pk, detach=True, drop=True)
+    assert not Post.objects.filter(business=tenant).exists()
+    assert not Comment.objects.filter(business=tenant).exists()
+    assert Post.objects.filter(pk=other.pk).exists()
+
+    with pytest.raises(CommandError):
+        call_command('partition_business', tenant.pk, detach=True)
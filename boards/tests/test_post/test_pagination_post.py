@@ -3,6 +3,8 @@
 import pytest
 from rest_framework import status
 from django.urls import reverse
+from django.utils import timezone
+from boards.models import Post
 from boards.tests.factories import PostFactory
 
 # ============================
@@ -47,3 +49,93 @@ def test_pagination_last_page(authenticated_client, user):
     assert len(response.data['results']) == 5
     assert response.data['next'] is None
     assert response.data['previous'] is not None
+
+# ============================
+# 커서(keyset) 페이지네이션 테스트
+# ============================
+
+def _collect_pages(client, url, direction='next'):
+    """next(또는 previous) 링크를 끝까지 따라가며 각 페이지의 게시글 ID 목록을 반환"""
+    pages = []
+    while url:
+        response = client.get(url, format='json')
+        assert response.status_code == status.HTTP_200_OK
+        pages.append([p['id'] for p in response.data['results']])
+        url = response.data[direction]
+    return pages
+
+@pytest.mark.django_db
+def test_cursor_pagination_posts(authenticated_client, user):
+    """
+    ?pagination=cursor 요청 시 count 없이 next/previous 커서로 전체 게시글을 중복 없이 순회하는지 테스트
+    """
+    posts = [PostFactory(author=user, business=user.business) for _ in range(45)]
+    url = reverse('post-list') + '?pagination=cursor'
+    response = authenticated_client.get(url, format='json')
+    assert response.status_code == status.HTTP_200_OK
+    assert 'count' not in response.data
+    assert response.data['previous'] is None
+    assert len(response.data['results']) == 20
+
+    pages = _collect_pages(authenticated_client, url)
+    assert [len(page) for page in pages] == [20, 20, 5]
+    ids = [post_id for page in pages for post_id in page]
+    assert ids == sorted((p.id for p in posts), reverse=True)
+
+@pytest.mark.django_db
+def test_cursor_pagination_ties_on_created_at(authenticated_client, user):
+    """
+    created_at 이 같은 게시글이 많아도 id 로 순서가 결정되어 누락/중복이 없는지 테스트
+    """
+    posts = [PostFactory(author=user, business=user.business) for _ in range(25)]
+    Post.objects.filter(id__in=[p.id for p in posts]).update(created_at=timezone.now())
+
+    pages = _collect_pages(authenticated_client, reverse('post-list') + '?pagination=cursor')
+    ids = [post_id for page in pages for post_id in page]
+    assert ids == sorted((p.id for p in posts), reverse=True)
+
+@pytest.mark.django_db
+def test_cursor_pagination_previous_link(authenticated_client, user):
+    """
+    previous 링크를 따라가면 이전 페이지를 같은 순서로 다시 조회하는지 테스트
+    """
+    for _ in range(45):
+        PostFactory(author=user, business=user.business)
+    forward = _collect_pages(authenticated_client, reverse('post-list') + '?pagination=cursor')
+
+    last_page = authenticated_client.get(reverse('post-list') + '?pagination=cursor', format='json')
+    while last_page.data['next']:
+        last_page = authenticated_client.get(last_page.data['next'], format='json')
+
+    backward = _collect_pages(authenticated_client, last_page.data['previous'], direction='previous')
+    assert backward == forward[-2::-1]
+
+@pytest.mark.django_db
+def test_cursor_pagination_ascending(authenticated_client, user):
+    """
+    ordering=created_at 과 함께 사용하면 오래된 순으로 페이지를 넘기는지 테스트
+    """
+    posts = [PostFactory(author=user, business=user.business) for _ in range(25)]
+    pages = _collect_pages(authenticated_client, reverse('post-list') + '?pagination=cursor&ordering=created_at')
+    ids = [post_id for page in pages for post_id in page]
+    assert ids == [p.id for p in posts]
+
+@pytest.mark.django_db
+def test_cursor_pagination_invalid_cursor(authenticated_client):
+    """
+    잘못된 커서 값을 보내면 404 Not Found 응답을 받는지 테스트
+    """
+    url = reverse('post-list') + '?pagination=cursor&cursor=not-a-cursor'
+    response = authenticated_client.get(url, format='json')
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+@pytest.mark.django_db
+def test_cursor_pagination_my_posts(authenticated_client, user, other_user):
+    """
+    my_posts 액션도 커서 페이지네이션을 지원하는지 테스트
+    """
+    mine = [PostFactory(author=user, business=user.business) for _ in range(22)]
+    PostFactory(author=other_user, business=other_user.business)
+    pages = _collect_pages(authenticated_client, reverse('post-my-posts') + '?pagination=cursor')
+    assert [len(page) for page in pages] == [20, 2]
+    assert sorted(post_id for page in pages for post_id in page) == sorted(p.id for p in mine)
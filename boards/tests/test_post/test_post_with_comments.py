@@ -0,0 +1,62 @@
+# boards/tests/test_post/test_post_with_comments.py
+
+import pytest
+from rest_framework import status
+from django.urls import reverse
+from boards.tests.factories import CommentFactory
+
+# ============================
+# 댓글 포함 게시글 상세 (?include=comments) 테스트
+# ============================
+
+def _detail(client, post, **extra):
+    return client.get(reverse('post-detail', args=[post.id]), {'include': 'comments'}, format='json', **extra)
+
+@pytest.mark.django_db
+def test_retrieve_post_with_comments(authenticated_client, post, user, other_user):
+    """
+    상세 응답에 사용자에게 보이는 댓글만 최신순으로 포함되는지 테스트
+    """
+    visible = CommentFactory(post=post, author=other_user)
+    mine_private = CommentFactory(post=post, author=user, is_public=False)
+    CommentFactory(post=post, author=other_user, is_public=False)
+
+    response = _detail(authenticated_client, post)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data['title'] == post.title
+    assert [c['id'] for c in response.data['comments']['results']] == [mine_private.id, visible.id]
+    assert response.data['comments']['next'] is None
+
+    # include 없이 조회하면 기존 표현과 같음
+    plain = authenticated_client.get(reverse('post-detail', args=[post.id]), format='json')
+    assert 'comments' not in plain.data
+
+@pytest.mark.django_db
+def test_post_with_comments_next_page(authenticated_client, post, user):
+    """
+    첫 페이지를 넘는 댓글은 next 의 커서 링크로 이어서 조회되는지 테스트
+    """
+    comments = CommentFactory.create_batch(25, post=post, author=user)
+    data = _detail(authenticated_client, post).data['comments']
+    assert len(data['results']) == 20
+
+    response = authenticated_client.get(data['next'], format='json')
+    assert response.status_code == status.HTTP_200_OK
+    ids = [c['id'] for c in data['results']] + [c['id'] for c in response.data['results']]
+    assert sorted(ids) == sorted(c.id for c in comments)
+    assert response.data['next'] is None
+
+@pytest.mark.django_db
+def test_post_with_comments_etag_follows_comment_edits(authenticated_client, settings, post, user):
+    """
+    댓글이 수정되면 포함 응답의 ETag 가 바뀌는지 테스트
+    """
+    settings.BOARD_CACHE_TIMEOUT = 0
+    comment = CommentFactory(post=post, author=user)
+    etag = _detail(authenticated_client, post)['ETag']
+    assert _detail(authenticated_client, post, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
+
+    authenticated_client.patch(reverse('comment-detail', args=[comment.id]), {'content': 'edited'}, format='json')
+    response = _detail(authenticated_client, post, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data['comments']['results'][0]['content'] == 'edited'
@@ -0,0 +1,88 @@
+# boards/tests/test_provision.py
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from authentication.models import BusinessMember
+from authentication.provisioning import MemberProvisioner, enumerate_rows
+
+# ============================
+# 구성원 일괄 등록 테스트
+# ============================
+
+PASSWORD = 'provision-pass-1!'
+
+@pytest.mark.django_db
+def test_bulk_members_reports_row_errors(admin_authenticated_client, admin_user, user, business):
+    """
+    관리자 일괄 등록 API 가 올바른 행만 소속 비즈니스로 등록하고, 잘못된 행은 순번과 함께 보고하는지 테스트
+    """
+    rows = [
+        {'username': 'new-member', 'password': PASSWORD},
+        {'username': 'new-admin', 'password': PASSWORD, 'role': 'admin'},
+        {'username': 'new-member', 'password': PASSWORD},  # 입력 안에서 중복
+        {'username': user.username, 'password': PASSWORD},  # 이미 등록됨
+        {'username': 'weak', 'password': '1234'},
+        {'username': 'bad-role', 'password': PASSWORD, 'role': 'owner'},
+        'not an object',
+    ]
+    response = admin_authenticated_client.post(reverse('member_bulk'), rows, format='json')
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.data['created'] == 2
+    assert response.data['skipped'] == 5
+    assert {error['line']: list(error['errors']) for error in response.data['errors']} == {
+        3: ['username'], 4: ['username'], 5: ['password'], 6: ['role'], 7: ['non_field_errors'],
+    }
+
+    members = {member.username: member for member in BusinessMember.objects.filter(username__startswith='new-')}
+    assert {name: member.role for name, member in members.items()} == {'new-member': 'member', 'new-admin': 'admin'}
+    assert all(member.business_id == business.pk and member.check_password(PASSWORD) for member in members.values())
+
+@pytest.mark.django_db
+def test_bulk_members_admin_only(authenticated_client):
+    response = authenticated_client.post(reverse('member_bulk'), [{'username': 'x', 'password': PASSWORD}], format='json')
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert not BusinessMember.objects.filter(username='x').exists()
+
+@pytest.mark.django_db
+def test_bulk_members_row_limit(admin_authenticated_client, settings):
+    settings.MEMBER_PROVISION_MAX_ROWS = 1
+    rows = [{'username': f'm{i}', 'password': PASSWORD} for i in range(2)]
+    response = admin_authenticated_client.post(reverse('member_bulk'), rows, format='json')
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert not BusinessMember.objects.filter(username__in=['m0', 'm1']).exists()
+
+@pytest.mark.django_db
+def test_provision_checks_usernames_once(business, settings):
+    """
+    구성원 수와 관계없이 username 중복 조회와 INSERT 가 한 번씩만 실행되는지 테스트
+    """
+    settings.PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']  # 쿼리 수만 확인
+    rows = enumerate_rows([{'username': f'member-{i}', 'password': PASSWORD} for i in range(20)])
+    with CaptureQueriesContext(connection) as queries:
+        report = MemberProvisioner(business, workers=1).run(rows)
+    assert report.created == 20
+    statements = [query['sql'].split(' ', 1)[0] for query in queries.captured_queries]
+    assert statements.count('SELECT') == 1
+    assert statements.count('INSERT') == 1
+
+@pytest.mark.django_db
+def test_provision_members_command(tmp_path, capsys, business):
+    """
+    provision_members 명령이 CSV 의 구성원을 여러 프로세스에서 해시하여 등록하는지 테스트
+    """
+    path = tmp_path / 'members.csv'
+    lines = ['username,password,role'] + [f'csv-{i},{PASSWORD},member' for i in range(8)] + ['csv-0,,member']
+    path.write_text('\n'.join(lines) + '\n')
+
+    call_command('provision_members', str(business.pk), str(path), '--workers', '2')
+    captured = capsys.readouterr()
+    assert '구성원 8명 등록, 1행 건너뜀' in captured.out
+    assert '10행' in captured.err  # 비밀번호가 빈 행 (헤더가 1행)
+
+    members = BusinessMember.objects.filter(business=business, username__startswith='csv-')
+    assert members.count() == 8
+    assert all(member.check_password(PASSWORD) for member in members)
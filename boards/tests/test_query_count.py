@@ -0,0 +1,91 @@
+# boards/tests/test_query_count.py
+
+import pytest
+from rest_framework import status
+from django.urls import reverse
+from boards.tests.factories import PostFactory, CommentFactory, UserFactory
+
+# ============================
+# 쿼리 수 회귀 테스트
+# - 목록은 행 수와 무관하게 (COUNT + SELECT) 2회, 상세는 1회로 일정해야 함
+# ============================
+
+ROW_COUNTS = [1, 5, 20, 45]
+
+@pytest.fixture
+def authors(db, business):
+    """작성자가 여러 명인 경우에도 작성자 조회가 행마다 발생하지 않는지 확인하기 위한 작성자 목록"""
+    return [UserFactory(business=business) for _ in range(3)]
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('rows', ROW_COUNTS)
+def test_post_list_query_count(authenticated_client, django_assert_num_queries, authors, business, rows):
+    """게시글 목록 (페이지 번호 방식)"""
+    for i in range(rows):
+        PostFactory(author=authors[i % len(authors)], business=business)
+    with django_assert_num_queries(2):
+        response = authenticated_client.get(reverse('post-list'), format='json')
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data['results']) == min(rows, 20)
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('rows', ROW_COUNTS)
+def test_post_list_cursor_query_count(authenticated_client, django_assert_num_queries, authors, business, rows):
+    """게시글 목록 (커서 방식은 COUNT 없이 1회)"""
+    for i in range(rows):
+        PostFactory(author=authors[i % len(authors)], business=business)
+    with django_assert_num_queries(1):
+        response = authenticated_client.get(reverse('post-list') + '?pagination=cursor', format='json')
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data['results']) == min(rows, 20)
+
+@pytest.mark.django_db
+def test_post_detail_query_count(authenticated_client, django_assert_num_queries, post):
+    """게시글 상세"""
+    with django_assert_num_queries(1):
+        response = authenticated_client.get(reverse('post-detail', args=[post.id]), format='json')
+    assert response.status_code == status.HTTP_200_OK
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('rows', ROW_COUNTS)
+def test_post_detail_with_comments_query_count(authenticated_client, django_assert_num_queries, authors, post, rows):
+    """게시글 상세 + 댓글 첫 페이지 (게시글 + ETag 용 댓글 집계 + 댓글 페이지로 3회)"""
+    for i in range(rows):
+        CommentFactory(post=post, author=authors[i % len(authors)])
+    with django_assert_num_queries(3):
+        response = authenticated_client.get(reverse('post-detail', args=[post.id]), {'include': 'comments'}, format='json')
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data['comments']['results']) == min(rows, 20)
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('rows', ROW_COUNTS)
+def test_my_posts_query_count(authenticated_client, django_assert_num_queries, user, rows):
+    """내 게시글 목록"""
+    for _ in range(rows):
+        PostFactory(author=user, business=user.business)
+    with django_assert_num_queries(2):
+        response = authenticated_client.get(reverse('post-my-posts'), format='json')
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data['results']) == min(rows, 20)
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('rows', ROW_COUNTS)
+def test_comment_list_query_count(authenticated_client, django_assert_num_queries, authors, post, rows):
+    """게시글별 댓글 목록 (?post= 필터의 게시글 검증 1회 + ETag 계산용 집계 1회 + COUNT + SELECT 로 4회)"""
+    for i in range(rows):
+        CommentFactory(post=post, author=authors[i % len(authors)])
+    with django_assert_num_queries(4):
+        response = authenticated_client.get(reverse('comment-list'), {'post': post.id}, format='json')
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data['results']) == min(rows, 20)
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('rows', ROW_COUNTS)
+def test_my_comments_query_count(authenticated_client, django_assert_num_queries, user, post, rows):
+    """내 댓글 목록"""
+    for _ in range(rows):
+        CommentFactory(post=post, author=user)
+    with django_assert_num_queries(2):
+        response = authenticated_client.get(reverse('comment-my-comments'), format='json')
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data['results']) == min(rows, 20)
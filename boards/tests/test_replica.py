@@ -0,0 +1,131 @@
+# boards/tests/test_replica.py
+
+import copy
+import pytest
+from asgiref.sync import async_to_sync
+from django.conf import settings as django_settings
+from django.core.cache import cache
+from django.db import connection, connections
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from boards.cache import BUMPED_KEY
+from boards.models import Post
+from boards.routing import PIN_COOKIE
+from boards.tests.factories import PostFactory
+
+# ============================
+# 읽기 복제본 라우팅 테스트
+# ============================
+
+REPLICA = 'replica_test'
+
+pytestmark = pytest.mark.skipif(
+    connection.vendor != 'postgresql', reason='복제본 테스트 DB 는 PostgreSQL 에서 생성',
+)
+
+@pytest.fixture(scope='module', autouse=True)
+def replica_database(django_db_setup, django_db_blocker):
+    """
+    기본 테스트 DB 와 별개인 두 번째 로컬 DB 를 복제본으로 등록. 복제가 없으므로 default 에 쓴 행은 보이지 않습니다.
+    (테스트의 django_db 보다 먼저 등록되어야 트랜잭션으로 감싸지므로 autouse)
+    """
+    settings_dict = copy.deepcopy(connections['default'].settings_dict)
+    settings_dict['NAME'] = f'{settings_dict["NAME"]}_replica'
+    settings_dict['TEST'] = {**settings_dict['TEST'], 'NAME': None, 'MIRROR': None}
+    django_settings.DATABASES[REPLICA] = settings_dict
+    connections.settings[REPLICA] = settings_dict
+    with django_db_blocker.unblock():
+        old_name = connections[REPLICA].creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+    yield REPLICA
+    with django_db_blocker.unblock():
+        connections[REPLICA].creation.destroy_test_db(old_name, verbosity=0)
+    connections[REPLICA].close()
+    del connections[REPLICA]
+    del connections.settings[REPLICA]
+    django_settings.DATABASES.pop(REPLICA, None)
+
+@pytest.fixture
+def replicated_post(settings, user, business):
+    """복제본에만 있는 게시글 (default 의 사용자/비즈니스 행을 복제본에도 저장)"""
+    settings.DATABASE_REPLICAS = [REPLICA]
+    settings.BOARD_CACHE_TIMEOUT = 0  # 응답 캐시가 아니라 어느 DB 에서 읽는지 확인
+    business.save(using=REPLICA)
+    user.save(using=REPLICA)
+    # 두 DB 의 시퀀스는 따로 증가하므로 default 의 id 와 겹치지 않게 지정
+    post = Post(id=10 ** 6, business=business, author=user, title='from replica', content='c')
+    post.save(using=REPLICA)
+    return post
+
+@pytest.mark.django_db(databases=['default', REPLICA])
+def test_reads_go_to_replica_until_write(authenticated_client, replicated_post, user, business):
+    """
+    조회는 복제본에서, 쓰기는 default 에서 처리되고, 쓴 뒤에는 쿠키가 있는 동안 default 에서 읽는지 테스트
+    """
+    primary_post = PostFactory(author=user, business=business, title='from primary')
+    url = reverse('post-list')
+
+    response = authenticated_client.get(url)
+    assert [post['title'] for post in response.data['results']] == ['from replica']
+    assert PIN_COOKIE not in response.cookies
+    assert authenticated_client.get(reverse('post-detail', args=[primary_post.pk])).status_code == status.HTTP_404_NOT_FOUND
+
+    response = authenticated_client.post(url, {'title': 'new', 'content': 'c'}, format='json')
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.cookies[PIN_COOKIE]['max-age'] == django_settings.REPLICA_PIN_SECONDS
+    assert not Post.objects.using(REPLICA).filter(title='new').exists()
+
+    # 쿠키가 남아 있는 동안은 default 에서 읽어 방금 쓴 게시글이 보임
+    response = authenticated_client.get(url)
+    assert {post['title'] for post in response.data['results']} == {'from primary', 'new'}
+
+    del authenticated_client.cookies[PIN_COOKIE]
+    response = authenticated_client.get(url)
+    assert [post['title'] for post in response.data['results']] == ['from replica']
+
+@pytest.mark.django_db(databases=['default', REPLICA])
+def test_replica_reads_not_cached_after_write(authenticated_client, replicated_post, admin_user, settings,
+                                               django_capture_on_commit_callbacks):
+    """
+    쓰기로 버전이 올라간 직후 다른 사용자가 복제본에서 읽은 (쓰기가 반영되지 않은) 응답이 새 버전으로 캐시되지 않고,
+    REPLICA_PIN_SECONDS 가 지나면 다시 캐시되는지 테스트
+    """
+    settings.BOARD_CACHE_TIMEOUT = 60
+    reader = APIClient()  # 쓰기를 하지 않아 쿠키가 없는 다른 사용자
+    reader.force_authenticate(user=admin_user)
+    url = reverse('post-list')
+    with django_capture_on_commit_callbacks(execute=True):
+        response = authenticated_client.post(url, {'title': 'new', 'content': 'c'}, format='json')
+    assert response.status_code == status.HTTP_201_CREATED
+
+    def titles():
+        return {post['title'] for post in reader.get(url).data['results']}
+
+    assert titles() == {'from replica'}  # 복제 지연
+    Post(id=10 ** 6 + 1, business=replicated_post.business, author=replicated_post.author, title='new', content='c').save(
+        using=REPLICA,
+    )
+    assert titles() == {'from replica', 'new'}  # 복제된 뒤 바로 보임
+
+    cache.delete(BUMPED_KEY)  # REPLICA_PIN_SECONDS 경과
+    assert titles() == {'from replica', 'new'}
+    Post.objects.using(REPLICA).filter(title='new').delete()
+    assert titles() == {'from replica', 'new'}  # 캐시된 응답
+
+@pytest.mark.django_db(databases=['default', REPLICA])
+def test_async_reads_go_to_replica(replicated_post, user):
+    async def request():
+        client = AsyncClient()
+        client.cookies['access_token'] = str(AccessToken.for_user(user))
+        return await client.get(reverse('async-post-list'))
+
+    response = async_to_sync(request)()
+    assert [post['title'] for post in response.json()['results']] == ['from replica']
+
+@pytest.mark.django_db
+def test_no_pin_cookie_without_replicas(authenticated_client):
+    response = authenticated_client.post(reverse('post-list'), {'title': 'new', 'content': 'c'}, format='json')
+    assert response.status_code == status.HTTP_201_CREATED
+    assert PIN_COOKIE not in response.cookies
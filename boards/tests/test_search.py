@@ -0,0 +1,106 @@
+# boards/tests/test_search.py
+
+import pytest
+from rest_framework import status
+from django.db import connection
+from django.urls import reverse
+from boards.tests.factories import PostFactory, CommentFactory
+
+requires_postgresql = pytest.mark.skipif(
+    connection.vendor != 'postgresql', reason='tsvector 전문 검색은 PostgreSQL 전용'
+)
+
+# ============================
+# 전문 검색 테스트
+# ============================
+
+def _search_ids(client, url_name, term, **params):
+    response = client.get(reverse(url_name), {'search': term, **params}, format='json')
+    assert response.status_code == status.HTTP_200_OK
+    return [item['id'] for item in response.data['results']]
+
+@requires_postgresql
+@pytest.mark.django_db
+def test_search_posts_by_title_and_content(authenticated_client, user):
+    """
+    title 또는 content 에 검색어가 포함된 게시글만 조회되는지 테스트
+    """
+    in_title = PostFactory(author=user, business=user.business, title='Quarterly roadmap', content='plan')
+    in_content = PostFactory(author=user, business=user.business, title='Notes', content='the roadmap draft')
+    other = PostFactory(author=user, business=user.business, title='Lunch', content='menu')
+
+    ids = _search_ids(authenticated_client, 'post-list', 'roadmap')
+    assert set(ids) == {in_title.id, in_content.id}
+    assert other.id not in ids
+
+@requires_postgresql
+@pytest.mark.django_db
+def test_search_posts_ranked_by_relevance(authenticated_client, user):
+    """
+    ordering 파라미터가 없으면 제목 일치(가중치 A)가 본문 일치(가중치 B)보다 먼저 오는지 테스트
+    """
+    in_content = PostFactory(author=user, business=user.business, title='Notes', content='budget review')
+    in_title = PostFactory(author=user, business=user.business, title='Budget', content='numbers')
+
+    assert _search_ids(authenticated_client, 'post-list', 'budget') == [in_title.id, in_content.id]
+    # ordering 을 명시하면 그 정렬을 따름
+    ordered = _search_ids(authenticated_client, 'post-list', 'budget', ordering='created_at')
+    assert ordered == [in_content.id, in_title.id]
+
+@requires_postgresql
+@pytest.mark.django_db
+def test_search_prefix_and_multiple_terms(authenticated_client, user):
+    """
+    입력 중인 단어(접두어)로도 검색되고, 여러 단어는 모두 포함된 게시글만 조회되는지 테스트
+    """
+    both = PostFactory(author=user, business=user.business, title='Release checklist', content='deploy steps')
+    one = PostFactory(author=user, business=user.business, title='Release notes', content='changes')
+
+    assert set(_search_ids(authenticated_client, 'post-list', 'relea')) == {both.id, one.id}
+    assert _search_ids(authenticated_client, 'post-list', 'release deploy') == [both.id]
+
+@requires_postgresql
+@pytest.mark.django_db
+def test_search_ignores_query_operators(authenticated_client, user):
+    """
+    tsquery 연산자가 섞인 검색어로도 오류 없이 검색되는지 테스트
+    """
+    post = PostFactory(author=user, business=user.business, title='Incident report', content='outage')
+    assert _search_ids(authenticated_client, 'post-list', "incident & | ! :* ('") == [post.id]
+    assert _search_ids(authenticated_client, 'post-list', '&|!') != []
+
+@requires_postgresql
+@pytest.mark.django_db
+def test_search_vector_follows_updates(authenticated_client, post):
+    """
+    게시글 수정 후 새 제목으로 검색되고 이전 제목으로는 검색되지 않는지 테스트
+    """
+    post.title = 'Obsolete title'
+    post.save()
+    url = reverse('post-detail', args=[post.id])
+    response = authenticated_client.patch(url, {'title': 'Renamed heading'}, format='json')
+    assert response.status_code == status.HTTP_200_OK
+
+    assert _search_ids(authenticated_client, 'post-list', 'renamed') == [post.id]
+    assert _search_ids(authenticated_client, 'post-list', 'obsolete') == []
+
+@requires_postgresql
+@pytest.mark.django_db
+def test_search_comments(authenticated_client, user, post):
+    """
+    댓글도 content 전문 검색이 가능한지 테스트
+    """
+    match = CommentFactory(post=post, author=user, content='Looks good to merge')
+    CommentFactory(post=post, author=user, content='Needs another review')
+    assert _search_ids(authenticated_client, 'comment-list', 'merge') == [match.id]
+
+@pytest.mark.django_db
+def test_search_falls_back_to_icontains(authenticated_client, user, monkeypatch):
+    """
+    PostgreSQL 이 아닌 DB 에서는 기존 SearchFilter(icontains) 로 부분 문자열 검색이 되는지 테스트
+    """
+    match = PostFactory(author=user, business=user.business, title='Onboarding guide', content='welcome')
+    PostFactory(author=user, business=user.business, title='Lunch', content='menu')
+    monkeypatch.setattr(connection, 'vendor', 'sqlite')
+
+    assert _search_ids(authenticated_client, 'post-list', 'board') == [match.id]
@@ -0,0 +1,199 @@
+# boards/tests/test_tokens.py
+
+import pytest
+import threading
+from django.conf import settings as django_settings
+from datetime import timedelta
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken, UntypedToken
+from authentication import tokens
+from authentication.tokens import (
+    CachedRefreshToken, LocalBlacklistCache, get_rotation_cache_key, is_blacklisted, local_cache, rotate_refresh_token,
+)
+
+# ============================
+# refresh 토큰 블랙리스트 캐시 / 만료 토큰 정리 테스트
+# ============================
+
+@pytest.fixture(autouse=True)
+def clear_blacklist_cache(db):
+    local_cache.clear()
+    cache.clear()
+    caches['tokens'].clear()
+    yield
+    local_cache.clear()
+
+@pytest.fixture
+def switch_worker(settings, monkeypatch):
+    """
+    이름별 gunicorn 워커로 전환하는 함수. 기본 캐시와 워커 메모리 블랙리스트 결과는 워커(프로세스)별로 따로 두고,
+    tokens 캐시(DB)만 공유
+    """
+    workers = {}
+
+    def switch(name):
+        settings.CACHES = {
+            'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': name},
+            'tokens': django_settings.CACHES['tokens'],
+        }
+        monkeypatch.setattr(tokens, 'local_cache', workers.setdefault(name, LocalBlacklistCache()))
+    return switch
+
+def _blacklist_queries(queries):
+    return [query['sql'] for query in queries.captured_queries if 'token_blacklist' in query['sql']]
+
+@pytest.mark.django_db
+def test_rotated_token_replay_served_from_cache(api_client, user, settings, django_capture_on_commit_callbacks,
+                                                django_assert_num_queries):
+    """
+    갱신으로 블랙리스트된 refresh 토큰을 다시 사용하면 DB 조회 없이 캐시된 결과로 거부되는지 테스트
+    """
+    settings.JWT_REFRESH_GRACE_SECONDS = 0
+    url = reverse('token_refresh')
+    refresh = str(RefreshToken.for_user(user))
+    api_client.cookies['refresh_token'] = refresh
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.post(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert 'access_token' in response.cookies
+
+    api_client.cookies['refresh_token'] = refresh
+    del api_client.cookies['access_token']  # 미들웨어의 사용자 조회 제외
+    with django_assert_num_queries(0):
+        response = api_client.post(url)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    # 다른 워커(워커 메모리 결과 없음)도 token_blacklist 테이블 대신 공유 캐시로 거부
+    local_cache.clear()
+    with CaptureQueriesContext(connection) as queries:
+        assert api_client.post(url).status_code == status.HTTP_401_UNAUTHORIZED
+    assert not _blacklist_queries(queries)
+
+@pytest.mark.django_db
+def test_blacklist_overrides_cached_negative(user, django_capture_on_commit_callbacks):
+    """
+    '블랙리스트 아님' 으로 캐시된 토큰이 다른 워커에서 블랙리스트되면 공유 캐시 결과가 바뀌는지 테스트
+    """
+    token = CachedRefreshToken(str(RefreshToken.for_user(user)))
+    jti, exp = token['jti'], token['exp']
+    assert not is_blacklisted(jti, exp)
+
+    local_cache.clear()  # 다른 워커
+    with django_capture_on_commit_callbacks(execute=True):
+        token.blacklist()
+    local_cache.clear()
+    BlacklistedToken.objects.all().delete()  # DB 를 조회하지 않고 공유 캐시에서 확인하는지 보기 위해 삭제
+    assert is_blacklisted(jti, exp)
+
+@pytest.mark.django_db
+def test_logout_on_another_worker_rejects_token(user, switch_worker, django_capture_on_commit_callbacks):
+    """
+    '블랙리스트 아님' 을 확인한 워커가 있어도, 다른 워커에서 블랙리스트(로그아웃)된 토큰을 바로 거부하는지 테스트
+    """
+    token = CachedRefreshToken(str(RefreshToken.for_user(user)))
+    jti, exp = token['jti'], token['exp']
+    switch_worker('worker-1')
+    assert not is_blacklisted(jti, exp)
+
+    switch_worker('worker-2')
+    with django_capture_on_commit_callbacks(execute=True):
+        token.blacklist()
+
+    switch_worker('worker-1')
+    assert is_blacklisted(jti, exp)
+
+@pytest.mark.django_db
+def test_refresh_within_grace_returns_same_pair(api_client, user, django_capture_on_commit_callbacks):
+    """
+    회전된 토큰이 유예 시간 안에 다시 오면 새 행이나 오류 없이 같은 토큰 쌍을 쿠키로 받고, 유예 시간이 지나면 거부되는지 테스트
+    """
+    url = reverse('token_refresh')
+    refresh = str(RefreshToken.for_user(user))
+    api_client.cookies['refresh_token'] = refresh
+    with django_capture_on_commit_callbacks(execute=True):
+        first = api_client.post(url)
+    assert first.status_code == status.HTTP_200_OK
+    # 클라이언트 쿠키를 바꾸면 응답의 쿠키 객체도 바뀌므로 값을 미리 저장
+    pair = [first.cookies[name].value for name in ('access_token', 'refresh_token')]
+    assert pair[1] == first.data['refresh'] != refresh
+    rows = (OutstandingToken.objects.count(), BlacklistedToken.objects.count())
+
+    api_client.cookies['refresh_token'] = refresh  # 다른 탭은 아직 이전 쿠키를 보냄
+    second = api_client.post(url)
+    assert second.status_code == status.HTTP_200_OK
+    assert [second.cookies[name].value for name in ('access_token', 'refresh_token')] == pair
+    assert (OutstandingToken.objects.count(), BlacklistedToken.objects.count()) == rows
+
+    caches['tokens'].delete(get_rotation_cache_key(UntypedToken(refresh)['jti']))  # 유예 시간 경과
+    api_client.cookies['refresh_token'] = refresh
+    assert api_client.post(url).status_code == status.HTTP_401_UNAUTHORIZED
+
+    # 회전된 토큰으로는 계속 갱신 가능
+    api_client.cookies['refresh_token'] = pair[1]
+    assert api_client.post(url).status_code == status.HTTP_200_OK
+
+@pytest.mark.django_db
+def test_refresh_on_another_worker_returns_same_pair(api_client, user, switch_worker, django_capture_on_commit_callbacks):
+    """
+    기본 캐시가 워커별 로컬 메모리여도, 다른 워커로 간 갱신 요청이 공유 tokens 캐시에서 같은 토큰 쌍을 받는지 테스트
+    """
+    url = reverse('token_refresh')
+    refresh = str(RefreshToken.for_user(user))
+    switch_worker('worker-1')
+    api_client.cookies['refresh_token'] = refresh
+    with django_capture_on_commit_callbacks(execute=True):
+        first = api_client.post(url)
+    assert first.status_code == status.HTTP_200_OK
+    pair = [first.cookies[name].value for name in ('access_token', 'refresh_token')]
+
+    switch_worker('worker-2')
+    api_client.cookies['refresh_token'] = refresh
+    second = api_client.post(url)
+    assert second.status_code == status.HTTP_200_OK
+    assert [second.cookies[name].value for name in ('access_token', 'refresh_token')] == pair
+
+@pytest.mark.django_db
+def test_concurrent_refresh_waits_for_rotation(user, settings, django_assert_num_queries):
+    """
+    다른 요청이 같은 토큰을 회전하는 중이면 직접 회전하지 않고 그 결과를 기다려 반환하는지 테스트
+    (다른 스레드에서 결과를 기록하므로 tokens 캐시는 로컬 메모리로 대체)
+    """
+    settings.CACHES = {**django_settings.CACHES, 'tokens': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+    shared = caches['tokens']
+    refresh = str(RefreshToken.for_user(user))
+    key = get_rotation_cache_key(UntypedToken(refresh)['jti'])
+    shared.add(f'{key}:lock', 1, 5)
+    pair = {'access': 'new-access', 'refresh': 'new-refresh'}
+    threading.Timer(0.2, shared.set, (key, pair, 10)).start()
+
+    with django_assert_num_queries(0):
+        assert rotate_refresh_token(refresh) == pair
+
+@pytest.mark.django_db
+def test_purge_tokens_command(capsys, user):
+    """
+    만료된 발급 토큰과 그 블랙리스트 행만 배치로 삭제되는지 테스트
+    """
+    now = timezone.now()
+    expired = [
+        OutstandingToken.objects.create(user=user, jti=f'expired-{i}', token='t', expires_at=now - timedelta(days=1))
+        for i in range(3)
+    ]
+    BlacklistedToken.objects.create(token=expired[0])
+    valid = OutstandingToken.objects.create(user=user, jti='valid', token='t', expires_at=now + timedelta(days=1))
+    BlacklistedToken.objects.create(token=valid)
+
+    call_command('purge_tokens', '--dry-run')
+    assert '만료된 발급 토큰 3개' in capsys.readouterr().out
+
+    call_command('purge_tokens', '--batch-size', '2')
+    assert '만료된 발급 토큰 3개 삭제' in capsys.readouterr().out
+    assert list(OutstandingToken.objects.values_list('jti', flat=True)) == ['valid']
+    assert list(BlacklistedToken.objects.values_list('token__jti', flat=True)) == ['valid']
@@ -1,11 +1,17 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import PostViewSet, CommentViewSet
+from .views import PostViewSet, CommentViewSet, post_events, comment_events
+from . import async_views
 
 router = DefaultRouter()
 router.register('posts', PostViewSet, basename='post')
 router.register('comments', CommentViewSet, basename='comment')
 
 urlpatterns = [
+    path('events/posts/', post_events, name='post-events'),
+    path('events/posts/<int:post_id>/comments/', comment_events, name='comment-events'),
+    path('async/posts/', async_views.post_list, name='async-post-list'),
+    path('async/posts/<int:pk>/', async_views.post_detail, name='async-post-detail'),
+    path('async/comments/', async_views.comment_list, name='async-comment-list'),
     path('', include(router.urls)),
 ]
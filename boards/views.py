@@ -1,12 +1,34 @@
+import asyncio
+import io
+from asgiref.sync import sync_to_async
+from collections import Counter
 from rest_framework import viewsets, permissions, filters
 from rest_framework.decorators import action
-from rest_framework.exceptions import NotFound
-from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.parsers import MultiPartParser
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from django.db import router, transaction
+from django.db.models import BooleanField, Count, ExpressionWrapper, Max, Q, Value
 from django_filters.rest_framework import DjangoFilterBackend
-from .serializers import PostSerializer, CommentSerializer
-from .models import Post, Comment
-from authentication.models import BusinessMember
-from authentication.permissions import IsOwnerOrBusinessAdmin
+from .serializers import (
+    PostSerializer, PostWithCommentsSerializer, CommentSerializer, BulkActionSerializer,
+    ArchivedPostSerializer, ArchivedCommentSerializer, RestoreArchivedSerializer, ImportUploadSerializer,
+)
+from .pagination import BoardPagination
+from .filters import FullTextSearchFilter
+from .cache import BoardCacheMixin, ConditionalGetMixin, invalidate_board_cache
+from .sync import decode_sync_token, new_sync_token
+from .archive import restore_posts, restore_comments, retention_cutoff
+from .importer import BoardImportError, BoardImporter, detect_format, read_rows
+from .export import CONTENT_TYPES, export_response
+from .routing import ReplicaReadMixin
+from . import events
+from .models import Post, Comment, ArchivedPost, ArchivedComment
+from authentication.permissions import IsBusinessAdmin, IsOwnerOrBusinessAdmin
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.utils import timezone
 from django.views.generic import TemplateView
 
@@ -22,19 +44,131 @@ class MyPostListView(TemplateView):
 class PostDetailView(TemplateView):
     template_name = 'boards/post_detail.html'
 
+# 관리자용 일괄 삭제/복구 액션
+class BulkSoftDeleteMixin:
+    """
+    비즈니스 관리자가 소속 비즈니스의 게시글/댓글을 한 번의 UPDATE 로 논리적 삭제/복구하는 액션을 제공.
+    대상은 body 의 ids 또는 목록과 같은 쿼리 파라미터 필터(is_public, author, search 등)로 지정하며,
+    실제로 상태가 바뀐 id 목록을 반환합니다.
+    """
+    bulk_scope_field = 'business'
+    bulk_fields = ('pk',)
+
+    def get_bulk_queryset(self, ids):
+        queryset = self.filter_queryset(self.get_queryset()).filter(**{self.bulk_scope_field: self.request.user.business})
+        if ids is not None:
+            return queryset.filter(pk__in=ids)
+        # 필터 없이 비즈니스 전체가 대상이 되는 것을 방지. 빈 값(?search=)은 필터/검색에서 무시되므로 필터로 보지 않음
+        filter_params = {*self.filterset_fields, api_settings.SEARCH_PARAM}
+        if not any(self.request.query_params.get(param, '').strip() for param in filter_params):
+            raise ValidationError({'ids': 'ids 또는 필터 조건(쿼리 파라미터)이 필요합니다.'})
+        return queryset
+
+    def bulk_changed(self, rows, deleted):
+        """상태가 바뀐 행에 대한 후처리 (rows: bulk_fields 의 dict 목록)"""
+
+    def get_bulk_event_channels(self, rows):
+        """일괄 변경 후 resync 이벤트를 보낼 채널"""
+        return {events.business_channel(self.request.user.business_id)}
+
+    def bulk_set_deleted(self, request, deleted):
+        serializer = BulkActionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        # 삭제는 삭제되지 않은 것만, 복구는 삭제된 것만 대상
+        queryset = self.get_bulk_queryset(serializer.validated_data.get('ids')).filter(deleted_at__isnull=deleted)
+
+        now = timezone.now()
+        with transaction.atomic():
+            rows = list(queryset.select_for_update().order_by('pk').values(*self.bulk_fields))
+            ids = [row['pk'] for row in rows]
+            queryset.model.objects.filter(pk__in=ids).update(deleted_at=now if deleted else None, updated_at=now)
+            self.bulk_changed(rows, deleted)
+        if ids:
+            invalidate_board_cache()
+            for channel in self.get_bulk_event_channels(rows):
+                events.publish_resync(channel)
+        return Response({'count': len(ids), 'ids': ids})
+
+    @action(detail=False, methods=['post'], permission_classes=[IsBusinessAdmin])
+    def bulk_soft_delete(self, request):
+        """
+        소속 비즈니스의 게시글/댓글을 일괄 논리적 삭제하는 관리자 전용 액션.
+        URL: /api/posts/bulk_soft_delete/
+        """
+        return self.bulk_set_deleted(request, deleted=True)
+
+    @action(detail=False, methods=['post'], permission_classes=[IsBusinessAdmin])
+    def bulk_restore(self, request):
+        """
+        논리적으로 삭제된 소속 비즈니스의 게시글/댓글을 일괄 복구하는 관리자 전용 액션.
+        URL: /api/posts/bulk_restore/
+        """
+        return self.bulk_set_deleted(request, deleted=False)
+
+# 관리자용 보관 조회/복구 액션
+class ArchiveMixin:
+    """
+    archive_deleted 명령으로 보관 테이블에 옮겨진 소속 비즈니스의 게시글/댓글을 조회하고 핫 테이블로 복구하는 액션.
+    복구된 행은 삭제 상태를 유지하므로, 다시 보이게 하려면 bulk_restore 를 이어서 호출합니다.
+    archive_restore 는 boards/archive.py 의 복구 함수이며, 복구된 행(bulk_fields 와 같은 dict)으로
+    get_bulk_event_channels 의 채널에 resync 이벤트를 보냅니다.
+    """
+    archive_model = None
+    archive_serializer_class = None
+    archive_restore = None
+
+    @action(detail=False, methods=['get'], permission_classes=[IsBusinessAdmin])
+    def archived(self, request):
+        """
+        소속 비즈니스의 보관된 게시글/댓글을 최근 삭제순으로 조회하는 관리자 전용 액션.
+        URL: /api/posts/archived/
+        """
+        queryset = (
+            self.archive_model.objects.select_related('author')
+            .filter(business=request.user.business).order_by('-deleted_at', '-id')
+        )
+        page = self.paginate_queryset(queryset)
+        serializer = self.archive_serializer_class(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=['post'], permission_classes=[IsBusinessAdmin])
+    def restore_archived(self, request):
+        """
+        보관된 소속 비즈니스의 게시글/댓글을 id 그대로 핫 테이블로 되돌리는 관리자 전용 액션.
+        URL: /api/posts/restore_archived/
+        """
+        serializer = RestoreArchivedSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        queryset = self.archive_model.objects.filter(
+            business=request.user.business, pk__in=serializer.validated_data['ids'],
+        )
+        rows = self.archive_restore(queryset)
+        ids = [row['pk'] for row in rows]
+        if ids:
+            invalidate_board_cache()
+            for channel in self.get_bulk_event_channels(rows):
+                events.publish_resync(channel)
+        return Response({'count': len(ids), 'ids': ids})
+
 # 게시글 관리용 뷰셋
-class PostViewSet(viewsets.ModelViewSet):
+class PostViewSet(ReplicaReadMixin, BulkSoftDeleteMixin, ArchiveMixin, BoardCacheMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     """
     Post 모델의 CRUD 기능을 제공하는 뷰셋.
     인증된 사용자만 접근할 수 있으며, 게시글의 소유자 또는 비즈니스 관리자만 수정/삭제할 수 있습니다.
     """
     serializer_class = PostSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrBusinessAdmin]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['is_public']
+    pagination_class = BoardPagination
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, FullTextSearchFilter]
+    filterset_fields = ['is_public', 'author']
     search_fields = ['title', 'content']
     ordering_fields = ['created_at', 'title']
     ordering = ['-created_at']
+    # 목록의 comment_count 는 updated_at 을 바꾸지 않고 갱신되므로 목록에는 조건부 GET 을 적용하지 않음
+    conditional_actions = ('retrieve',)
+    archive_model = ArchivedPost
+    archive_serializer_class = ArchivedPostSerializer
+    archive_restore = staticmethod(restore_posts)  # 게시글과 함께 보관된 댓글도 복구
 
     def get_queryset(self):
         """
@@ -42,28 +176,63 @@ class PostViewSet(viewsets.ModelViewSet):
         - Admin: 소속된 비즈니스의 모든 게시글
         - Member: 자신이 작성한 게시글
         """
+        # 직렬화 시 author.username 을 행마다 조회하지 않도록 함께 가져옴
+        queryset = Post.objects.select_related('author')
+
         # Swagger 스키마 생성 중인 경우 모든 게시글을 반환하여 예외 방지
         if getattr(self, 'swagger_fake_view', False):
-            return Post.objects.all().order_by('-created_at')
+            return queryset.order_by('-created_at')
         
-        user = self.request.user
-        if user.role == BusinessMember.BUSINESS_ADMIN:
-            return Post.objects.all().order_by('-created_at')
-        return Post.objects.filter(Q(is_public=True) | Q(author=user), deleted_at__isnull=True).order_by('-created_at')
+        return queryset.visible_to(self.request.user).order_by('-created_at')
+
+    def includes_comments(self):
+        """?include=comments 이면 상세 응답에 댓글 첫 페이지를 포함"""
+        return self.request.query_params.get('include') == 'comments'
+
+    def get_serializer_class(self):
+        if self.action == 'retrieve' and self.includes_comments():
+            return PostWithCommentsSerializer
+        return super().get_serializer_class()
+
+    def get_comment_stats(self, instance):
+        """포함할 댓글들의 (최종 수정 시각, 개수). 댓글 추가/수정/삭제를 ETag 에 반영하기 위해 사용"""
+        if not hasattr(self, '_comment_stats'):
+            self._comment_stats = instance.comments.visible_to(self.request.user).aggregate(
+                last_modified=Max('updated_at'), count=Count('pk'),
+            )
+        return self._comment_stats
+
+    def get_etag_parts(self, instance):
+        """comment_count 는 updated_at 을 바꾸지 않고 갱신되므로 ETag 에 포함"""
+        if not self.includes_comments():
+            return (instance.comment_count,)
+        stats = self.get_comment_stats(instance)
+        return (instance.comment_count, 'comments', stats['count'], stats['last_modified'])
+
+    def get_last_modified(self, instance):
+        """댓글을 포함하면 보이는 댓글이 삭제/숨김될 때 시각이 과거로 돌아갈 수 있으므로 ETag 로만 검증"""
+        if self.includes_comments():
+            return None
+        return instance.updated_at
 
     def perform_create(self, serializer):
         """
         게시글 생성 시 author와 business 필드를 자동으로 설정.
         """
-        serializer.save(author=self.request.user, business=self.request.user.business)
+        post = serializer.save(author=self.request.user, business=self.request.user.business)
+        invalidate_board_cache()
+        events.publish('created', post)
     
     def perform_update(self, serializer):
         """이미 삭제된 Post인 경우 수정 불가"""
         instance = serializer.instance
         if instance.deleted_at is not None:
             raise NotFound("이 게시글은 이미 삭제된 상태이므로 수정할 수 없습니다.")
+        was_public = instance.is_public
         # 정상적인 경우 그대로 업데이트 진행
         super().perform_update(serializer)
+        invalidate_board_cache()
+        events.publish('updated', serializer.instance, was_public)
 
     def perform_destroy(self, instance):
         """
@@ -74,6 +243,8 @@ class PostViewSet(viewsets.ModelViewSet):
         
         instance.deleted_at = timezone.now()
         instance.save()
+        invalidate_board_cache()
+        events.publish('deleted', instance)
 
     @action(detail=False, methods=['get'], permission_classes=[permissions.IsAuthenticated])
     def my_posts(self, request):
@@ -87,19 +258,76 @@ class PostViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(page, many=True)
         return self.get_paginated_response(serializer.data)
 
+    @action(detail=False, methods=['get'], permission_classes=[IsBusinessAdmin])
+    def export(self, request):
+        """
+        소속 비즈니스의 게시글과 그 댓글을 NDJSON(기본) 또는 CSV 로 스트리밍하는 관리자 전용 액션.
+        목록과 같은 조회 범위/필터를 적용하며, ?output=csv, ?gzip=true 를 지원합니다.
+        URL: /api/posts/export/
+        """
+        output = request.query_params.get('output', 'ndjson')
+        if output not in CONTENT_TYPES:
+            raise ValidationError({'output': f'{", ".join(CONTENT_TYPES)} 중 하나여야 합니다.'})
+        compress = request.query_params.get('gzip', '').lower() in ('1', 'true')
+
+        business = request.user.business
+        # 응답은 뷰가 반환된 뒤에 스트리밍되므로 지금 고른 (복제본) DB 를 쿼리셋에 고정
+        database = router.db_for_read(Post)
+        posts = self.filter_queryset(self.get_queryset()).filter(business=business).using(database)
+        comments = (
+            Comment.objects.visible_to(request.user).using(database)
+            .filter(business=business, post__in=posts.values('pk'))
+        )
+        return export_response(
+            request._request, posts, comments, output, compress, filename=f'board-{business.pk}',
+        )
+
+    @action(detail=False, methods=['post'], url_path='import', permission_classes=[IsBusinessAdmin],
+            parser_classes=[MultiPartParser])
+    def import_board(self, request):
+        """
+        JSONL/CSV 파일(multipart 의 file)의 게시글/댓글을 소속 비즈니스로 가져오는 관리자 전용 액션.
+        업로드는 임시 파일로 받아 한 행씩 처리하며, 큰 파일은 import_board 명령을 사용합니다.
+        URL: /api/posts/import/
+        """
+        serializer = ImportUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.validated_data['file']
+        try:
+            format = serializer.validated_data.get('format') or detect_format(upload.name)
+            importer = BoardImporter(request.user.business, default_author=serializer.validated_data.get('default_author'))
+        except BoardImportError as e:
+            raise ValidationError({'file': str(e)})
+        stream = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+        try:
+            report = importer.run(read_rows(stream, format))
+        except UnicodeDecodeError:
+            raise ValidationError({'file': 'UTF-8 로 인코딩된 파일이어야 합니다.'})
+        finally:
+            stream.detach()
+        return Response(report.as_dict())
+
 # 댓글 관리용 뷰셋
-class CommentViewSet(viewsets.ModelViewSet):
+class CommentViewSet(ReplicaReadMixin, BulkSoftDeleteMixin, ArchiveMixin, BoardCacheMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     """
     Comment 모델의 CRUD 기능을 제공하는 뷰셋.
     인증된 사용자만 접근할 수 있으며, 댓글의 소유자 또는 비즈니스 관리자만 수정/삭제할 수 있습니다.
     """
     serializer_class = CommentSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrBusinessAdmin]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['post', 'is_public']
+    pagination_class = BoardPagination
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, FullTextSearchFilter]
+    filterset_fields = ['post', 'is_public', 'author']
     search_fields = ['content']
     ordering_fields = ['created_at']
     ordering = ['-created_at']
+    bulk_scope_field = 'business'  # 댓글에 복제된 business 로 조인 없이 (분할 시 해당 파티션만) 조회
+    bulk_fields = ('pk', 'post_id')
+    archive_model = ArchivedComment
+    archive_serializer_class = ArchivedCommentSerializer
+    archive_restore = staticmethod(restore_comments)  # 게시글이 보관되어 있는 댓글은 제외 (게시글 복구 시 함께 복구됨)
+    # 델타 동기화 한 번에 반환할 최대 변경 수. 넘으면 reset 으로 전체 조회를 요청
+    delta_limit = 500
 
     def get_queryset(self):
         """
@@ -107,40 +335,98 @@ class CommentViewSet(viewsets.ModelViewSet):
         - Admin: 소속된 비즈니스의 모든 댓글
         - Member: 자신이 작성한 댓글
         """
+        # 직렬화 시 author.username 을 행마다 조회하지 않도록 함께 가져옴
+        queryset = Comment.objects.select_related('author')
+
         # Swagger 스키마 생성 중인 경우 모든 댓글을 반환하여 예외 방지
         if getattr(self, 'swagger_fake_view', False):
-            return Comment.objects.all().order_by('-created_at')
+            return queryset.order_by('-created_at')
         
-        user = self.request.user
-        if user.role == BusinessMember.BUSINESS_ADMIN:
-            return Comment.objects.all().order_by('-created_at')
-        return Comment.objects.filter(
-            Q(is_public=True) | Q(author=user),
-            deleted_at__isnull=True
-        ).order_by('-created_at')
+        return queryset.visible_to(self.request.user).order_by('-created_at')
+
+    def list(self, request, *args, **kwargs):
+        """?changed_since=<token> 이면 델타 동기화 응답을 반환 (응답 캐시/조건부 GET 미적용)"""
+        if 'changed_since' in request.query_params:
+            return self.list_changes(request)
+        return super().list(request, *args, **kwargs)
+
+    def list_changes(self, request):
+        """
+        토큰 이후 생성/수정/삭제된 게시글(post, 필수)의 댓글만 반환. 목록과 같은 필터를 적용합니다.
+        - results: 사용자에게 보이는 변경된 댓글
+        - deleted: 토큰 이후 삭제된 댓글 중 사용자가 볼 수 있었던 (공개이거나 자신이 작성한) 댓글 id (tombstone).
+          다른 사용자의 비공개 댓글 id 는 노출하지 않으며, 비공개로 바뀐 댓글은 다음 전체 조회에서 빠집니다.
+        - token: 다음 요청에 사용할 토큰
+        - reset: 변경이 delta_limit 를 넘으면 true 이며, 클라이언트는 전체 목록을 다시 조회
+        """
+        if not request.query_params.get('post'):
+            # 게시글을 지정하지 않으면 모든 게시글의 변경이 대상이 되어 거의 항상 reset 이 됨
+            raise ValidationError({'post': 'changed_since 를 사용하려면 post 가 필요합니다.'})
+        since = decode_sync_token(request.query_params['changed_since'])
+        token = new_sync_token()  # 조회 전에 발급하여 조회 중 발생한 변경을 놓치지 않음
+        if since < retention_cutoff():
+            # 그 사이 보관된 댓글은 tombstone 으로 전달할 수 없으므로 전체 조회를 요청
+            return Response({'token': token, 'reset': True, 'results': [], 'deleted': []})
+
+        condition = Comment.objects.visibility_filter(request.user)
+        queryset = self.filter_queryset(Comment.objects.select_related('author')).filter(updated_at__gt=since)
+        if condition is None:
+            queryset = queryset.annotate(is_visible=Value(True))
+        else:
+            was_visible = Q(Q(is_public=True) | Q(author=request.user), deleted_at__gt=since)
+            queryset = queryset.filter(condition | was_visible).annotate(
+                is_visible=ExpressionWrapper(condition, output_field=BooleanField()),
+            )
+        queryset = queryset.order_by('updated_at', 'id')
+        rows = list(queryset[:self.delta_limit + 1])
+        if len(rows) > self.delta_limit:
+            return Response({'token': token, 'reset': True, 'results': [], 'deleted': []})
+
+        return Response({
+            'token': token,
+            'reset': False,
+            'results': self.get_serializer([row for row in rows if row.is_visible], many=True).data,
+            'deleted': [row.pk for row in rows if not row.is_visible],
+        })
+
+    def get_bulk_event_channels(self, rows):
+        return {events.post_channel(row['post_id']) for row in rows}
+
+    def bulk_changed(self, rows, deleted):
+        """일괄 삭제/복구된 댓글 수만큼 게시글별 comment_count 를 한 번의 UPDATE 로 조정"""
+        deltas = Counter(row['post_id'] for row in rows)
+        sign = -1 if deleted else 1
+        Post.adjust_comment_counts({post_id: sign * count for post_id, count in deltas.items()})
 
     def perform_create(self, serializer):
         """
-        댓글 생성 시 author 필드를 자동으로 설정.
+        댓글 생성 시 author 필드를 자동으로 설정하고, 게시글의 comment_count 를 같은 트랜잭션에서 증가.
         """
-        serializer.save(author=self.request.user)
+        with transaction.atomic():
+            comment = serializer.save(author=self.request.user)
+            if comment.deleted_at is None:
+                Post.adjust_comment_count(comment.post_id, 1)
+        invalidate_board_cache()
+        events.publish('created', comment)
         
     def perform_update(self, serializer):
         """이미 삭제된 Comment인 경우 수정 불가"""
         instance = serializer.instance
         if instance.deleted_at is not None:
             raise NotFound("이 댓글은 이미 삭제된 상태이므로 수정할 수 없습니다.")
+        was_public = instance.is_public
         super().perform_update(serializer)
+        invalidate_board_cache()
+        events.publish('updated', serializer.instance, was_public)
 
     def perform_destroy(self, instance):
         """
         게시글 삭제 대신 deleted_at 필드를 현재 시각으로 설정하여 논리적 삭제.
         """
-        if instance.deleted_at is not None:
+        if not instance.soft_delete():  # 게시글의 comment_count 도 함께 감소
             raise NotFound("이 댓글은 이미 삭제된 상태입니다.")
-        
-        instance.deleted_at = timezone.now()
-        instance.save()
+        invalidate_board_cache()
+        events.publish('deleted', instance)
 
     @action(detail=False, methods=['get'], permission_classes=[permissions.IsAuthenticated])
     def my_comments(self, request):
@@ -153,3 +439,56 @@ class CommentViewSet(viewsets.ModelViewSet):
         page = self.paginate_queryset(comments)
         serializer = self.get_serializer(page, many=True)
         return self.get_paginated_response(serializer.data)
+
+
+# 실시간 이벤트 (SSE). 이벤트 루프에서 연결을 유지하므로 ASGI 로 구동할 때만 스트리밍합니다.
+async def event_stream(request, channel):
+    # 요청 스레드(thread_sensitive)의 DB 연결을 스트림이 열려 있는 동안 점유하지 않도록 반환
+    await sync_to_async(events.release_connections)()
+    events.get_backend().ensure_listening()
+    subscription = events.broker.subscribe(channel)
+    user = request.user
+    heartbeat = settings.BOARD_EVENTS_HEARTBEAT
+    try:
+        yield 'retry: 3000\n\n'
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), heartbeat)
+            except asyncio.TimeoutError:
+                yield ': keep-alive\n\n'  # 프록시의 유휴 연결 종료 방지
+                continue
+            message = events.format_event(event, user)
+            if message is not None:  # 볼 수 없는 대상의 이벤트는 보내지 않음
+                yield message
+    finally:
+        events.broker.unsubscribe(subscription)
+
+def event_stream_response(request, channel):
+    if not isinstance(request, ASGIRequest):
+        # WSGI 워커는 연결 하나에 묶이므로 스트리밍하지 않음 (204 를 받은 EventSource 는 재연결하지 않음)
+        return HttpResponse(status=204)
+    response = StreamingHttpResponse(event_stream(request, channel), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+async def post_events(request):
+    """
+    소속 비즈니스의 게시글 생성/수정/삭제를 SSE 로 전달.
+    URL: /api/board/events/posts/
+    """
+    if not request.user.is_authenticated:
+        return JsonResponse({'detail': 'Authentication credentials were not provided.'}, status=401)
+    return event_stream_response(request, events.business_channel(request.user.business_id))
+
+async def comment_events(request, post_id):
+    """
+    게시글의 댓글 생성/수정/삭제를 SSE 로 전달. 조회할 수 없는 게시글이면 404.
+    URL: /api/board/events/posts/<post_id>/comments/
+    """
+    user = request.user
+    if not user.is_authenticated:
+        return JsonResponse({'detail': 'Authentication credentials were not provided.'}, status=401)
+    if not await Post.objects.visible_to(user).filter(pk=post_id).aexists():
+        return JsonResponse({'detail': 'Not found.'}, status=404)
+    return event_stream_response(request, events.post_channel(post_id))
@@ -21,8 +21,41 @@ echo "Database container is ready!"
 echo "Applying migrations..."
 python manage.py migrate --noinput
 
+echo "Creating cache table..."
+python manage.py createcachetable  # DatabaseCache 를 사용하지 않으면 아무 작업도 하지 않음
+
+if [ -n "$METRICS_DIR" ]; then
+  # 이전 실행의 워커별 지표 파일 정리 (카운터는 서버 시작부터 누적)
+  mkdir -p "$METRICS_DIR" && rm -f "$METRICS_DIR"/metrics-*.json
+fi
+
 echo "Collecting static files..."
 python manage.py collectstatic --noinput
 
-echo "Starting Gunicorn server..."
-exec gunicorn miniintern.wsgi:application --bind 0.0.0.0:8000 --workers=4 --timeout 120
+# 만료된 JWT 발급/블랙리스트 토큰 정리 (TOKEN_PURGE_INTERVAL 초마다, 0 이면 실행하지 않음)
+if [ "${TOKEN_PURGE_INTERVAL:-3600}" -gt 0 ]; then
+  (
+    while true; do
+      python manage.py purge_tokens --sleep 0.1 || echo "Token purge failed."
+      sleep ${TOKEN_PURGE_INTERVAL:-3600}
+    done
+  ) &
+fi
+
+# 서버 프로필 (SERVER_INTERFACE)
+# - wsgi (기본): 동기 워커. 워커 하나가 요청 하나를 끝날 때까지 처리하며, 실시간 이벤트(SSE) 엔드포인트는 204 를 반환
+# - asgi: uvicorn 워커. SSE 연결과 /api/board/async/ 비동기 뷰가 DB 를 기다리는 동안 워커를 점유하지 않음
+# - gthread: 스레드 워커. 워커마다 GUNICORN_THREADS 개의 요청을 동시에 처리하며, 연결 풀 크기
+#   (DATABASE_POOL_MAX_SIZE 를 지정하지 않으면 GUNICORN_THREADS)를 스레드 수에 맞춤
+# 설정(BOARD_EVENTS_BACKEND 기본값 등)이 워커 수를 알 수 있도록 export
+export GUNICORN_WORKERS=${GUNICORN_WORKERS:-4}
+echo "Starting Gunicorn server (${SERVER_INTERFACE:-wsgi})..."
+if [ "${SERVER_INTERFACE:-wsgi}" = "asgi" ]; then
+  exec gunicorn miniintern.asgi:application -k uvicorn_worker.UvicornWorker --bind 0.0.0.0:8000 --workers=${GUNICORN_WORKERS} --timeout 120
+fi
+if [ "${SERVER_INTERFACE:-wsgi}" = "gthread" ]; then
+  export GUNICORN_THREADS=${GUNICORN_THREADS:-8}
+  exec gunicorn miniintern.wsgi:application -k gthread --bind 0.0.0.0:8000 --workers=${GUNICORN_WORKERS} \
+    --threads=${GUNICORN_THREADS} --timeout 120
+fi
+exec gunicorn miniintern.wsgi:application --bind 0.0.0.0:8000 --workers=${GUNICORN_WORKERS} --timeout 120
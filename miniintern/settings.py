@@ -4,7 +4,7 @@ Django settings for miniintern project.
 Generated by 'django-admin startproject' using Django 5.1.1.
 """
 from pathlib import Path
-from decouple import config
+from decouple import config, Csv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -44,6 +44,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'authentication.middlewares.RequestMetricsMiddleware',
     'authentication.middlewares.JWTUserMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
@@ -76,6 +77,18 @@ WSGI_APPLICATION = 'miniintern.wsgi.application'
 
 AUTH_USER_MODEL = 'authentication.BusinessMember'
 
+# 연결 풀 (psycopg 3). gunicorn 워커 프로세스마다 DB 별로 풀을 두고, 요청이 끝나면 연결을 닫지 않고 풀에 반환합니다.
+# max_size 는 워커 안에서 동시에 DB 를 사용하는 스레드 수(gthread 는 GUNICORN_THREADS, ASGI 는 워커당 동시 요청 수)에 맞추고,
+# 워커 수 x max_size (복제본이 있으면 DB 마다)가 PostgreSQL max_connections 를 넘지 않게 합니다.
+DATABASE_POOL = config('DATABASE_POOL', default=True, cast=bool)
+DATABASE_POOL_OPTIONS = {
+    'min_size': config('DATABASE_POOL_MIN_SIZE', default=1, cast=int),
+    'max_size': config('DATABASE_POOL_MAX_SIZE', default=config('GUNICORN_THREADS', default=4, cast=int), cast=int),
+    'timeout': config('DATABASE_POOL_TIMEOUT', default=10, cast=float),      # 빈 연결을 기다리는 최대 시간(초)
+    'max_idle': config('DATABASE_POOL_MAX_IDLE', default=300, cast=float),   # min_size 를 넘는 유휴 연결을 닫는 시간(초)
+    'max_lifetime': config('DATABASE_POOL_MAX_LIFETIME', default=1800, cast=float),
+}
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -83,10 +96,34 @@ DATABASES = {
         'USER': config('POSTGRES_USER', 'upsight'),
         'PASSWORD': config('POSTGRES_PASSWORD', '1q2w3e4r!'),
         'HOST': config('DATABASE_HOST', 'localhost'),
-        'PORT': config('DATABASE_PORT', '5432')
+        'PORT': config('DATABASE_PORT', '5432'),
+        # 연결 재사용 시간(초). 연결 풀을 사용할 때는 풀이 연결을 관리하므로 0 으로 고정
+        'CONN_MAX_AGE': 0 if DATABASE_POOL else config('CONN_MAX_AGE', default=0, cast=int),
+        # 요청마다 처음 사용할 때 연결 상태를 확인 (풀에서는 연결을 꺼낼 때 확인)
+        'CONN_HEALTH_CHECKS': config('CONN_HEALTH_CHECKS', default=True, cast=bool),
+        'OPTIONS': {'pool': DATABASE_POOL_OPTIONS} if DATABASE_POOL else {},
     }
 }
 
+# 읽기 복제본. 'host[:port]' 를 쉼표로 구분하여 지정하면 replica1, replica2 ... 별칭으로 등록됩니다.
+# 게시판 API 의 조회 요청만 복제본으로 보내고 쓰기는 default 로 보냅니다 (boards/routing.py).
+# 연결 풀 등 나머지 설정은 default 와 같으며, 복제본마다 별도의 풀을 사용합니다.
+# 테스트에서는 default 의 미러로 취급되어 별도 테스트 DB 를 만들지 않습니다.
+DATABASE_REPLICAS = []
+for index, replica in enumerate(config('DATABASE_REPLICA_HOSTS', default='', cast=Csv()), 1):
+    host, _, port = replica.partition(':')
+    DATABASES[f'replica{index}'] = {
+        **DATABASES['default'],
+        'HOST': host,
+        'PORT': port or DATABASES['default']['PORT'],
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(f'replica{index}')
+
+DATABASE_ROUTERS = ['boards.routing.ReplicaRouter']
+# 쓰기 후 이 시간(초) 동안은 해당 클라이언트의 조회를 default 에서 처리 (복제 지연보다 길게 설정)
+REPLICA_PIN_SECONDS = config('REPLICA_PIN_SECONDS', default=10, cast=int)
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'authentication.backends.CookieJWTAuthentication',
@@ -95,6 +132,10 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'authentication.metrics.TimedJSONRenderer',  # 렌더링 시간을 요청 계측에 기록
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_FILTER_BACKENDS': [
@@ -144,6 +185,71 @@ SIMPLE_JWT = {
     'TOKEN_TYPE_CLAIM': 'token_type'
 }
 
+# gunicorn 워커 수 (entrypoint.sh 가 지정). 워커가 여러 개일 때 공유가 필요한 설정의 기본값을 정하는 데 사용
+GUNICORN_WORKERS = config('GUNICORN_WORKERS', default=1, cast=int)
+
+# 캐시. 기본은 프로세스별 로컬 메모리이며, gunicorn 워커 여러 개가 무효화를 공유하려면
+# django.core.cache.backends.filebased.FileBasedCache(LOCATION=디렉터리) 또는
+# django.core.cache.backends.db.DatabaseCache(LOCATION=테이블명, createcachetable 필요)를 지정
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='upsight-board'),
+    },
+    # refresh 토큰 블랙리스트 결과와 회전 잠금/결과 (authentication/tokens.py). 다른 워커로 간 요청도 같은 결과를 받아야 하므로
+    # 기본은 워커 간에 공유되는 DB 캐시로, 서버 시작 전에 createcachetable 로 테이블을 만들어야 함
+    # (entrypoint.sh, run_django.sh 가 실행. 다른 방식으로 서버를 띄우면 직접 실행). 로컬 메모리로 바꾸면 워커별로만 동작
+    'tokens': {
+        'BACKEND': config('TOKEN_CACHE_BACKEND', default='django.core.cache.backends.db.DatabaseCache'),
+        'LOCATION': config('TOKEN_CACHE_LOCATION', default='auth_token_cache'),
+    },
+}
+
+# 게시글/댓글 list, retrieve 응답 캐시 시간(초). 0 이면 캐시하지 않음
+# 기본 캐시가 로컬 메모리인데 워커가 여러 개이면 다른 워커의 무효화가 전달되지 않아 오래된 응답을 보내므로 기본값은 0
+BOARD_CACHE_TIMEOUT = config('BOARD_CACHE_TIMEOUT', default=(
+    0 if GUNICORN_WORKERS > 1 and CACHES['default']['BACKEND'].endswith('.LocMemCache') else 60
+), cast=int)
+
+# 논리적 삭제 후 이 기간(일)이 지난 게시글/댓글은 archive_deleted 명령이 보관 테이블로 옮김
+BOARD_ARCHIVE_RETENTION_DAYS = config('BOARD_ARCHIVE_RETENTION_DAYS', default=90, cast=int)
+
+# 실시간 이벤트(SSE) 전달 방식. local: 프로세스 내 전달, postgresql: LISTEN/NOTIFY 로 모든 워커에 전달
+# 워커가 여러 개이면 다른 워커의 구독자도 이벤트를 받도록 기본값은 postgresql
+BOARD_EVENTS_BACKEND = config('BOARD_EVENTS_BACKEND', default='postgresql' if GUNICORN_WORKERS > 1 else 'local')
+# SSE 연결 유지를 위한 keep-alive 주석 전송 간격(초)
+BOARD_EVENTS_HEARTBEAT = config('BOARD_EVENTS_HEARTBEAT', default=15, cast=int)
+
+# 쿠키 JWT 인증 시 사용자 행 캐시 시간(초). 0 이면 매 요청 DB 에서 조회
+# 사용자 저장/삭제 시의 무효화는 기본 캐시로 전달되므로, 로컬 메모리 캐시에 워커가 여러 개이면 다른 워커에서
+# 비활성화/역할 변경이 반영되지 않음. 이 경우 설정값과 관계없이 캐시하지 않음
+JWT_USER_CACHE_TIMEOUT = 0 if GUNICORN_WORKERS > 1 and CACHES['default']['BACKEND'].endswith('.LocMemCache') else config(
+    'JWT_USER_CACHE_TIMEOUT', default=0, cast=int
+)
+
+# refresh 토큰 블랙리스트 조회 캐시 (authentication/tokens.py). 블랙리스트된 결과는 토큰 만료 시까지 tokens 캐시에 유지
+JWT_BLACKLIST_CACHE_TIMEOUT = config('JWT_BLACKLIST_CACHE_TIMEOUT', default=300, cast=int)  # '블랙리스트 아님' 결과(초)
+JWT_BLACKLIST_LOCAL_TIMEOUT = config('JWT_BLACKLIST_LOCAL_TIMEOUT', default=10, cast=int)   # 워커 메모리의 '블랙리스트됨' 결과(초). 0 이면 사용 안 함
+JWT_BLACKLIST_LOCAL_SIZE = config('JWT_BLACKLIST_LOCAL_SIZE', default=10000, cast=int)
+# 회전된 refresh 토큰이 이 시간(초) 안에 다시 오면 같은 새 토큰 쌍을 반환 (여러 탭의 동시 갱신). 0 이면 사용 안 함
+JWT_REFRESH_GRACE_SECONDS = config('JWT_REFRESH_GRACE_SECONDS', default=10, cast=int)
+# 동시에 도착한 갱신 요청이 먼저 회전 중인 요청의 결과를 기다리는 최대 시간(초)
+JWT_REFRESH_LOCK_TIMEOUT = config('JWT_REFRESH_LOCK_TIMEOUT', default=5, cast=int)
+
+# 구성원 일괄 등록(provision_members, /api/auth/members/bulk/)에서 비밀번호를 해시할 프로세스 수. 0 이면 CPU 수
+MEMBER_PROVISION_WORKERS = config('MEMBER_PROVISION_WORKERS', default=0, cast=int)
+# 일괄 등록 API 한 요청의 최대 구성원 수 (요청 시간 제한 안에 해시를 마치도록). 더 많으면 provision_members 명령 사용
+MEMBER_PROVISION_MAX_ROWS = config('MEMBER_PROVISION_MAX_ROWS', default=500, cast=int)
+
+# 요청 계측. SERVER_TIMING 이면 응답에 Server-Timing 헤더를 포함
+SERVER_TIMING = config('SERVER_TIMING', default=True, cast=bool)
+# /metrics 조회 토큰 (Authorization: Bearer <토큰>). 비어 있으면 /metrics 는 404
+METRICS_TOKEN = config('METRICS_TOKEN', default='')
+# gunicorn 워커별 지표 파일을 쓰는 디렉터리. 비어 있으면 /metrics 는 응답한 워커의 값만 반환
+METRICS_DIR = config('METRICS_DIR', default='')
+# 워커가 지표 파일을 다시 쓰는 최소 간격(초)
+METRICS_FLUSH_INTERVAL = config('METRICS_FLUSH_INTERVAL', default=1.0, cast=float)
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
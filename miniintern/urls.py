@@ -3,6 +3,7 @@ from django.urls import path, include
 from rest_framework import permissions
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
+from authentication.views import metrics_view
 
 schema_view = get_schema_view(
     openapi.Info(  
@@ -21,6 +22,9 @@ urlpatterns = [
     
     path('auth/', include('authentication.template_urls')),
     path('board/', include('boards.template_urls')),
+
+    # Prometheus 지표 (METRICS_TOKEN 필요)
+    path('metrics/', metrics_view, name='metrics'),
     
     # API 문서화
     path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
@@ -9,6 +9,10 @@ pip install -r requirements.txt
 echo "Running migrations..."
 python manage.py migrate
 
+# DatabaseCache 테이블 생성 (refresh 토큰 회전/블랙리스트 캐시 등, 이미 있으면 아무 작업도 하지 않음)
+echo "Creating cache table..."
+python manage.py createcachetable
+
 # Django 서버 실행
 echo "Starting Django development server..."
 python manage.py runserver